@@ -0,0 +1,93 @@
+"""Measure the cold start of refspy: importing it, then creating a manager.
+
+Each run is a new Python process, so nothing is cached in memory (bytecode
+caches on disk are used as normal). A process reports, as seconds:
+
+- `import`: `import refspy`;
+- `generated`: `refspy()`, which loads the data modules in
+  `refspy.generated` (see `python -m refspy.generate`);
+- `dynamic`: a `Manager` of the same canon and locale, which builds its book
+  aliases and reference regexp from the library and language data.
+
+Reports, as JSON, the best and median of `--repeat` processes for each.
+
+Example:
+    ```
+    python benchmarks/cold_start.py --repeat 20 --output cold_start.json
+    ```
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from statistics import median
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+SCRIPT = """
+import json, sys
+from time import perf_counter
+sys.path.insert(0, {root!r})
+started = perf_counter()
+import refspy
+from refspy.init import get_canon, get_language
+from refspy.manager import Manager
+imported = perf_counter()
+if {mode!r} == "generated":
+    refspy.refspy({canon!r}, {locale!r})
+else:
+    Manager(get_canon({canon!r}, {locale!r}), get_language({locale!r}[:2]))
+created = perf_counter()
+print(json.dumps({{"import": imported - started, {mode!r}: created - imported}}))
+"""
+
+
+def run_process(mode: str, canon: str, locale: str) -> dict[str, float]:
+    """The timings of one new process."""
+    script = SCRIPT.format(root=ROOT, mode=mode, canon=canon, locale=locale)
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, check=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--canon", default="protestant")
+    parser.add_argument("--locale", default="en_US")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--output", help="write JSON results to this file")
+    args = parser.parse_args()
+    times: dict[str, list[float]] = {"import": [], "generated": [], "dynamic": []}
+    for _ in range(args.repeat):
+        for mode in ["generated", "dynamic"]:  # <-- interleaved, to share noise
+            for key, seconds in run_process(mode, args.canon, args.locale).items():
+                times[key].append(seconds)
+    output = json.dumps(
+        {
+            "meta": {
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "canon": args.canon,
+                "locale": args.locale,
+                "repeat": args.repeat,
+            },
+            "seconds": {
+                key: {"best": round(min(v), 4), "median": round(median(v), 4)}
+                for key, v in times.items()
+            },
+        },
+        indent=2,
+    )
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Measure refspy memory use with tracemalloc.
+
+Reports, as JSON:
+
+- `managers`: the memory retained by one `Manager` for each canon and locale,
+  in total and for its alias tables and matcher (compiled regexes), after the
+  library data modules have been imported.
+- `references`: the retained size of one `Reference` for a verse, a chapter,
+  and a list of 50 ranges (averaged over many copies).
+- `find_references`: the peak memory while matching a synthetic document of
+  `--document-size` characters, and the memory retained by the result list.
+
+Example:
+    ```
+    python benchmarks/memory.py --document-size 10000000 --output memory.json
+    ```
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import re
+import sys
+import tracemalloc
+from collections.abc import Callable
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from corpus import generate_corpus  # noqa: E402
+from refspy import refspy  # noqa: E402
+from refspy.config import LIBRARIES  # noqa: E402
+from refspy.indexers import index_book_aliases  # noqa: E402
+from refspy.matcher import Matcher  # noqa: E402
+from refspy.models.reference import (  # noqa: E402
+    chapter_reference,
+    reference,
+    verse_reference,
+)
+from refspy.models.range import verse_range  # noqa: E402
+
+
+def retained(function: Callable[[], object]) -> tuple[object, int, int]:
+    """Call a function; return its result, its retained bytes, and peak bytes.
+
+    The result is kept alive while measuring, so retained bytes are the
+    memory it holds (excluding anything it shares with existing objects).
+    """
+    gc.collect()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    result = function()
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current - before, peak - before
+
+
+def measure_managers(canons: list[str], locales: list[str]) -> dict[str, dict]:
+    results = {}
+    for canon in canons:
+        for locale in locales:
+            refspy(canon, locale)  # <-- import the library data modules first
+            re.purge()  # <-- count compiled regexes, not the re module's cache
+            __, total, _ = retained(lambda: refspy(canon, locale))
+            libraries = list(__.libraries.values())
+            _, aliases, _ = retained(lambda: index_book_aliases(libraries))
+            re.purge()
+            _, matcher, _ = retained(
+                lambda: Matcher(__.books, __.book_aliases, __.language, __.syntax)
+            )
+            results[f"{canon}/{locale}"] = {
+                "total_bytes": total,
+                "book_aliases_bytes": aliases,
+                "matcher_bytes": matcher,
+                "aliases": len(__.book_aliases),
+            }
+    return results
+
+
+def measure_references(copies: int = 1000) -> dict[str, int]:
+    factories = {
+        "verse": lambda n: verse_reference(400, 6, 3, 1 + n % 900),
+        "chapter": lambda n: chapter_reference(400, 6, 1 + n % 16),
+        "ranges_50": lambda n: reference(
+            *[verse_range(400, 6, 1 + n % 16, v, v + 1) for v in range(1, 100, 2)]
+        ),
+    }
+    results = {}
+    for name, factory in factories.items():
+        _, size, _ = retained(lambda: [factory(n) for n in range(copies)])
+        results[name + "_bytes"] = round(size / copies)
+    return results
+
+
+def measure_find_references(size: int, seed: int) -> dict[str, int]:
+    __ = refspy()
+    text = generate_corpus(__, size, seed)
+    matches, size_retained, peak = retained(lambda: __.find_references(text))
+    return {
+        "document_chars": len(text),
+        "matches": len(matches),
+        "peak_bytes": peak,
+        "retained_bytes": size_retained,
+        "bytes_per_match": round(size_retained / max(1, len(matches))),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--canons", nargs="+", default=list(LIBRARIES))
+    parser.add_argument("--locales", nargs="+", default=["en_US", "fr_FR"])
+    parser.add_argument(
+        "--document-size", type=int, default=10_000_000, help="document chars"
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="write JSON results to this file")
+    args = parser.parse_args()
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+        },
+        "managers": measure_managers(args.canons, args.locales),
+        "references": measure_references(),
+        "find_references": measure_find_references(args.document_size, args.seed),
+    }
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
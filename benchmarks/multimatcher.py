@@ -0,0 +1,93 @@
+"""Compare a multi-locale matcher with single-locale matchers.
+
+For each locale, a synthetic corpus is generated (see `corpus.py`), then
+matched by the locale's own matcher (`single`), and by a `MultiMatcher` of
+all the locales, both untagged (`multi`, `generate_matches()`) and tagged
+with locales (`multi_tagged`, `generate_locale_matches()`). Reports, as JSON,
+the best time of `--repeat` runs, and each multi-locale time as a ratio of
+the single-locale time; a ratio near 1.0 means one combined scan costs no
+more than a single-locale scan.
+
+Example:
+    ```
+    python benchmarks/multimatcher.py --size 1000000 --output multimatcher.json
+    ```
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+from collections.abc import Callable
+from time import perf_counter
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from corpus import generate_corpus  # noqa: E402
+from refspy import refspy  # noqa: E402
+from refspy.multimatcher import MultiMatcher  # noqa: E402
+
+
+def best_time(function: Callable[[], object], repeat: int) -> float:
+    """The best time of `repeat` calls, in seconds."""
+    times = []
+    for _ in range(repeat):
+        started = perf_counter()
+        function()
+        times.append(perf_counter() - started)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--size", type=int, default=1_000_000, help="corpus chars")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--canon", default="catholic")
+    parser.add_argument("--locales", nargs="+", default=["en_US", "fr_FR"])
+    parser.add_argument("--syntax", default="intl")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write JSON results to this file")
+    args = parser.parse_args()
+    managers = {_: refspy(args.canon, _, args.syntax) for _ in args.locales}
+    multi = MultiMatcher(managers)
+    results = {}
+    for locale, __ in managers.items():
+        text = generate_corpus(__, args.size, args.seed)
+        times = {
+            "single": best_time(
+                lambda: list(__.matcher.generate_matches(text)), args.repeat
+            ),
+            "multi": best_time(lambda: list(multi.generate_matches(text)), args.repeat),
+            "multi_tagged": best_time(
+                lambda: list(multi.generate_locale_matches(text)), args.repeat
+            ),
+        }
+        results[locale] = {
+            "seconds": {k: round(v, 4) for k, v in times.items()},
+            "ratios": {
+                "multi": round(times["multi"] / times["single"], 2),
+                "multi_tagged": round(times["multi_tagged"] / times["single"], 2),
+            },
+        }
+    output = json.dumps(
+        {
+            "meta": {
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "size": args.size,
+                "seed": args.seed,
+            },
+            "locales": results,
+        },
+        indent=2,
+    )
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
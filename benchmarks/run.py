@@ -0,0 +1,217 @@
+"""Benchmark refspy on synthetic corpora, and compare runs for regressions.
+
+For each canon, locale, and syntax, a corpus is generated (see `corpus.py`)
+and the following are timed: Manager construction, matching, formatting,
+sorting, merging, combining, collation, hotspots, and summaries. Each timing
+is the best of `--repeat` runs.
+
+Example:
+    ```
+    python benchmarks/run.py --size 100000 --output before.json
+    # ... make changes ...
+    python benchmarks/run.py --size 100000 --output after.json
+    python benchmarks/run.py compare before.json after.json --threshold 0.1
+    ```
+
+With `--instrument`, a `refspy.instrumentation` snapshot of one matching run
+is added to the output for each corpus, under `"instrumentation"`.
+
+With `--backend regex`, matching uses the third-party regex module (see
+`refspy.backends`), so backends can be compared on the same corpora:
+
+    ```
+    python benchmarks/run.py --backend re --output re.json
+    python benchmarks/run.py --backend regex --output regex.json
+    python benchmarks/run.py compare re.json regex.json
+    ```
+
+The compare mode prints the ratio of each timing, flags timings that are more
+than `--threshold` slower, and exits with status 1 if there are any.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from corpus import generate_corpus  # noqa: E402
+from refspy import refspy  # noqa: E402
+from refspy.backends import BACKENDS  # noqa: E402
+from refspy.config import LIBRARIES, SYNTAX  # noqa: E402
+from refspy.manager import Manager  # noqa: E402
+
+
+def best_of(function: Callable[[], object], repeat: int) -> float:
+    """Return the shortest time of `repeat` calls, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def benchmark_manager(__: Manager, text: str, repeat: int) -> dict[str, dict]:
+    """Time the main Manager operations on one corpus."""
+    references = [ref for _, ref in __.find_references(text) if ref]
+    cases: dict[str, tuple[Callable[[], object], int]] = {
+        "match": (lambda: __.find_references(text), len(text)),
+        "match_all": (
+            lambda: __.find_references(text, include_books=True, include_nones=True),
+            len(text),
+        ),
+        "format_name": (lambda: [__.name(ref) for ref in references], len(references)),
+        "format_abbrev": (
+            lambda: [__.abbrev_name(ref) for ref in references],
+            len(references),
+        ),
+        "sort": (lambda: __.sort(references), len(references)),
+        "merge": (lambda: __.merge_references(references), len(references)),
+        "combine": (lambda: __.combine_references(references), len(references)),
+        "collate_chapter": (
+            lambda: __.collate_chapter_references(references),
+            len(references),
+        ),
+        "collate_verse": (
+            lambda: __.collate_verse_references(references),
+            len(references),
+        ),
+        "hotspots": (lambda: __.make_hotspot_tuples(references), len(references)),
+        "summary": (lambda: __.make_summary(references), len(references)),
+    }
+    results = {}
+    for name, (function, items) in cases.items():
+        seconds = best_of(function, repeat)
+        results[name] = {"seconds": seconds, "items": items}
+    return results
+
+
+def instrumentation_snapshot(__: Manager, text: str) -> dict:
+    """Match a corpus once with an instrumented matcher."""
+    stats = __.matcher.instrument()
+    try:
+        __.find_references(text, include_books=True, include_nones=True)
+        return stats.snapshot()
+    finally:
+        __.matcher.uninstrument()
+
+
+def run(args: argparse.Namespace) -> dict:
+    results = {}
+    instrumentation = {}
+    for canon in args.canons:
+        for locale in args.locales:
+            for syntax in args.syntaxes:
+                label = f"{canon}/{locale}/{syntax}"
+                __ = refspy(canon, locale, syntax, backend_name=args.backend)
+                results[f"construct/{label}"] = {
+                    "seconds": best_of(
+                        lambda: refspy(
+                            canon, locale, syntax, backend_name=args.backend
+                        ),
+                        args.repeat,
+                    ),
+                    "items": 1,
+                }
+                text = generate_corpus(__, args.size, args.seed)
+                for name, result in benchmark_manager(__, text, args.repeat).items():
+                    results[f"{name}/{label}"] = result
+                if args.instrument:
+                    instrumentation[label] = instrumentation_snapshot(__, text)
+                print(f"{label}: done", file=sys.stderr)
+    output = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "size": args.size,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "backend": args.backend,
+        },
+        "results": results,
+    }
+    if instrumentation:
+        output["instrumentation"] = instrumentation
+    return output
+
+
+def compare(before: dict, after: dict, threshold: float) -> list[str]:
+    """Print a comparison table and return the regressed benchmark names."""
+    regressions = []
+    names = [_ for _ in before["results"] if _ in after["results"]]
+    width = max([len(_) for _ in names] + [9])
+    print(f"{'benchmark':<{width}}  {'before':>10}  {'after':>10}  {'ratio':>6}")
+    for name in names:
+        old = before["results"][name]["seconds"]
+        new = after["results"][name]["seconds"]
+        ratio = new / old if old else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            flag = "  improved"
+        print(
+            f"{name:<{width}}  {old * 1000:>8.2f}ms  {new * 1000:>8.2f}ms  "
+            f"{ratio:>6.2f}{flag}"
+        )
+    for key in ["size", "seed", "python"]:
+        if before["meta"].get(key) != after["meta"].get(key):
+            print(f"Warning: runs differ in {key}.", file=sys.stderr)
+    backends = [_["meta"].get("backend", "re") for _ in (before, after)]
+    if backends[0] != backends[1]:
+        print(f"Comparing backends: {backends[0]} -> {backends[1]}.", file=sys.stderr)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    subparsers = parser.add_subparsers(dest="command")
+    parser.add_argument("--size", type=int, default=100_000, help="corpus chars")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--canons", nargs="+", default=list(LIBRARIES))
+    parser.add_argument("--locales", nargs="+", default=["en_US", "fr_FR"])
+    parser.add_argument("--syntaxes", nargs="+", default=list(SYNTAX))
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument(
+        "--backend", choices=list(BACKENDS), default="re", help="regex backend"
+    )
+    parser.add_argument(
+        "--instrument", action="store_true", help="add matcher instrumentation"
+    )
+    compare_parser = subparsers.add_parser("compare", help="compare two runs")
+    compare_parser.add_argument("before")
+    compare_parser.add_argument("after")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.1, help="allowed slowdown (0.1 = 10%%)"
+    )
+    args = parser.parse_args()
+    if args.command == "compare":
+        with open(args.before) as file:
+            before = json.load(file)
+        with open(args.after) as file:
+            after = json.load(file)
+        regressions = compare(before, after, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s).", file=sys.stderr)
+            sys.exit(1)
+        return
+    output = json.dumps(run(args), indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Compare the size and speed of reference serialization formats.
+
+References are found in a synthetic corpus (see `corpus.py`), then encoded
+and decoded in each format. Reports, as JSON, the encoded bytes per reference
+and the best time of `--repeat` runs to encode and decode all of them:
+
+- `pydantic_json`: `model_dump_json()` and `model_validate_json()`.
+- `binary`: `Reference.to_bytes()` and `Reference.from_bytes()`.
+- `binary_stream`: `refspy.binary.write_references()` and `read_references()`.
+
+Then `--matches` `(start, end, match_str, reference)` tuples (the corpus's
+matches, repeated) are encoded as a JSON array, and decoded, with:
+
+- `pydantic_json`: a pydantic `TypeAdapter` of the match tuples.
+- `compact_json`: `refspy.compact_json.encode_matches()` and
+  `decode_matches()`.
+
+Example:
+    ```
+    python benchmarks/serialization.py --size 1000000 --output serialization.json
+    ```
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+from collections.abc import Callable
+from io import BytesIO
+from time import perf_counter
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from corpus import generate_corpus  # noqa: E402
+from refspy import refspy  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from refspy.binary import read_references, write_references  # noqa: E402
+from refspy.compact_json import Match, decode_matches, encode_matches  # noqa: E402
+from refspy.models.reference import Reference  # noqa: E402
+
+
+def best_time(function: Callable[[], object], repeat: int) -> float:
+    """The best time of `repeat` calls, in seconds."""
+    times = []
+    for _ in range(repeat):
+        started = perf_counter()
+        function()
+        times.append(perf_counter() - started)
+    return min(times)
+
+
+def write_stream(references: list[Reference]) -> bytes:
+    stream = BytesIO()
+    write_references(stream, references)
+    return stream.getvalue()
+
+
+def measure(
+    name: str,
+    encode: Callable[[], object],
+    decode: Callable[[object], object],
+    size: Callable[[object], int],
+    count: int,
+    repeat: int,
+) -> dict[str, float]:
+    encoded = encode()
+    decoded = decode(encoded)
+    assert decoded is not None, name
+    return {
+        "bytes_per_item": round(size(encoded) / count, 1),
+        "encode_seconds": round(best_time(encode, repeat), 4),
+        "decode_seconds": round(best_time(lambda: decode(encoded), repeat), 4),
+    }
+
+
+def measure_formats(references: list[Reference], repeat: int) -> dict[str, dict]:
+    count = len(references)
+    return {
+        "pydantic_json": measure(
+            "pydantic_json",
+            lambda: [_.model_dump_json() for _ in references],
+            lambda data: [Reference.model_validate_json(_) for _ in data],
+            lambda data: sum(len(_) for _ in data),
+            count,
+            repeat,
+        ),
+        "binary": measure(
+            "binary",
+            lambda: [_.to_bytes() for _ in references],
+            lambda data: [Reference.from_bytes(_) for _ in data],
+            lambda data: sum(len(_) for _ in data),
+            count,
+            repeat,
+        ),
+        "binary_stream": measure(
+            "binary_stream",
+            lambda: write_stream(references),
+            lambda data: list(read_references(BytesIO(data))),
+            len,
+            count,
+            repeat,
+        ),
+    }
+
+
+def measure_match_formats(matches: list[Match], repeat: int) -> dict[str, dict]:
+    count = len(matches)
+    adapter = TypeAdapter(list[Match])
+    return {
+        "pydantic_json": measure(
+            "pydantic_json",
+            lambda: adapter.dump_json(matches),
+            adapter.validate_json,
+            len,
+            count,
+            repeat,
+        ),
+        "compact_json": measure(
+            "compact_json",
+            lambda: encode_matches(matches),
+            decode_matches,
+            lambda data: len(data.encode()),
+            count,
+            repeat,
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--size", type=int, default=1_000_000, help="corpus chars")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--matches", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write JSON results to this file")
+    args = parser.parse_args()
+    __ = refspy()
+    text = generate_corpus(__, args.size, args.seed)
+    found = __.find_matches(text)
+    references = [ref for _, _, _, ref in found]
+    matches = (found * (args.matches // max(1, len(found)) + 1))[: args.matches]
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "references": len(references),
+        },
+        "formats": measure_formats(references, args.repeat),
+        "match_formats": measure_match_formats(matches, args.repeat),
+    }
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Load generator for `refspy.server`.
+
+Sends concurrent requests over keep-alive connections to a server on
+localhost, then reports throughput and p50/p99 latency.
+
+Example:
+    ```
+    python -m refspy.server --port 8000 &
+    python benchmarks/server_load.py --port 8000 --concurrency 32 --requests 5000
+    python benchmarks/server_load.py --spawn --endpoint summary --text-size 20000
+    ```
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from refspy.languages.english import ENGLISH  # noqa: E402
+
+SHORT_TEXTS = [
+    "Rom 3:21-26",
+    "See 1 Cor 13:4-7 and John 3:16.",
+    "In Romans see 5:4, and cf. vv.6-8.",
+    "Gen 1-2; Ps 119:105; Matt 5:3,7-9",
+    "John Smith wrote nothing of interest.",
+]
+
+
+def make_payload(endpoint: str, text_size: int, rng: random.Random) -> dict:
+    """A request body; `text_size` > 0 repeats the demonstration text."""
+    if endpoint == "format":
+        return {"references": rng.sample(SHORT_TEXTS, 3), "pattern": "{NAME}"}
+    if text_size > 0:
+        text = ENGLISH.demonstration_text
+        text = (text * (text_size // len(text) + 1))[:text_size]
+    else:
+        text = rng.choice(SHORT_TEXTS)
+    return {"text": text}
+
+
+async def worker(
+    host: str,
+    port: int,
+    requests: list[bytes],
+    latencies: list[float],
+    errors: list[int],
+) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    for request in requests:
+        started = time.perf_counter()
+        writer.write(request)
+        await writer.drain()
+        status = int((await reader.readline()).split()[1])
+        length = 0
+        while (line := await reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        await reader.readexactly(length)
+        latencies.append(time.perf_counter() - started)
+        if status != 200:
+            errors.append(status)
+    writer.close()
+
+
+def percentile(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+async def run(args: argparse.Namespace) -> dict:
+    rng = random.Random(args.seed)
+    requests = []
+    for _ in range(args.requests):
+        body = json.dumps(make_payload(args.endpoint, args.text_size, rng)).encode()
+        requests.append(
+            f"POST /{args.endpoint} HTTP/1.1\r\nHost: {args.host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+            + body
+        )
+    latencies: list[float] = []
+    errors: list[int] = []
+    started = time.perf_counter()
+    await asyncio.gather(
+        *[
+            worker(
+                args.host, args.port, requests[n :: args.concurrency], latencies, errors
+            )
+            for n in range(args.concurrency)
+        ]
+    )
+    elapsed = time.perf_counter() - started
+    return {
+        "endpoint": args.endpoint,
+        "requests": len(latencies),
+        "concurrency": args.concurrency,
+        "errors": len(errors),
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+def wait_for_port(host: str, port: int, timeout: float = 30.0) -> None:
+    async def probe():
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                _, writer = await asyncio.open_connection(host, port)
+                writer.close()
+                return
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                await asyncio.sleep(0.1)
+
+    asyncio.run(probe())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--endpoint", default="match", choices=["match", "format", "summary", "index"]
+    )
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument(
+        "--text-size",
+        type=int,
+        default=0,
+        help="characters per request text (0 for short reference strings)",
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--spawn",
+        action="store_true",
+        help="start `python -m refspy.server` on --port for the run",
+    )
+    parser.add_argument(
+        "--server-args", default="", help="extra arguments for a spawned server"
+    )
+    args = parser.parse_args()
+    server = None
+    if args.spawn:
+        server = subprocess.Popen(
+            [sys.executable, "-m", "refspy.server", "--port", str(args.port)]
+            + args.server_args.split(),
+            cwd=os.path.join(os.path.dirname(__file__), ".."),
+            stdout=subprocess.DEVNULL,
+        )
+    try:
+        wait_for_port(args.host, args.port)
+        print(json.dumps(asyncio.run(run(args)), indent=2))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
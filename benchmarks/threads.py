@@ -0,0 +1,126 @@
+"""Measure matching throughput with one Manager shared between threads.
+
+A synthetic corpus (see `corpus.py`) is split into paragraphs, which are
+matched with `find_references()` in a `ThreadPoolExecutor` of 1, 2, 4, ...
+`--max-threads` threads, all sharing one Manager. Results are checked against
+a single-threaded run.
+
+On a standard (GIL) build, throughput should stay roughly flat as threads are
+added; on a free-threaded build (e.g. `python3.13t`) it should scale with the
+number of cores.
+
+Example:
+    ```
+    python benchmarks/threads.py --size 1000000 --max-threads 8
+    python benchmarks/threads.py --interpreters python3.13 python3.13t
+    ```
+
+With `--interpreters`, the benchmark is run under each interpreter that can be
+found, and the results are collected into one JSON object.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from corpus import generate_corpus  # noqa: E402
+from refspy import refspy  # noqa: E402
+
+
+def thread_counts(max_threads: int) -> list[int]:
+    """1, 2, 4, ... up to and including `max_threads`."""
+    counts = [1]
+    while counts[-1] * 2 < max_threads:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_threads:
+        counts.append(max_threads)
+    return counts
+
+
+def run(args: argparse.Namespace) -> dict:
+    __ = refspy(args.canon, args.locale)
+    text = generate_corpus(__, args.size, args.seed)
+    paragraphs = text.split("\n\n")
+    expected = [__.find_references(_) for _ in paragraphs]
+    results = {}
+    for threads in thread_counts(args.max_threads):
+        timings = []
+        for _ in range(args.repeat):
+            with ThreadPoolExecutor(threads) as executor:
+                started = time.perf_counter()
+                matches = list(executor.map(__.find_references, paragraphs))
+                timings.append(time.perf_counter() - started)
+            if matches != expected:
+                raise AssertionError(f"Results differ with {threads} threads.")
+        seconds = min(timings)
+        results[threads] = {
+            "seconds": seconds,
+            "chars_per_second": round(len(text) / seconds),
+        }
+    for result in results.values():
+        result["speedup"] = round(results[1]["seconds"] / result["seconds"], 2)
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "executable": sys.executable,
+            "gil_enabled": is_gil_enabled(),
+            "cpus": os.cpu_count(),
+            "size": args.size,
+            "paragraphs": len(paragraphs),
+        },
+        "threads": results,
+    }
+
+
+def run_interpreters(args: argparse.Namespace) -> dict:
+    """Run this script under each interpreter that can be found."""
+    argv = [
+        *["--size", str(args.size), "--seed", str(args.seed)],
+        *["--repeat", str(args.repeat), "--max-threads", str(args.max_threads)],
+        *["--canon", args.canon, "--locale", args.locale],
+    ]
+    results = {}
+    for name in args.interpreters:
+        executable = shutil.which(name)
+        if executable is None:
+            print(f"{name}: not found, skipped", file=sys.stderr)
+            continue
+        output = subprocess.run(
+            [executable, __file__, *argv], capture_output=True, text=True
+        )
+        if output.returncode:
+            print(f"{name}: failed\n{output.stderr}", file=sys.stderr)
+            continue
+        results[name] = json.loads(output.stdout)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--size", type=int, default=500_000, help="corpus chars")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--canon", default="protestant")
+    parser.add_argument("--locale", default="en_US")
+    parser.add_argument("--max-threads", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--interpreters", nargs="+", help="run under each of these Pythons"
+    )
+    args = parser.parse_args()
+    if args.interpreters:
+        print(json.dumps(run_interpreters(args), indent=2))
+    else:
+        print(json.dumps(run(args), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ See the [README.md](https://github.com/eukras/refspy) for a more accessible
 introduction.
 """
 
-from refspy.init import get_canon, get_language, get_syntax
+from refspy.init import create_manager
 from refspy.manager import Manager
 
 
@@ -13,6 +13,7 @@ def refspy(
     locale_name: str = "en_US",
     syntax_name: str | None = None,
     include_two_letter_aliases: bool = True,
+    backend_name: str | None = None,
 ) -> Manager:
     """Create a Manager object to access all common package functions.
 
@@ -30,6 +31,9 @@ def refspy(
             - `intl`
             - `euro`
         include_two_letter_aliases: e.g. 'Ge', '1 Jn'.
+        backend_name: A valid key for the `refspy.backends.BACKENDS` dict.
+            - `re` (default)
+            - `regex` (if the regex module is installed)
 
     Note:
         Libraries and languages can be created outside the package, and
@@ -41,9 +45,6 @@ def refspy(
     To Do:
         Load languages and libraries only on demand when there are more of them.
     """
-    return Manager(
-        get_canon(canon_name, locale_name),
-        get_language(locale_name[:2]),
-        get_syntax(syntax_name) if syntax_name is not None else None,
-        include_two_letter_aliases=include_two_letter_aliases,
+    return create_manager(
+        canon_name, locale_name, syntax_name, include_two_letter_aliases, backend_name
     )
@@ -0,0 +1,6 @@
+"""Run the command-line indexer; see `refspy.cli`."""
+
+from refspy.cli import main
+
+if __name__ == "__main__":
+    main()
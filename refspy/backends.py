@@ -0,0 +1,110 @@
+"""Regular expression backends for `refspy.matcher.Matcher`.
+
+A backend compiles the matcher's patterns and runs its scans of texts. The
+default is the standard library's `re` module (`RegexBackend`); the
+third-party [regex](https://pypi.org/project/regex/) module can be used
+instead, if it is installed, with `RegexModuleBackend`, which can also limit
+the time of each scan of a text. The regex module is not a dependency of
+refspy.
+
+Example:
+    ```
+    __ = refspy(backend_name="regex")
+    __ = Manager(libraries, language, backend=RegexModuleBackend(timeout=1.0))
+    ```
+
+Both backends match the same references: the matcher's patterns only use
+syntax that the two modules share.
+"""
+
+import re
+from collections.abc import Iterator
+from importlib.util import find_spec
+from typing import Any
+
+DEFAULT_BACKEND_NAME = "re"
+"""The name of the backend used when none is given (see `get_backend()`)."""
+
+
+class RegexBackend:
+    """The standard library's `re` module, the default backend.
+
+    Subclasses can use another regexp module whose compiled patterns have the
+    methods of `re.Pattern` (`finditer()`, `findall()`), and whose matches
+    have those of `re.Match`.
+    """
+
+    name = "re"
+
+    def compile(self, pattern: str) -> Any:
+        """Compile a pattern."""
+        return re.compile(pattern)
+
+    def finditer(
+        self, compiled: Any, text: str, pos: int = 0, endpos: int | None = None
+    ) -> Iterator[Any]:
+        """Scan a text (or `text[pos:endpos]`) for matches of a compiled
+        pattern, as for `re.Pattern.finditer()`."""
+        return compiled.finditer(text, pos, len(text) if endpos is None else endpos)
+
+
+class RegexModuleBackend(RegexBackend):
+    """The third-party `regex` module.
+
+    Args:
+        timeout: The maximum time in seconds of each scan of a text, or None
+            for no limit. A scan that takes longer raises `TimeoutError`,
+            e.g. to bound the time spent on hostile input in a service. Only
+            the scans (`finditer()`) are limited: the matcher's other
+            patterns only split up the text of a match that a scan found.
+
+    Raises:
+        ImportError: If the regex module is not installed.
+    """
+
+    name = "regex"
+
+    def __init__(self, timeout: float | None = None):
+        import regex  # noqa: F401 <-- optional; not a dependency of refspy
+
+        self.timeout = timeout
+
+    def compile(self, pattern: str) -> Any:
+        import regex
+
+        return regex.compile(pattern, regex.VERSION0)
+
+    def finditer(
+        self, compiled: Any, text: str, pos: int = 0, endpos: int | None = None
+    ) -> Iterator[Any]:
+        return compiled.finditer(
+            text,
+            pos,
+            len(text) if endpos is None else endpos,
+            timeout=self.timeout,
+        )
+
+
+BACKENDS: dict[str, type[RegexBackend]] = {
+    "re": RegexBackend,
+    "regex": RegexModuleBackend,
+}
+"""The backend classes by name."""
+
+
+def available_backends() -> list[str]:
+    """The names of the backends whose modules are installed."""
+    return [_ for _ in BACKENDS if _ == "re" or find_spec(_) is not None]
+
+
+def get_backend(backend_name: str | None = None) -> RegexBackend:
+    """Create a backend by name (default: `DEFAULT_BACKEND_NAME`).
+
+    Raises:
+        ValueError: If the name is not found.
+        ImportError: If the backend's module is not installed.
+    """
+    backend_name = backend_name or DEFAULT_BACKEND_NAME
+    if backend_name in BACKENDS:
+        return BACKENDS[backend_name]()
+    raise ValueError(f"Regex backend '{backend_name}' not found.")
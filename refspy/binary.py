@@ -0,0 +1,78 @@
+"""Write and read streams of references in a compact binary format.
+
+A stream is a header (`STREAM_HEADER`), then each reference (or None) in
+the form of `refspy.models.reference.encode_reference()`: a varint count of
+ranges, then varint deltas of their verse indexes. Each reference is
+self-delimiting, so a stream can be read incrementally from a file or socket,
+and streams can be appended to by writing more references without a header.
+
+Example:
+    ```
+    with open("refs.bin", "wb") as file:
+        write_references(file, refs)
+    with open("refs.bin", "rb") as file:
+        assert list(read_references(file)) == refs
+    ```
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO
+
+from refspy.models.reference import Reference, decode_reference, encode_reference
+
+STREAM_HEADER = b"RFSPY\x00\x01\n"
+"""The first bytes of a reference stream: a magic string and version 1."""
+
+STREAM_BUFFER_SIZE = 1 << 16
+"""The number of bytes buffered when writing, and read at a time."""
+
+
+def write_references(
+    stream: BinaryIO, references: Iterable[Reference | None], header: bool = True
+) -> int:
+    """Write references (and Nones) to a binary stream.
+
+    Args:
+        header: Whether to start with `STREAM_HEADER`; omit it to append to
+            an existing stream.
+
+    Return:
+        The number of references written.
+    """
+    out = bytearray(STREAM_HEADER if header else b"")
+    count = 0
+    for ref in references:
+        encode_reference(ref, out)
+        count += 1
+        if len(out) >= STREAM_BUFFER_SIZE:
+            stream.write(out)
+            out.clear()
+    stream.write(out)
+    return count
+
+
+def read_references(stream: BinaryIO) -> Iterator[Reference | None]:
+    """Yield the references (and Nones) from a binary stream written by
+    `write_references()`, reading up to `STREAM_BUFFER_SIZE` bytes at a time
+    (with `read1()` if the stream has it, so sockets yield what has arrived).
+
+    Raises:
+        ValueError: If the stream has no header, or ends within a reference.
+    """
+    data = stream.read(len(STREAM_HEADER))
+    if data != STREAM_HEADER:
+        raise ValueError("Not a reference stream.")
+    read = getattr(stream, "read1", stream.read)
+    data, pos = b"", 0
+    while chunk := read(STREAM_BUFFER_SIZE):
+        data = data[pos:] + chunk
+        pos = 0
+        while pos < len(data):
+            try:
+                ref, end = decode_reference(data, pos)
+            except IndexError:
+                break  # <-- the rest of this reference is in the next chunk
+            pos = end
+            yield ref
+    if pos < len(data):
+        raise ValueError("Truncated reference stream.")
@@ -0,0 +1,208 @@
+"""A streaming command-line indexer with JSON Lines output.
+
+Run with `python -m refspy`. Files, directories (searched recursively), or
+stdin (`-`, or no paths) are read, and one JSON object per line is written to
+stdout for each match, or for each document with `--output document`.
+
+Example:
+    ```
+    python -m refspy sermons/ --glob '*.txt' --summary --workers 4 > refs.jsonl
+    echo 'See Rom 3:21-26.' | python -m refspy --locale en_US
+    ```
+
+Each match line looks like:
+
+    ```
+    {"type": "match", "path": "-", "start": 4, "end": 15, "match": "Rom 3:21-26",
+     "ranges": [[400006003021, 400006003026]], "name": "Romans 3:21–26",
+     "abbrev_name": "Rom 3:21–26"}
+    ```
+
+Document lines (`"type": "document"`) follow the matches for each document in
+match mode, or contain them as a `"matches"` list in document mode, and carry
+the optional `"index"`, `"summary"`, and `"hotspots"` values.
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from fnmatch import fnmatch
+from functools import partial
+from typing import Any
+
+from refspy.compact_json import reference_ranges
+from refspy.init import get_manager
+from refspy.manager import Manager
+from refspy.models.reference import Reference
+
+STDIN = "-"
+"""The path name used for standard input."""
+
+
+def iter_paths(paths: list[str], pattern: str = "*") -> Iterator[str]:
+    """Yield file paths in order, walking directories in sorted order.
+
+    Args:
+        pattern: A `fnmatch` pattern for file names found in directories.
+    """
+    for path in paths or [STDIN]:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if fnmatch(name, pattern):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def match_record(
+    __: Manager, path: str, start: int, end: int, match_str: str, ref: Reference | None
+) -> dict[str, Any]:
+    """Describe one match for JSON output."""
+    return {
+        "type": "match",
+        "path": path,
+        "start": start,
+        "end": end,
+        "match": match_str,
+        "ranges": reference_ranges(ref),
+        "name": __.name(ref) if ref else None,
+        "abbrev_name": __.abbrev_name(ref) if ref else None,
+    }
+
+
+def document_lines(path: str, text: str, options: dict[str, Any]) -> list[str]:
+    """Match one document and return its JSON lines.
+
+    Args:
+        options: The `vars()` of the parsed command-line arguments.
+    """
+    __ = get_manager(options["canon"], options["locale"], options["syntax"])
+    matches = __.find_matches(text, options["include_books"], options["include_nones"])
+    records = [match_record(__, path, *match) for match in matches]
+    document: dict[str, Any] = {"type": "document", "path": path}
+    if options["output"] == "document":
+        document["matches"] = records
+    else:
+        document["count"] = len(records)
+    references = [ref for _, _, _, ref in matches if ref and not ref.is_book()]
+    if options["index"]:
+        document["index"] = __.make_index(references)
+    if options["summary"]:
+        document["summary"] = __.make_summary(references)
+    if options["hotspots"]:
+        document["hotspots"] = [
+            {"name": __.abbrev_name(ref), "count": count}
+            for ref, count in __.make_hotspot_tuples(references)
+        ]
+    lines = [] if options["output"] == "document" else records
+    if options["output"] == "document" or has_document_fields(options):
+        lines = lines + [document]
+    return [json.dumps(_, ensure_ascii=False) for _ in lines]
+
+
+def has_document_fields(options: dict[str, Any]) -> bool:
+    return options["index"] or options["summary"] or options["hotspots"]
+
+
+def read_text(path: str, encoding: str) -> str:
+    if path == STDIN:
+        return sys.stdin.read()
+    with open(path, encoding=encoding, errors="replace") as file:
+        return file.read()
+
+
+def path_lines(path: str, options: dict[str, Any]) -> list[str]:
+    """Read and match one path; this runs in worker processes."""
+    return document_lines(path, read_text(path, options["encoding"]), options)
+
+
+def ordered_map(
+    executor: Executor | None,
+    function: Callable[[Any], Any],
+    items: Iterable[Any],
+    window: int,
+) -> Iterator[Any]:
+    """Map items in an executor, yielding results in order.
+
+    At most `window` items are in progress at once, which bounds memory use
+    however many items there are.
+    """
+    if executor is None:
+        yield from map(function, items)
+        return
+    pending: deque = deque()
+    for item in items:
+        pending.append(executor.submit(function, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def run(options: dict[str, Any], out=None) -> None:
+    """Write JSON lines for every path in `options["paths"]` to `out`."""
+    out = out or sys.stdout
+    paths = iter_paths(options["paths"], options["glob"])
+    function = partial(path_lines, options=options)
+    workers = options["workers"]
+    if workers > 1:
+        if STDIN in (options["paths"] or [STDIN]):
+            raise ValueError("Standard input cannot be read with --workers.")
+        with ProcessPoolExecutor(workers) as executor:
+            _write(out, ordered_map(executor, function, paths, 2 * workers))
+    else:
+        _write(out, ordered_map(None, function, paths, 1))
+
+
+def _write(out, results: Iterator[list[str]]) -> None:
+    for lines in results:
+        for line in lines:
+            out.write(line + "\n")
+        out.flush()
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m refspy", description=__doc__.split("\n")[0]
+    )
+    parser.add_argument(
+        "paths", nargs="*", help="files or directories to read ('-' for stdin)"
+    )
+    parser.add_argument("--canon", default="protestant")
+    parser.add_argument("--locale", default="en_US")
+    parser.add_argument("--syntax", default=None)
+    parser.add_argument(
+        "--output",
+        choices=["match", "document"],
+        default="match",
+        help="write one line per match, or one per document",
+    )
+    parser.add_argument(
+        "--glob", default="*", help="file name pattern within directories"
+    )
+    parser.add_argument("--encoding", default="utf-8")
+    parser.add_argument("--include-books", action="store_true")
+    parser.add_argument("--include-nones", action="store_true")
+    parser.add_argument("--index", action="store_true", help="add document index")
+    parser.add_argument("--summary", action="store_true", help="add document summary")
+    parser.add_argument("--hotspots", action="store_true", help="add document hotspots")
+    parser.add_argument(
+        "--workers", type=int, default=1, help="number of worker processes"
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    options = vars(make_parser().parse_args(argv))
+    try:
+        run(options)
+    except BrokenPipeError:
+        sys.stderr.close()
+    except (OSError, ValueError) as error:
+        sys.exit(f"refspy: {error}")
@@ -0,0 +1,127 @@
+"""Collate references by library, book, chapter, and verse ranges.
+
+A collation sorts single-book references once by integer keys, then groups
+them lazily with `itertools.groupby`. Each level of the collation is a
+generator of `(key, group)` tuples, so nothing is built until it is iterated;
+the innermost groups are lists of references.
+
+Example:
+    ```
+    for library_id, books in generate_collation(refs, "chapter"):
+        for book_id, chapters in books:
+            for chapter_id, references in chapters:
+                # ...
+    ```
+
+Note:
+    Like `itertools.groupby`, an inner group must be consumed before the
+    outer generator is advanced. Use `collation_list()` or `collation_dict()`
+    to materialise a collation that will be revisited.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from itertools import chain, groupby
+from typing import Any
+
+from refspy.models.reference import Reference
+
+CollationKey = tuple
+"""A tuple (or prefix) of `(library.id, book.id, chapter, ((start, end), ...))`,
+where the final element holds the `refspy.models.verse.Verse.index()` values
+of each range."""
+
+COLLATION_DEPTHS: dict[str, int] = {"book": 2, "chapter": 3, "verse": 4}
+"""The length of the key prefix that groups each level of collation."""
+
+
+def is_single_book(ref: Reference) -> bool:
+    """Determine whether every range of a reference is within one book.
+
+    Equivalent to `ref.count_books() == 1`, without building a set.
+    """
+    v1 = ref.ranges[0].start
+    return all(
+        _.start.library == v1.library
+        and _.start.book == v1.book
+        and _.end.library == v1.library
+        and _.end.book == v1.book
+        for _ in ref.ranges
+    )
+
+
+def collation_key(ref: Reference) -> CollationKey:
+    """Make an integer sort key for a single-book reference.
+
+    Sorting by this key orders references by their ranges, in turn, since
+    `refspy.models.verse.Verse.index()` preserves verse order. Where one
+    reference's ranges begin with all of another's, the shorter one comes
+    first (e.g. `Rom 3:10` before `Rom 3:10, 15-18`); `Reference.__lt__()`
+    treats them as equal, so sorting references keeps their input order.
+    """
+    v1 = ref.ranges[0].start
+    return (
+        v1.library,
+        v1.book,
+        v1.chapter,
+        tuple((_.start.index(), _.end.index()) for _ in ref.ranges),
+    )
+
+
+def generate_collation(
+    references: Iterable[Reference],
+    depth: str = "book",
+    resolve: Callable[[CollationKey, Reference], Any] | None = None,
+) -> Iterator[tuple[Any, Any]]:
+    """Sort references once and group them lazily by library, book, etc.
+
+    Multi-book references are ignored. References are sorted within each
+    group, so there is no need to sort them beforehand.
+
+    Args:
+        references: The references to collate.
+        depth: One of 'book', 'chapter', or 'verse'.
+        resolve: Turn the key prefix for a group (and its first reference)
+            into the value yielded for that group; by default the last
+            element of the key prefix is yielded.
+
+    Raises:
+        ValueError: If depth is not a key of `COLLATION_DEPTHS`.
+    """
+    if depth not in COLLATION_DEPTHS:
+        raise ValueError(f"Collation depth '{depth}' not found.")
+    keyed = sorted(
+        [(collation_key(ref), ref) for ref in references if is_single_book(ref)],
+        key=lambda item: item[0],
+    )
+    return _nest(keyed, 1, COLLATION_DEPTHS[depth], resolve)
+
+
+def _nest(
+    items: Iterable[tuple[CollationKey, Reference]],
+    level: int,
+    size: int,
+    resolve: Callable[[CollationKey, Reference], Any] | None,
+) -> Iterator[tuple[Any, Any]]:
+    for key, group in groupby(items, key=lambda item: item[0][:level]):
+        first = next(group)
+        label = resolve(key, first[1]) if resolve else key[-1]
+        if level < size:
+            yield label, _nest(chain([first], group), level + 1, size, resolve)
+        else:
+            yield label, [first[1]] + [ref for _, ref in group]
+
+
+def collation_list(collation: Iterator[tuple[Any, Any]]) -> list[tuple[Any, Any]]:
+    """Materialise a collation as nested lists of `(key, group)` tuples."""
+    return [
+        (key, group if isinstance(group, list) else collation_list(group))
+        for key, group in collation
+    ]
+
+
+def collation_dict(collation: Iterator[tuple[Any, Any]]) -> dict[Any, Any]:
+    """Materialise a collation as nested dicts of `{key: group}`."""
+    return {
+        key: group if isinstance(group, list) else collation_dict(group)
+        for key, group in collation
+    }
@@ -0,0 +1,336 @@
+"""Columnar results for bulk parsing and matching, without a Reference per row.
+
+Importing a column of reference strings (e.g. from CSV or a database) with
+`__.r()` builds a `Reference` for each row. `parse_strings()` instead parses
+each distinct string once, and returns flat `array` columns of
+`refspy.models.verse.Verse.index()` integers, with one row per range.
+
+Example:
+    ```
+    parsed = __.parse_many(["Rom 3:21-26", "Nothing", "Rom 1:1, 3"])
+    assert list(parsed.inputs) == [0, 1, 2, 2]
+    assert list(parsed.failed) == [0, 1, 0, 0]
+    ```
+
+Likewise, `match_columns()` collects the matches of many texts into columns
+(`MatchColumns`), for corpus analytics with vectorized tools; these are plain
+`array` columns, which `MatchColumns.to_numpy()` turns into a NumPy structured
+array if NumPy is installed. NumPy is not a dependency of refspy.
+
+Example:
+    ```
+    columns = __.find_references_columnar(texts)
+    table = columns.to_numpy()
+    romans = table[table["range_start_index"] // 1_000_000 == 400006]
+    ```
+
+Both match with a copy of the matcher whose `IndexBuilder` makes plain named
+tuples of verse numbers instead of pydantic models, checked as the models
+check them, so no `Reference`, `Range` or `Verse` is made at all.
+"""
+
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from copy import copy
+from typing import TYPE_CHECKING, Any, NamedTuple
+from functools import partial
+
+from refspy.matcher import Matcher
+from refspy.types.index import Index
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+FLAG_BOOK = 1
+"""`MatchColumns.flags` bit for a book name without numbers, e.g. `Romans`."""
+
+FLAG_NONE = 2
+"""`MatchColumns.flags` bit for a match with no valid reference."""
+
+FLAG_CHAPTERS = 4
+"""`MatchColumns.flags` bit for a range of whole chapters, e.g. `Rom 3-4`."""
+
+PARSE_CHUNK_SIZE = 10_000
+"""The default number of distinct strings in each chunk sent to an executor
+by `parse_strings()`."""
+
+
+class IndexVerse(NamedTuple):
+    """A verse as a tuple, with the attributes of `refspy.models.verse.Verse`."""
+
+    library: int
+    book: int
+    chapter: int
+    verse: int
+
+    def index(self) -> Index:
+        """As `refspy.models.verse.Verse.index()`."""
+        return ((self.library * 1000 + self.book) * 1000 + self.chapter) * 1000 + (
+            self.verse
+        )
+
+
+class IndexRange(NamedTuple):
+    """A range as a tuple, with the attributes (and the methods used in
+    matching) of `refspy.models.range.Range`."""
+
+    start: IndexVerse
+    end: IndexVerse
+
+    def is_same_library(self) -> bool:
+        return self.start.library == self.end.library
+
+    def is_same_book(self) -> bool:
+        return self.is_same_library() and self.start.book == self.end.book
+
+    def is_same_chapter(self) -> bool:
+        return self.is_same_book() and self.start.chapter == self.end.chapter
+
+
+class IndexReference(NamedTuple):
+    """A reference as a tuple of ranges."""
+
+    ranges: tuple[IndexRange, ...]
+
+
+class IndexBuilder:
+    """
+    Build matched references as named tuples, for a `Matcher.builder`.
+
+    Numbers and verse order are checked as the pydantic models check them, so
+    the matches are the same as with `refspy.matcher.ModelBuilder`.
+    """
+
+    @staticmethod
+    def verse(library: int, book: int, chapter: int, verse: int) -> IndexVerse:
+        """
+        Raises:
+            ValueError: If a number is not in the range 1 to 999.
+        """
+        if (
+            0 < library < 1000
+            and 0 < book < 1000
+            and 0 < chapter < 1000
+            and 0 < verse < 1000
+        ):
+            return IndexVerse(library, book, chapter, verse)
+        raise ValueError(f"Verse out of range: {(library, book, chapter, verse)}")
+
+    @staticmethod
+    def range(start: IndexVerse, end: IndexVerse) -> IndexRange:
+        """
+        Raises:
+            ValueError: If the start verse is greater than the end verse.
+        """
+        if end < start:
+            raise ValueError(f"Range out of order: {start}, {end}")
+        return IndexRange(start, end)
+
+    @staticmethod
+    def reference(*ranges: IndexRange) -> IndexReference:
+        return IndexReference(ranges)
+
+
+def index_matcher(matcher: Matcher) -> Matcher:
+    """A copy of a matcher that builds references with `IndexBuilder`."""
+    indexed = copy(matcher)
+    indexed.builder = IndexBuilder
+    return indexed
+
+
+class ParsedReferences:
+    """
+    Parsed references as columns, with one row per range.
+
+    Each input has at least one row: one per range of its reference, or, if
+    no reference was parsed, a single row flagged as `failed`, with zero
+    start and end.
+    """
+
+    def __init__(self) -> None:
+        self.inputs = array("L")
+        """The position of each row's string in the input."""
+        self.starts = array("Q")
+        """The `Verse.index()` of the start of each row's range."""
+        self.ends = array("Q")
+        """The `Verse.index()` of the end of each row's range."""
+        self.failed = array("B")
+        """1 for rows of strings that had no reference, else 0."""
+
+    def __len__(self) -> int:
+        return len(self.inputs)
+
+    def rows(self) -> Iterator[tuple[int, Index, Index, int]]:
+        """Yield an `(input, start, end, failed)` tuple for each row."""
+        return zip(self.inputs, self.starts, self.ends, self.failed)
+
+
+def parse_chunk(matcher: Matcher, strings: list[str]) -> list[tuple[Index, ...]]:
+    """The range indexes `(start, end, start, end...)` of the first reference
+    in each string, as parsed by `refspy.manager.Manager.r()`, or `()` if
+    there is none.
+
+    This is a module function so that it can be sent to a process pool.
+    """
+    matcher = index_matcher(matcher)
+    results = []
+    for text in strings:
+        _, ref = next(matcher.generate_references(text), (None, None))
+        if ref is None:
+            results.append(())
+        else:
+            results.append(
+                tuple(n for _ in ref.ranges for n in (_.start.index(), _.end.index()))
+            )
+    return results
+
+
+def parse_strings(
+    matcher: Matcher,
+    strings: Iterable[str],
+    executor: "Executor | None" = None,
+    chunk_size: int = PARSE_CHUNK_SIZE,
+) -> ParsedReferences:
+    """Parse the first reference of each string into columns.
+
+    Identical strings are parsed once. With an executor, the distinct strings
+    are parsed in chunks of `chunk_size`; the results are the same.
+    """
+    strings = list(strings)
+    distinct = list(dict.fromkeys(strings))
+    function: Callable = partial(parse_chunk, matcher)
+    chunks = [distinct[n : n + chunk_size] for n in range(0, len(distinct), chunk_size)]
+    if executor is None or len(chunks) <= 1:
+        results = map(function, chunks)
+    else:
+        results = executor.map(function, chunks)
+    indexes = dict(zip(distinct, (_ for chunk in results for _ in chunk)))
+
+    parsed = ParsedReferences()
+    inputs, starts, ends = parsed.inputs, parsed.starts, parsed.ends
+    failed = parsed.failed
+    for row, text in enumerate(strings):
+        pairs = indexes[text]
+        if not pairs:
+            inputs.append(row)
+            starts.append(0)
+            ends.append(0)
+            failed.append(1)
+            continue
+        count = len(pairs) // 2
+        inputs.extend([row] * count)
+        starts.extend(pairs[0::2])
+        ends.extend(pairs[1::2])
+        failed.extend([0] * count)
+    return parsed
+
+
+class MatchColumns:
+    """
+    The matches of a list of texts as columns, with one row per range.
+
+    Each match has one row per range of its reference; a match without a
+    reference (with `include_nones`) has a single row, flagged `FLAG_NONE`,
+    with zero indexes.
+    """
+
+    COLUMNS = (
+        "doc_id",
+        "match_start",
+        "match_end",
+        "range_start_index",
+        "range_end_index",
+        "flags",
+    )
+    """The column names, in order."""
+
+    def __init__(self) -> None:
+        self.doc_id = array("L")
+        """The position of each row's text in the input."""
+        self.match_start = array("L")
+        """The offset of each row's match in its text."""
+        self.match_end = array("L")
+        """The offset of the end of each row's match in its text."""
+        self.range_start_index = array("Q")
+        """The `Verse.index()` of the start of each row's range."""
+        self.range_end_index = array("Q")
+        """The `Verse.index()` of the end of each row's range."""
+        self.flags = array("B")
+        """`FLAG_BOOK`, `FLAG_NONE` and `FLAG_CHAPTERS` bits for each row."""
+
+    def __len__(self) -> int:
+        return len(self.doc_id)
+
+    def rows(self) -> Iterator[tuple[int, int, int, int, int, int]]:
+        """Yield a tuple of the `COLUMNS` for each row."""
+        return zip(*[getattr(self, _) for _ in self.COLUMNS])
+
+    def to_numpy(self) -> Any:
+        """A NumPy structured array of the columns, with fields named as in
+        `COLUMNS`.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        import numpy  # <-- optional; not a dependency of refspy
+
+        columns = [getattr(self, _) for _ in self.COLUMNS]
+        dtype = numpy.dtype(
+            [(name, column.typecode) for name, column in zip(self.COLUMNS, columns)]
+        )
+        table = numpy.empty(len(self), dtype)
+        for name, column in zip(self.COLUMNS, columns):
+            table[name] = numpy.frombuffer(column, column.typecode)
+        return table
+
+
+def match_columns(
+    matcher: Matcher,
+    texts: Iterable[str],
+    include_books: bool = False,
+    include_nones: bool = False,
+    use_context: bool = True,
+) -> MatchColumns:
+    """Match each text, and collect its matches' ranges into columns.
+
+    Matches are built as `IndexBuilder` tuples, not pydantic models, and
+    their verse indexes are added to the columns as they are found; no lists
+    of matches are made.
+    """
+    matcher = index_matcher(matcher)
+    columns = MatchColumns()
+    doc_ids, match_starts = columns.doc_id, columns.match_start
+    match_ends, starts = columns.match_end, columns.range_start_index
+    ends, flags = columns.range_end_index, columns.flags
+    for doc_id, text in enumerate(texts):
+        for start, end, _, ref in matcher.generate_matches(
+            text, include_books, include_nones, use_context
+        ):
+            if ref is None:
+                doc_ids.append(doc_id)
+                match_starts.append(start)
+                match_ends.append(end)
+                starts.append(0)
+                ends.append(0)
+                flags.append(FLAG_NONE)
+                continue
+            for range_ in ref.ranges:
+                first, last = range_.start, range_.end
+                doc_ids.append(doc_id)
+                match_starts.append(start)
+                match_ends.append(end)
+                starts.append(
+                    ((first.library * 1000 + first.book) * 1000 + first.chapter) * 1000
+                    + first.verse
+                )
+                ends.append(
+                    ((last.library * 1000 + last.book) * 1000 + last.chapter) * 1000
+                    + last.verse
+                )
+                if first.verse != 1 or last.verse != 999:
+                    flags.append(0)
+                elif first.chapter == 1 and last.chapter == 999:
+                    flags.append(FLAG_BOOK)
+                else:
+                    flags.append(FLAG_CHAPTERS)
+    return columns
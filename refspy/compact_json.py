@@ -0,0 +1,133 @@
+"""A compact JSON form of references and matches, and JSON Lines batches.
+
+Pydantic's JSON of a reference spells out every verse as an object, about 130
+bytes for one verse. The compact form is plain JSON arrays of
+`refspy.models.verse.Verse.index()` integers, built and parsed by the
+standard `json` module:
+
+- A reference is a list of `[start_index, end_index]` pairs, one per range:
+  `[[400006003021, 400006003026]]` for Rom 3:21-26. None is `null`.
+- A match `(start, end, match_str, reference)` is a four-item list:
+  `[4, 15, "Rom 3:21-26", [[400006003021, 400006003026]]]`.
+
+These are the `"ranges"` values of the command-line and HTTP outputs (see
+`refspy.cli` and `refspy.server`). In JavaScript, a verse index can be
+unpacked with integer division: `Math.floor(index / 1000) % 1000` is the
+chapter, and `index % 1000` the verse.
+
+A JSON Lines batch file has one line per document: the compact list of its
+matches (see `write_matches_jsonl()`).
+
+Example:
+    ```
+    data = encode_matches(__.find_matches(text))
+    assert decode_matches(data) == __.find_matches(text)
+    ```
+"""
+
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any, TextIO
+
+from refspy.models.range import Range
+from refspy.models.reference import Reference
+from refspy.models.verse import Verse
+
+Match = tuple[int, int, str, Reference | None]
+"""A `(start, end, match_str, reference)` tuple, as from `find_matches()`."""
+
+SEPARATORS = (",", ":")
+"""JSON separators without spaces."""
+
+
+def reference_ranges(ref: Reference | None) -> list[list[int]] | None:
+    """The compact form of a reference: `[[start_index, end_index], ...]`."""
+    if ref is None:
+        return None
+    return [[_.start.index(), _.end.index()] for _ in ref.ranges]
+
+
+def ranges_reference(ranges: list[list[int]] | None) -> Reference | None:
+    """The reference of a compact form from `reference_ranges()`.
+
+    Raises:
+        ValueError: If the ranges are not valid verse indexes.
+    """
+    if ranges is None:
+        return None
+    try:
+        return Reference(
+            ranges=[
+                Range(start=Verse.from_index(start), end=Verse.from_index(end))
+                for start, end in ranges
+            ]
+        )
+    except TypeError:
+        raise ValueError(f"Invalid compact reference: {ranges}")
+
+
+def compact_matches(matches: Iterable[Match]) -> list[list[Any]]:
+    """The compact form of matches: `[start, end, match_str, ranges]` lists."""
+    return [
+        [start, end, match_str, reference_ranges(ref)]
+        for start, end, match_str, ref in matches
+    ]
+
+
+def encode_references(references: Iterable[Reference | None]) -> str:
+    """Encode references (and Nones) as a compact JSON array."""
+    return json.dumps([reference_ranges(_) for _ in references], separators=SEPARATORS)
+
+
+def decode_references(data: str | bytes) -> list[Reference | None]:
+    """Decode a JSON array of references from `encode_references()`.
+
+    Raises:
+        ValueError: If the data is not valid JSON of compact references.
+    """
+    return [ranges_reference(_) for _ in json.loads(data)]
+
+
+def encode_matches(matches: Iterable[Match]) -> str:
+    """Encode matches as a compact JSON array."""
+    return json.dumps(
+        compact_matches(matches), separators=SEPARATORS, ensure_ascii=False
+    )
+
+
+def decode_matches(data: str | bytes) -> list[Match]:
+    """Decode a JSON array of matches from `encode_matches()`.
+
+    Raises:
+        ValueError: If the data is not valid JSON of compact matches.
+    """
+    return [
+        (start, end, match_str, ranges_reference(ranges))
+        for start, end, match_str, ranges in json.loads(data)
+    ]
+
+
+def write_matches_jsonl(stream: TextIO, documents: Iterable[Iterable[Match]]) -> int:
+    """Write the matches of each document as one line of compact JSON.
+
+    Return:
+        The number of lines written.
+    """
+    count = 0
+    for matches in documents:
+        stream.write(encode_matches(matches))
+        stream.write("\n")
+        count += 1
+    return count
+
+
+def read_matches_jsonl(stream: TextIO) -> Iterator[list[Match]]:
+    """Yield the matches of each document (line) written by
+    `write_matches_jsonl()`; blank lines are skipped.
+
+    Raises:
+        ValueError: If a line is not valid JSON of compact matches.
+    """
+    for line in stream:
+        if line.strip():
+            yield decode_matches(line)
@@ -0,0 +1,213 @@
+"""Re-match references incrementally as a document is edited.
+
+A `DocumentMatcher` splits its document into paragraphs, and keeps the
+matches of each paragraph and the book context (the matcher's bracket stack)
+at each paragraph boundary. When the document is updated, only the edited
+paragraphs are matched again, followed by any later paragraphs whose incoming
+context has changed; the rest are reused. Each update returns the matches
+that were removed and added.
+
+Example:
+    ```
+    document = __.document_matcher()
+    document.update("Rom 1:1 and v.2.\\n\\nSee 3:4.")
+    diff = document.update("Rom 1:1 and v.2.\\n\\nSee 3:5.")
+    assert diff.removed[0][2] == "3:4" and diff.added[0][2] == "3:5"
+    ```
+
+Note:
+    Paragraphs are separated by blank lines. A reference is never matched
+    across a paragraph break, though number-only references still take their
+    book from earlier paragraphs. Except at paragraph breaks, matches are the
+    same as from `refspy.matcher.Matcher.generate_matches()` on the whole text.
+"""
+
+from collections import Counter
+from collections.abc import Iterator
+
+from pydantic import BaseModel
+
+from refspy.matcher import Matcher
+from refspy.models.range import Range
+from refspy.models.reference import Reference
+from refspy.utils import split_paragraphs
+
+DocumentMatch = tuple[int, int, str, Reference | None]
+"""A `(start, end, match_str, reference)` tuple, as from `generate_matches()`."""
+
+
+class MatchDiff(BaseModel):
+    """
+    The changes to a document's matches made by an update.
+
+    Removed matches have offsets in the previous text, and added matches
+    have offsets in the new text. Matches that were only moved by the edit
+    (e.g. in later paragraphs) are in neither list.
+    """
+
+    removed: list[DocumentMatch]
+    added: list[DocumentMatch]
+    scanned: int
+    """The number of paragraphs that were matched again."""
+
+
+class _Paragraph:
+    """A paragraph's text, its matches (relative to its start), and the book
+    context before and after it."""
+
+    __slots__ = ("text", "context_in", "context_out", "matches")
+
+    def __init__(
+        self,
+        text: str,
+        context_in: tuple[Range, ...],
+        context_out: tuple[Range, ...],
+        matches: list[DocumentMatch],
+    ) -> None:
+        self.text = text
+        self.context_in = context_in
+        self.context_out = context_out
+        self.matches = matches
+
+
+def common_prefix_length(a: str, b: str) -> int:
+    """The length of the longest common prefix of two strings.
+
+    Compares halving slices, so most of the work is done by string equality.
+    """
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[low:mid] == b[low:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def subtract_matches(
+    matches: list[DocumentMatch],
+    keys: list[DocumentMatch | None],
+    unchanged: Counter,
+) -> list[DocumentMatch]:
+    """The matches whose keys are not (or no longer) counted as unchanged."""
+    remaining = unchanged.copy()
+    changes = []
+    for match, key in zip(matches, keys):
+        if remaining[key] > 0:
+            remaining[key] -= 1
+        else:
+            changes.append(match)
+    return changes
+
+
+class DocumentMatcher:
+    """
+    Keep the matches of an edited document up to date.
+
+    Args:
+        matcher: The matcher to use; see `refspy.manager.Manager.matcher`.
+        yield_books: As for `refspy.matcher.Matcher.generate_matches()`.
+        yield_nones: As for `refspy.matcher.Matcher.generate_matches()`.
+        use_context: As for `refspy.matcher.Matcher.generate_matches()`.
+
+    Note:
+        A document matcher holds the state of one document, so should be used
+        by one thread at a time; its matcher can be shared.
+    """
+
+    def __init__(
+        self,
+        matcher: Matcher,
+        yield_books: bool = False,
+        yield_nones: bool = False,
+        use_context: bool = True,
+    ) -> None:
+        self.matcher = matcher
+        self.options = (yield_books, yield_nones, use_context)
+        self.text = ""
+        """The current text of the document."""
+        self.paragraphs: list[_Paragraph] = []
+
+    def scan(self, text: str, context: list[Range]) -> _Paragraph:
+        """Match a paragraph, starting from (and updating) the book context."""
+        context_in = tuple(context)
+        matches = list(self.matcher.generate_matches(text, *self.options, context))
+        return _Paragraph(text, context_in, tuple(context), matches)
+
+    def update(self, text: str) -> MatchDiff:
+        """Replace the document's text, and match what has changed.
+
+        Returns:
+            The matches removed and added by the change.
+        """
+        old, old_text = self.paragraphs, self.text
+        texts = split_paragraphs(text)
+
+        # Paragraphs with unchanged text at the start and end.
+        most = min(len(old), len(texts))
+        head = 0
+        while head < most and old[head].text == texts[head]:
+            head += 1
+        tail = 0
+        while tail < most - head and old[-1 - tail].text == texts[-1 - tail]:
+            tail += 1
+
+        # Match edited paragraphs, then unchanged ones until contexts agree.
+        paragraphs = old[:head]
+        context = list(old[head - 1].context_out) if head else []
+        for _ in texts[head : len(texts) - tail]:
+            paragraphs.append(self.scan(_, context))
+        reused = len(old)
+        for n in range(len(old) - tail, len(old)):
+            if old[n].context_in == tuple(context):
+                reused = n
+                break
+            paragraphs.append(self.scan(old[n].text, context))
+        paragraphs.extend(old[reused:])
+        self.paragraphs, self.text = paragraphs, text
+
+        # Compare the old and new matches of the paragraphs that were matched.
+        scanned = paragraphs[head : len(paragraphs) - len(old) + reused]
+        start = sum(len(_.text) for _ in old[:head])
+        old_end = start + sum(len(_.text) for _ in old[head:reused])
+        new_end = start + sum(len(_.text) for _ in scanned)
+        prefix = start + common_prefix_length(
+            old_text[start:old_end], text[start:new_end]
+        )
+        suffix = common_prefix_length(
+            old_text[prefix:old_end][::-1], text[prefix:new_end][::-1]
+        )
+        shift = len(text) - len(old_text)
+
+        def moved(match: DocumentMatch) -> DocumentMatch | None:
+            """Where an old match is in the new text, if outside the edit."""
+            if match[1] <= prefix:
+                return match
+            if match[0] >= old_end - suffix:
+                return (match[0] + shift, match[1] + shift, *match[2:])
+            return None
+
+        old_matches = list(self.generate_matches(old[head:reused], start))
+        new_matches = list(self.generate_matches(scanned, start))
+        moved_matches = [moved(_) for _ in old_matches]
+        unchanged = Counter(moved_matches) & Counter(new_matches)
+        return MatchDiff(
+            removed=subtract_matches(old_matches, moved_matches, unchanged),
+            added=subtract_matches(new_matches, new_matches, unchanged),
+            scanned=len(scanned),
+        )
+
+    def generate_matches(
+        self, paragraphs: list[_Paragraph], start: int = 0
+    ) -> Iterator[DocumentMatch]:
+        """Yield the matches of consecutive paragraphs, with offsets from
+        `start`, the offset of the first paragraph."""
+        for paragraph in paragraphs:
+            for match in paragraph.matches:
+                yield (match[0] + start, match[1] + start, *match[2:])
+            start += len(paragraph.text)
+
+    def matches(self) -> list[DocumentMatch]:
+        """All the current matches in the document, in order."""
+        return list(self.generate_matches(self.paragraphs))
@@ -23,6 +23,9 @@ class Formatter:
     arbitrary verses across multiple libraries, and can be arranged in any
     order. The formatter formats the individual ranges correctly and also
     indicates any changes between books and chapters.
+
+    A formatter holds no state between calls, and is safe to share between
+    threads; see `refspy.manager.Manager`.
     """
 
     def __init__(
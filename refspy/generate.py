@@ -0,0 +1,101 @@
+"""Generate the data modules in `refspy.generated`.
+
+Book aliases and the reference regexp depend only on the shipped library,
+language and syntax data, so they are built once, at build time, for each
+canon, locale, and syntax in `refspy.config`, and written as Python modules
+that `refspy.refspy()` loads instead of building them again.
+
+Run this after changing any library, language, or syntax data, or the
+matcher's regexp builders; `--check` exits with an error if any module is
+out of date (the test suite checks this too).
+
+Example:
+    ```
+    python -m refspy.generate
+    python -m refspy.generate --check
+    ```
+"""
+
+import argparse
+import os
+import sys
+
+from refspy.config import LIBRARIES, SYNTAX
+from refspy.generated import generated_module_name
+from refspy.init import get_canon, get_language, get_syntax
+from refspy.manager import Manager
+
+GENERATED_DIR = os.path.join(os.path.dirname(__file__), "generated")
+"""The directory of the generated modules."""
+
+
+def format_dict(name: str, values: dict) -> list[str]:
+    """Source lines for a dict constant, one entry per line."""
+    return [f"{name} = {{"] + [f"    {k!r}: {v!r}," for k, v in values.items()] + ["}"]
+
+
+def generate_module_source(canon_name: str, locale_name: str, syntax_name: str) -> str:
+    """The source of the data module for a canon, locale, and syntax."""
+    __ = Manager(
+        get_canon(canon_name, locale_name),
+        get_language(locale_name[:2]),
+        get_syntax(syntax_name),
+    )
+    lines = [
+        '"""Generated by `python -m refspy.generate`; do not edit.',
+        "",
+        f"Book aliases and reference regexp: {canon_name}, {locale_name}, {syntax_name}.",
+        '"""',
+        "",
+        "# fmt: off",
+        *format_dict("BOOK_ALIASES", __.book_aliases),
+        "",
+        *format_dict("EXPANDED_BOOK_ALIASES", __.matcher.book_aliases),
+        "",
+        f"REFERENCE_PATTERN = {__.matcher.reference_regexp.pattern!r}",
+        "# fmt: on",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def generate_modules() -> dict[str, str]:
+    """The source of every data module, by file path."""
+    modules = {}
+    for canon_name, locales in LIBRARIES.items():
+        for locale_name in locales:
+            for syntax_name in SYNTAX:
+                name = generated_module_name(canon_name, locale_name, syntax_name)
+                path = os.path.join(GENERATED_DIR, name + ".py")
+                modules[path] = generate_module_source(
+                    canon_name, locale_name, syntax_name
+                )
+    return modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--check", action="store_true", help="only check the modules are current"
+    )
+    args = parser.parse_args()
+    stale = []
+    for path, source in generate_modules().items():
+        current = None
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                current = file.read()
+        if current == source:
+            continue
+        stale.append(path)
+        if not args.check:
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(source)
+    for path in stale:
+        print(("Out of date: " if args.check else "Wrote: ") + path)
+    if args.check and stale:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
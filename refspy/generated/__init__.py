@@ -0,0 +1,36 @@
+"""Book aliases and reference regexps built at build time.
+
+Each module here holds, for one canon, locale, and syntax of
+`refspy.config`, the data that a `refspy.manager.Manager` would otherwise
+build on every start:
+
+- `BOOK_ALIASES`: as from `refspy.indexers.index_book_aliases()`.
+- `EXPANDED_BOOK_ALIASES`: as from
+  `refspy.matcher.Matcher.expand_book_aliases()`.
+- `REFERENCE_PATTERN`: as from
+  `refspy.matcher.Matcher.build_reference_regexp()`.
+
+The modules are written by `python -m refspy.generate`. `refspy.refspy()`
+loads them with `load_generated()`; managers of other libraries or languages
+build their data dynamically, as before.
+"""
+
+from importlib import import_module
+from types import ModuleType
+
+
+def generated_module_name(canon_name: str, locale_name: str, syntax_name: str) -> str:
+    """The module name (in this package) for a canon, locale, and syntax."""
+    return f"{canon_name}_{locale_name}_{syntax_name}"
+
+
+def load_generated(
+    canon_name: str, locale_name: str, syntax_name: str
+) -> ModuleType | None:
+    """The data module for a canon, locale, and syntax, or None if there is
+    none (e.g. for names not in `refspy.config`)."""
+    name = generated_module_name(canon_name, locale_name, syntax_name)
+    try:
+        return import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError:
+        return None
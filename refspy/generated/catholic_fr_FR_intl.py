@@ -0,0 +1,562 @@
+"""Generated by `python -m refspy.generate`; do not edit.
+
+Book aliases and reference regexp: catholic, fr_FR, intl.
+"""
+
+# fmt: off
+BOOK_ALIASES = {
+    'Genèse': (200, 1),
+    'Gn': (200, 1),
+    'Exode': (200, 2),
+    'Ex': (200, 2),
+    'Lévitique': (200, 3),
+    'Lv': (200, 3),
+    'Nombres': (200, 4),
+    'Nb': (200, 4),
+    'Deutéronome': (200, 5),
+    'Dt': (200, 5),
+    'Josué': (200, 6),
+    'Jos': (200, 6),
+    'Juges': (200, 7),
+    'Jg': (200, 7),
+    'Ruth': (200, 8),
+    'Rt': (200, 8),
+    '1 Samuel': (200, 9),
+    '1 S': (200, 9),
+    '2 Samuel': (200, 10),
+    '2 S': (200, 10),
+    '1 Rois': (200, 11),
+    '1 R': (200, 11),
+    '2 Rois': (200, 12),
+    '2 R': (200, 12),
+    '1 Chroniques': (200, 13),
+    '1 Ch': (200, 13),
+    '2 Chronicques': (200, 14),
+    '2 Ch': (200, 14),
+    'Esdras': (200, 15),
+    'Esd': (200, 15),
+    'Néhémie': (200, 16),
+    'Ne': (200, 16),
+    'Esther': (200, 17),
+    'Est': (200, 17),
+    'Job': (200, 18),
+    'Jb': (200, 18),
+    'Psaumes': (200, 19),
+    'Ps': (200, 19),
+    'Proverbes': (200, 20),
+    'Pr': (200, 20),
+    'Qohèleth (Ecclésiaste)': (200, 21),
+    'Qo': (200, 21),
+    'Ecc': (200, 21),
+    'Ec': (200, 21),
+    'Cantique des cantiques': (200, 22),
+    'Ct': (200, 22),
+    'Isaïe': (200, 23),
+    'Is': (200, 23),
+    'Es': (200, 23),
+    'Jérémie': (200, 24),
+    'Jr': (200, 24),
+    'Lamentations': (200, 25),
+    'Lm': (200, 25),
+    'Ézékiel': (200, 26),
+    'Ez': (200, 26),
+    'Daniel': (200, 27),
+    'Dn': (200, 27),
+    'Osée': (200, 28),
+    'Os': (200, 28),
+    'Joël': (200, 29),
+    'Jl': (200, 29),
+    'Amos': (200, 30),
+    'Am': (200, 30),
+    'Abdias': (200, 31),
+    'Ab': (200, 31),
+    'Jonas': (200, 32),
+    'Jon': (200, 32),
+    'Michée': (200, 33),
+    'Mi': (200, 33),
+    'Nahoum': (200, 34),
+    'Na': (200, 34),
+    'Habacuc': (200, 35),
+    'Ha': (200, 35),
+    'Sophonie': (200, 36),
+    'So': (200, 36),
+    'Aggée': (200, 37),
+    'Ag': (200, 37),
+    'Zacharie': (200, 38),
+    'Za': (200, 38),
+    'Malachie': (200, 39),
+    'Ml': (200, 39),
+    'Tobie': (210, 1),
+    'Tb': (210, 1),
+    'Judith': (210, 2),
+    'Jdt': (210, 2),
+    'Esther grec': (210, 3),
+    'Est gr': (210, 3),
+    'Sagesse': (210, 4),
+    'Sg': (210, 4),
+    'Siracide': (210, 5),
+    'Si': (210, 5),
+    'Baruc': (210, 6),
+    'Ba': (210, 6),
+    'Lettre de Jérémie': (210, 7),
+    'Lt-Jr': (210, 7),
+    "Prière d'Azarias": (210, 9),
+    'Pr Azar': (210, 9),
+    'Cantique des trois enfants': (210, 10),
+    'CtT': (210, 10),
+    'Susanne': (210, 11),
+    'Sus': (210, 11),
+    'Bel et le Dragon': (210, 12),
+    'Bel': (210, 12),
+    'Premier livre des Maccabées': (210, 13),
+    '1 M': (210, 13),
+    '1 Macc': (210, 13),
+    'Deuxième livre des Maccabées': (210, 14),
+    '2 M': (210, 14),
+    '2 Macc': (210, 14),
+    'Matthieu': (400, 1),
+    'Mt': (400, 1),
+    'Marc': (400, 2),
+    'Mc': (400, 2),
+    'Luc': (400, 3),
+    'Lc': (400, 3),
+    'Jean': (400, 4),
+    'Jn': (400, 4),
+    'Actes des Apôtres': (400, 5),
+    'Ac': (400, 5),
+    'Romains': (400, 6),
+    'Rm': (400, 6),
+    '1 Corinthiens': (400, 7),
+    '1 Co': (400, 7),
+    '2 Corinthiens': (400, 8),
+    '2 Co': (400, 8),
+    'Galates': (400, 9),
+    'Ga': (400, 9),
+    'Ephésiens': (400, 10),
+    'Ep': (400, 10),
+    'Philippians': (400, 11),
+    'Ph': (400, 11),
+    'Colossians': (400, 12),
+    'Col': (400, 12),
+    '1 Thessaloniciens': (400, 13),
+    '1 Th': (400, 13),
+    '2 Thessaloniciens': (400, 14),
+    '2 Th': (400, 14),
+    '1 Timothée': (400, 15),
+    '1 Tm': (400, 15),
+    '2 Timothée': (400, 16),
+    '2 Tm': (400, 16),
+    'Tite': (400, 17),
+    'Tt': (400, 17),
+    'Philémon': (400, 18),
+    'Phm': (400, 18),
+    'Hébreux': (400, 19),
+    'Hb': (400, 19),
+    'Jacques': (400, 20),
+    'Jc': (400, 20),
+    '1 Pierre': (400, 21),
+    '1 P': (400, 21),
+    '2 Pierre': (400, 22),
+    '2 P': (400, 22),
+    '1 Jean': (400, 23),
+    '1 Jn': (400, 23),
+    '2 Jean': (400, 24),
+    '2 Jn': (400, 24),
+    '3 Jean': (400, 25),
+    '3 Jn': (400, 25),
+    'Jude': (400, 26),
+    'Apocalypse': (400, 27),
+    'Ap': (400, 27),
+}
+
+EXPANDED_BOOK_ALIASES = {
+    'Genèse': (200, 1),
+    'Gn': (200, 1),
+    'Exode': (200, 2),
+    'Ex': (200, 2),
+    'Lévitique': (200, 3),
+    'Lv': (200, 3),
+    'Nombres': (200, 4),
+    'Nb': (200, 4),
+    'Deutéronome': (200, 5),
+    'Dt': (200, 5),
+    'Josué': (200, 6),
+    'Jos': (200, 6),
+    'Juges': (200, 7),
+    'Jg': (200, 7),
+    'Ruth': (200, 8),
+    'Rt': (200, 8),
+    '1 Samuel': (200, 9),
+    'Première Lettre à Samuel': (200, 9),
+    'Première lettre aux Samuel': (200, 9),
+    'Première Épître de Samuel': (200, 9),
+    'Premier livre des Samuel': (200, 9),
+    '1ere Samuel': (200, 9),
+    'I Samuel': (200, 9),
+    '1 S': (200, 9),
+    'Première Lettre à S': (200, 9),
+    'Première lettre aux S': (200, 9),
+    'Première Épître de S': (200, 9),
+    'Premier livre des S': (200, 9),
+    '1ere S': (200, 9),
+    'I S': (200, 9),
+    '2 Samuel': (200, 10),
+    'Seconde Lettre à Samuel': (200, 10),
+    'Seconde lettre aux Samuel': (200, 10),
+    'Seconde Épître de Samuel': (200, 10),
+    'Deuxième livre des Samuel': (200, 10),
+    '2nd Samuel': (200, 10),
+    'II Samuel': (200, 10),
+    '2 S': (200, 10),
+    'Seconde Lettre à S': (200, 10),
+    'Seconde lettre aux S': (200, 10),
+    'Seconde Épître de S': (200, 10),
+    'Deuxième livre des S': (200, 10),
+    '2nd S': (200, 10),
+    'II S': (200, 10),
+    '1 Rois': (200, 11),
+    'Première Lettre à Rois': (200, 11),
+    'Première lettre aux Rois': (200, 11),
+    'Première Épître de Rois': (200, 11),
+    'Premier livre des Rois': (200, 11),
+    '1ere Rois': (200, 11),
+    'I Rois': (200, 11),
+    '1 R': (200, 11),
+    'Première Lettre à R': (200, 11),
+    'Première lettre aux R': (200, 11),
+    'Première Épître de R': (200, 11),
+    'Premier livre des R': (200, 11),
+    '1ere R': (200, 11),
+    'I R': (200, 11),
+    '2 Rois': (200, 12),
+    'Seconde Lettre à Rois': (200, 12),
+    'Seconde lettre aux Rois': (200, 12),
+    'Seconde Épître de Rois': (200, 12),
+    'Deuxième livre des Rois': (200, 12),
+    '2nd Rois': (200, 12),
+    'II Rois': (200, 12),
+    '2 R': (200, 12),
+    'Seconde Lettre à R': (200, 12),
+    'Seconde lettre aux R': (200, 12),
+    'Seconde Épître de R': (200, 12),
+    'Deuxième livre des R': (200, 12),
+    '2nd R': (200, 12),
+    'II R': (200, 12),
+    '1 Chroniques': (200, 13),
+    'Première Lettre à Chroniques': (200, 13),
+    'Première lettre aux Chroniques': (200, 13),
+    'Première Épître de Chroniques': (200, 13),
+    'Premier livre des Chroniques': (200, 13),
+    '1ere Chroniques': (200, 13),
+    'I Chroniques': (200, 13),
+    '1 Ch': (200, 13),
+    'Première Lettre à Ch': (200, 13),
+    'Première lettre aux Ch': (200, 13),
+    'Première Épître de Ch': (200, 13),
+    'Premier livre des Ch': (200, 13),
+    '1ere Ch': (200, 13),
+    'I Ch': (200, 13),
+    '2 Chronicques': (200, 14),
+    'Seconde Lettre à Chronicques': (200, 14),
+    'Seconde lettre aux Chronicques': (200, 14),
+    'Seconde Épître de Chronicques': (200, 14),
+    'Deuxième livre des Chronicques': (200, 14),
+    '2nd Chronicques': (200, 14),
+    'II Chronicques': (200, 14),
+    '2 Ch': (200, 14),
+    'Seconde Lettre à Ch': (200, 14),
+    'Seconde lettre aux Ch': (200, 14),
+    'Seconde Épître de Ch': (200, 14),
+    'Deuxième livre des Ch': (200, 14),
+    '2nd Ch': (200, 14),
+    'II Ch': (200, 14),
+    'Esdras': (200, 15),
+    'Esd': (200, 15),
+    'Néhémie': (200, 16),
+    'Ne': (200, 16),
+    'Esther': (200, 17),
+    'Est': (200, 17),
+    'Job': (200, 18),
+    'Jb': (200, 18),
+    'Psaumes': (200, 19),
+    'Ps': (200, 19),
+    'Proverbes': (200, 20),
+    'Pr': (200, 20),
+    'Qohèleth (Ecclésiaste)': (200, 21),
+    'Qo': (200, 21),
+    'Ecc': (200, 21),
+    'Ec': (200, 21),
+    'Cantique des cantiques': (200, 22),
+    'Ct': (200, 22),
+    'Isaïe': (200, 23),
+    'Is': (200, 23),
+    'Es': (200, 23),
+    'Jérémie': (200, 24),
+    'Jr': (200, 24),
+    'Lamentations': (200, 25),
+    'Lm': (200, 25),
+    'Ézékiel': (200, 26),
+    'Ez': (200, 26),
+    'Daniel': (200, 27),
+    'Dn': (200, 27),
+    'Osée': (200, 28),
+    'Os': (200, 28),
+    'Joël': (200, 29),
+    'Jl': (200, 29),
+    'Amos': (200, 30),
+    'Am': (200, 30),
+    'Abdias': (200, 31),
+    'Ab': (200, 31),
+    'Jonas': (200, 32),
+    'Jon': (200, 32),
+    'Michée': (200, 33),
+    'Mi': (200, 33),
+    'Nahoum': (200, 34),
+    'Na': (200, 34),
+    'Habacuc': (200, 35),
+    'Ha': (200, 35),
+    'Sophonie': (200, 36),
+    'So': (200, 36),
+    'Aggée': (200, 37),
+    'Ag': (200, 37),
+    'Zacharie': (200, 38),
+    'Za': (200, 38),
+    'Malachie': (200, 39),
+    'Ml': (200, 39),
+    'Tobie': (210, 1),
+    'Tb': (210, 1),
+    'Judith': (210, 2),
+    'Jdt': (210, 2),
+    'Esther grec': (210, 3),
+    'Est gr': (210, 3),
+    'Sagesse': (210, 4),
+    'Sg': (210, 4),
+    'Siracide': (210, 5),
+    'Si': (210, 5),
+    'Baruc': (210, 6),
+    'Ba': (210, 6),
+    'Lettre de Jérémie': (210, 7),
+    'Lt-Jr': (210, 7),
+    "Prière d'Azarias": (210, 9),
+    'Pr Azar': (210, 9),
+    'Cantique des trois enfants': (210, 10),
+    'CtT': (210, 10),
+    'Susanne': (210, 11),
+    'Sus': (210, 11),
+    'Bel et le Dragon': (210, 12),
+    'Bel': (210, 12),
+    'Premier livre des Maccabées': (210, 13),
+    '1 M': (210, 13),
+    'Première Lettre à M': (210, 13),
+    'Première lettre aux M': (210, 13),
+    'Première Épître de M': (210, 13),
+    'Premier livre des M': (210, 13),
+    '1ere M': (210, 13),
+    'I M': (210, 13),
+    '1 Macc': (210, 13),
+    'Première Lettre à Macc': (210, 13),
+    'Première lettre aux Macc': (210, 13),
+    'Première Épître de Macc': (210, 13),
+    'Premier livre des Macc': (210, 13),
+    '1ere Macc': (210, 13),
+    'I Macc': (210, 13),
+    'Deuxième livre des Maccabées': (210, 14),
+    '2 M': (210, 14),
+    'Seconde Lettre à M': (210, 14),
+    'Seconde lettre aux M': (210, 14),
+    'Seconde Épître de M': (210, 14),
+    'Deuxième livre des M': (210, 14),
+    '2nd M': (210, 14),
+    'II M': (210, 14),
+    '2 Macc': (210, 14),
+    'Seconde Lettre à Macc': (210, 14),
+    'Seconde lettre aux Macc': (210, 14),
+    'Seconde Épître de Macc': (210, 14),
+    'Deuxième livre des Macc': (210, 14),
+    '2nd Macc': (210, 14),
+    'II Macc': (210, 14),
+    'Matthieu': (400, 1),
+    'Mt': (400, 1),
+    'Marc': (400, 2),
+    'Mc': (400, 2),
+    'Luc': (400, 3),
+    'Lc': (400, 3),
+    'Jean': (400, 4),
+    'Jn': (400, 4),
+    'Actes des Apôtres': (400, 5),
+    'Ac': (400, 5),
+    'Romains': (400, 6),
+    'Rm': (400, 6),
+    '1 Corinthiens': (400, 7),
+    'Première Lettre à Corinthiens': (400, 7),
+    'Première lettre aux Corinthiens': (400, 7),
+    'Première Épître de Corinthiens': (400, 7),
+    'Premier livre des Corinthiens': (400, 7),
+    '1ere Corinthiens': (400, 7),
+    'I Corinthiens': (400, 7),
+    '1 Co': (400, 7),
+    'Première Lettre à Co': (400, 7),
+    'Première lettre aux Co': (400, 7),
+    'Première Épître de Co': (400, 7),
+    'Premier livre des Co': (400, 7),
+    '1ere Co': (400, 7),
+    'I Co': (400, 7),
+    '2 Corinthiens': (400, 8),
+    'Seconde Lettre à Corinthiens': (400, 8),
+    'Seconde lettre aux Corinthiens': (400, 8),
+    'Seconde Épître de Corinthiens': (400, 8),
+    'Deuxième livre des Corinthiens': (400, 8),
+    '2nd Corinthiens': (400, 8),
+    'II Corinthiens': (400, 8),
+    '2 Co': (400, 8),
+    'Seconde Lettre à Co': (400, 8),
+    'Seconde lettre aux Co': (400, 8),
+    'Seconde Épître de Co': (400, 8),
+    'Deuxième livre des Co': (400, 8),
+    '2nd Co': (400, 8),
+    'II Co': (400, 8),
+    'Galates': (400, 9),
+    'Ga': (400, 9),
+    'Ephésiens': (400, 10),
+    'Ep': (400, 10),
+    'Philippians': (400, 11),
+    'Ph': (400, 11),
+    'Colossians': (400, 12),
+    'Col': (400, 12),
+    '1 Thessaloniciens': (400, 13),
+    'Première Lettre à Thessaloniciens': (400, 13),
+    'Première lettre aux Thessaloniciens': (400, 13),
+    'Première Épître de Thessaloniciens': (400, 13),
+    'Premier livre des Thessaloniciens': (400, 13),
+    '1ere Thessaloniciens': (400, 13),
+    'I Thessaloniciens': (400, 13),
+    '1 Th': (400, 13),
+    'Première Lettre à Th': (400, 13),
+    'Première lettre aux Th': (400, 13),
+    'Première Épître de Th': (400, 13),
+    'Premier livre des Th': (400, 13),
+    '1ere Th': (400, 13),
+    'I Th': (400, 13),
+    '2 Thessaloniciens': (400, 14),
+    'Seconde Lettre à Thessaloniciens': (400, 14),
+    'Seconde lettre aux Thessaloniciens': (400, 14),
+    'Seconde Épître de Thessaloniciens': (400, 14),
+    'Deuxième livre des Thessaloniciens': (400, 14),
+    '2nd Thessaloniciens': (400, 14),
+    'II Thessaloniciens': (400, 14),
+    '2 Th': (400, 14),
+    'Seconde Lettre à Th': (400, 14),
+    'Seconde lettre aux Th': (400, 14),
+    'Seconde Épître de Th': (400, 14),
+    'Deuxième livre des Th': (400, 14),
+    '2nd Th': (400, 14),
+    'II Th': (400, 14),
+    '1 Timothée': (400, 15),
+    'Première Lettre à Timothée': (400, 15),
+    'Première lettre aux Timothée': (400, 15),
+    'Première Épître de Timothée': (400, 15),
+    'Premier livre des Timothée': (400, 15),
+    '1ere Timothée': (400, 15),
+    'I Timothée': (400, 15),
+    '1 Tm': (400, 15),
+    'Première Lettre à Tm': (400, 15),
+    'Première lettre aux Tm': (400, 15),
+    'Première Épître de Tm': (400, 15),
+    'Premier livre des Tm': (400, 15),
+    '1ere Tm': (400, 15),
+    'I Tm': (400, 15),
+    '2 Timothée': (400, 16),
+    'Seconde Lettre à Timothée': (400, 16),
+    'Seconde lettre aux Timothée': (400, 16),
+    'Seconde Épître de Timothée': (400, 16),
+    'Deuxième livre des Timothée': (400, 16),
+    '2nd Timothée': (400, 16),
+    'II Timothée': (400, 16),
+    '2 Tm': (400, 16),
+    'Seconde Lettre à Tm': (400, 16),
+    'Seconde lettre aux Tm': (400, 16),
+    'Seconde Épître de Tm': (400, 16),
+    'Deuxième livre des Tm': (400, 16),
+    '2nd Tm': (400, 16),
+    'II Tm': (400, 16),
+    'Tite': (400, 17),
+    'Tt': (400, 17),
+    'Philémon': (400, 18),
+    'Phm': (400, 18),
+    'Hébreux': (400, 19),
+    'Hb': (400, 19),
+    'Jacques': (400, 20),
+    'Jc': (400, 20),
+    '1 Pierre': (400, 21),
+    'Première Lettre à Pierre': (400, 21),
+    'Première lettre aux Pierre': (400, 21),
+    'Première Épître de Pierre': (400, 21),
+    'Premier livre des Pierre': (400, 21),
+    '1ere Pierre': (400, 21),
+    'I Pierre': (400, 21),
+    '1 P': (400, 21),
+    'Première Lettre à P': (400, 21),
+    'Première lettre aux P': (400, 21),
+    'Première Épître de P': (400, 21),
+    'Premier livre des P': (400, 21),
+    '1ere P': (400, 21),
+    'I P': (400, 21),
+    '2 Pierre': (400, 22),
+    'Seconde Lettre à Pierre': (400, 22),
+    'Seconde lettre aux Pierre': (400, 22),
+    'Seconde Épître de Pierre': (400, 22),
+    'Deuxième livre des Pierre': (400, 22),
+    '2nd Pierre': (400, 22),
+    'II Pierre': (400, 22),
+    '2 P': (400, 22),
+    'Seconde Lettre à P': (400, 22),
+    'Seconde lettre aux P': (400, 22),
+    'Seconde Épître de P': (400, 22),
+    'Deuxième livre des P': (400, 22),
+    '2nd P': (400, 22),
+    'II P': (400, 22),
+    '1 Jean': (400, 23),
+    'Première Lettre à Jean': (400, 23),
+    'Première lettre aux Jean': (400, 23),
+    'Première Épître de Jean': (400, 23),
+    'Premier livre des Jean': (400, 23),
+    '1ere Jean': (400, 23),
+    'I Jean': (400, 23),
+    '1 Jn': (400, 23),
+    'Première Lettre à Jn': (400, 23),
+    'Première lettre aux Jn': (400, 23),
+    'Première Épître de Jn': (400, 23),
+    'Premier livre des Jn': (400, 23),
+    '1ere Jn': (400, 23),
+    'I Jn': (400, 23),
+    '2 Jean': (400, 24),
+    'Seconde Lettre à Jean': (400, 24),
+    'Seconde lettre aux Jean': (400, 24),
+    'Seconde Épître de Jean': (400, 24),
+    'Deuxième livre des Jean': (400, 24),
+    '2nd Jean': (400, 24),
+    'II Jean': (400, 24),
+    '2 Jn': (400, 24),
+    'Seconde Lettre à Jn': (400, 24),
+    'Seconde lettre aux Jn': (400, 24),
+    'Seconde Épître de Jn': (400, 24),
+    'Deuxième livre des Jn': (400, 24),
+    '2nd Jn': (400, 24),
+    'II Jn': (400, 24),
+    '3 Jean': (400, 25),
+    'Troisième Lettre à Jean': (400, 25),
+    'Troisième Épître de Jean': (400, 25),
+    '3e Jean': (400, 25),
+    'III Jean': (400, 25),
+    '3 Jn': (400, 25),
+    'Troisième Lettre à Jn': (400, 25),
+    'Troisième Épître de Jn': (400, 25),
+    '3e Jn': (400, 25),
+    'III Jn': (400, 25),
+    'Jude': (400, 26),
+    'Apocalypse': (400, 27),
+    'Ap': (400, 27),
+}
+
+REFERENCE_PATTERN = "(?P<book_match>\\b(?P<book>(?:3|Troisième\\s+Lettre\\s+à|Troisième\\s+Épître\\s+de|3e|III)\\s*(?:J(?:ean|n))\\b\\.?|(?:2|Seconde\\s+Lettre\\s+à|Seconde\\s+lettre\\s+aux|Seconde\\s+Épître\\s+de|Deuxième\\s+livre\\s+des|2nd|II)\\s*(?:(?:C(?:h(?:ronicques)?|o(?:rinthiens)?)|J(?:ean|n)|M(?:acc)?|P(?:ierre)?|R(?:ois)?|S(?:amuel)?|T(?:h(?:essaloniciens)?|imothée|m)))\\b\\.?|(?:1|Première\\s+Lettre\\s+à|Première\\s+lettre\\s+aux|Première\\s+Épître\\s+de|Premier\\s+livre\\s+des|1ere|I)\\s*(?:(?:C(?:h(?:roniques)?|o(?:rinthiens)?)|J(?:ean|n)|M(?:acc)?|P(?:ierre)?|R(?:ois)?|S(?:amuel)?|T(?:h(?:essaloniciens)?|imothée|m)))\\b\\.?|(?:(?:A(?:b(?:dias)?|c(?:tes\\s+des\\s+Apôtres)?|g(?:gée)?|m(?:os)?|p(?:ocalypse)?)|B(?:a(?:ruc)?|el(?:\\s+et\\s+le\\s+Dragon)?)|C(?:antique\\s+des\\s+(?:cantiques|trois\\s+enfants)|ol(?:ossians)?|t(?:T)?)|D(?:aniel|eu(?:téronome|xième\\s+livre\\s+des\\s+Maccabées)|n|t)|E(?:c(?:c)?|p(?:hésiens)?|s(?:d(?:ras)?|t(?:\\s+gr|her(?:\\s+grec)?)?)?|x(?:ode)?|z)|G(?:a(?:lates)?|enèse|n)|H(?:a(?:bacuc)?|b|ébreux)|Is(?:aïe)?|J(?:acques|b|c|dt|ean|g|l|n|o(?:b|n(?:as)?|s(?:ué)?|ël)|r|u(?:d(?:e|ith)|ges)|érémie)|L(?:amentations|c|ettre\\s+de\\s+Jérémie|m|t\\-Jr|uc|v|évitique)|M(?:a(?:lachie|rc|tthieu)|c|i(?:chée)?|l|t)|N(?:a(?:houm)?|b|e|ombres|éhémie)|Os(?:ée)?|P(?:h(?:il(?:ippians|émon)|m)?|r(?:\\s+Azar|emier\\s+livre\\s+des\\s+Maccabées|ière\\s+d'Azarias|overbes)?|s(?:aumes)?)|Qo(?:hèleth\\s+\\(Ecclésiaste\\))?|R(?:m|omains|t|uth)|S(?:agesse|g|i(?:racide)?|o(?:phonie)?|us(?:anne)?)|T(?:b|ite|obie|t)|Za(?:charie)?|Ézékiel))\\b\\.?)(?!\\s+[A-Z])(?P<book_numbers>\\s*(?P<book_c1>\\d+[a-d]?)[:\\.]\\s*(?P<book_v1>\\d+[a-d]?)[–\\-](?P<book_c2>\\d+[a-d]?)[:\\.]\\s*(?P<book_v2>\\d+[a-d]?)|\\s*(?P<book_chapter>\\d+[a-d]?)[:\\.]\\s*(?P<book_verses>(?:\\d+[a-d]?[–\\-]\\d+[a-d]?|\\d+[a-d]?)(?:[,]\\s*(?:\\d+[a-d]?[–\\-]\\d+[a-d]?|(?:3(?![:\\.]\\s*|\\s*(?:Jean|Jn))|2(?![:\\.]\\s*|\\s*(?:Ch|Chronicques|Co|Corinthiens|Jean|Jn|M|Macc|P|Pierre|R|Rois|S|Samuel|Th|Thessaloniciens|Timothée|Tm))|1(?![:\\.]\\s*|\\s*(?:Ch|Chroniques|Co|Corinthiens|Jean|Jn|M|Macc|P|Pierre|R|Rois|S|Samuel|Th|Thessaloniciens|Timothée|Tm))|(?:[4-9]|\\d{2,3})(?![:\\.]\\s*))\\b))*)|\\s*(?P<book_list>(?:\\d+[a-d]?[–\\-]\\d+[a-d]?|\\d+[a-d]?)(?:[,]\\s*(?:\\d+[a-d]?[–\\-]\\d+[a-d]?|(?:3(?![:\\.]\\s*|\\s*(?:Jean|Jn))|2(?![:\\.]\\s*|\\s*(?:Ch|Chronicques|Co|Corinthiens|Jean|Jn|M|Macc|P|Pierre|R|Rois|S|Samuel|Th|Thessaloniciens|Timothée|Tm))|1(?![:\\.]\\s*|\\s*(?:Ch|Chroniques|Co|Corinthiens|Jean|Jn|M|Macc|P|Pierre|R|Rois|S|Samuel|Th|Thessaloniciens|Timothée|Tm))|(?:[4-9]|\\d{2,3})(?![:\\.]\\s*))\\b))*))?)|(?P<numbers>(?P<numbers_c1>\\d+[a-d]?)[:\\.]\\s*(?P<numbers_v1>\\d+[a-d]?)[–\\-](?P<numbers_c2>\\d+[a-d]?)[:\\.]\\s*(?P<numbers_v2>\\d+[a-d]?)|(?P<numbers_chapter>\\d+[a-d]?)[:\\.]\\s*(?P<numbers_verses>(?:\\d+[a-d]?[–\\-]\\d+[a-d]?|\\d+[a-d]?)(?:[,]\\s*(?:\\d+[a-d]?[–\\-]\\d+[a-d]?|(?:3(?![:\\.]\\s*|\\s*(?:Jean|Jn))|2(?![:\\.]\\s*|\\s*(?:Ch|Chronicques|Co|Corinthiens|Jean|Jn|M|Macc|P|Pierre|R|Rois|S|Samuel|Th|Thessaloniciens|Timothée|Tm))|1(?![:\\.]\\s*|\\s*(?:Ch|Chroniques|Co|Corinthiens|Jean|Jn|M|Macc|P|Pierre|R|Rois|S|Samuel|Th|Thessaloniciens|Timothée|Tm))|(?:[4-9]|\\d{2,3})(?![:\\.]\\s*))\\b))*)|(?:v\\.\\s*|vv\\.\\s*)(?P<numbers_list>(?:\\d+[a-d]?[–\\-]\\d+[a-d]?|\\d+[a-d]?)(?:[,]\\s*(?:\\d+[a-d]?[–\\-]\\d+[a-d]?|(?:3(?![:\\.]\\s*|\\s*(?:Jean|Jn))|2(?![:\\.]\\s*|\\s*(?:Ch|Chronicques|Co|Corinthiens|Jean|Jn|M|Macc|P|Pierre|R|Rois|S|Samuel|Th|Thessaloniciens|Timothée|Tm))|1(?![:\\.]\\s*|\\s*(?:Ch|Chroniques|Co|Corinthiens|Jean|Jn|M|Macc|P|Pierre|R|Rois|S|Samuel|Th|Thessaloniciens|Timothée|Tm))|(?:[4-9]|\\d{2,3})(?![:\\.]\\s*))\\b))*))"
+# fmt: on
@@ -0,0 +1,616 @@
+"""Generated by `python -m refspy.generate`; do not edit.
+
+Book aliases and reference regexp: protestant, en_US, euro.
+"""
+
+# fmt: off
+BOOK_ALIASES = {
+    'Genesis': (200, 1),
+    'Gen': (200, 1),
+    'Ge': (200, 1),
+    'Gn': (200, 1),
+    'Exodus': (200, 2),
+    'Exod': (200, 2),
+    'Exo': (200, 2),
+    'Ex': (200, 2),
+    'Leviticus': (200, 3),
+    'Lev': (200, 3),
+    'Le': (200, 3),
+    'Numbers': (200, 4),
+    'Num': (200, 4),
+    'Nu': (200, 4),
+    'Deuteronomy': (200, 5),
+    'Deut': (200, 5),
+    'Deu': (200, 5),
+    'De': (200, 5),
+    'Dt': (200, 5),
+    'Joshua': (200, 6),
+    'Josh': (200, 6),
+    'Jos': (200, 6),
+    'Judges': (200, 7),
+    'Judg': (200, 7),
+    'Jdg': (200, 7),
+    'Ruth': (200, 8),
+    'Rut': (200, 8),
+    'Ru': (200, 8),
+    '1 Samuel': (200, 9),
+    '1 Sam': (200, 9),
+    '1 Sa': (200, 9),
+    '2 Samuel': (200, 10),
+    '2 Sam': (200, 10),
+    '2 Sa': (200, 10),
+    '1 Kings': (200, 11),
+    '1 Kgs': (200, 11),
+    '1 Ki': (200, 11),
+    '2 Kings': (200, 12),
+    '2 Kgs': (200, 12),
+    '2 Ki': (200, 12),
+    '1 Chronicles': (200, 13),
+    '1 Chr': (200, 13),
+    '1 Ch': (200, 13),
+    '2 Chronicles': (200, 14),
+    '2 Chr': (200, 14),
+    '2 Ch': (200, 14),
+    'Ezra': (200, 15),
+    'Ezr': (200, 15),
+    'Nehemiah': (200, 16),
+    'Neh': (200, 16),
+    'Ne': (200, 16),
+    'Esther': (200, 17),
+    'Esth': (200, 17),
+    'Est': (200, 17),
+    'Es': (200, 17),
+    'Job': (200, 18),
+    'Psalm': (200, 19),
+    'Ps': (200, 19),
+    'Psa': (200, 19),
+    'Proverbs': (200, 20),
+    'Prov': (200, 20),
+    'Pro': (200, 20),
+    'Pr': (200, 20),
+    'Ecclesiastes': (200, 21),
+    'Eccl': (200, 21),
+    'Qoheleth': (200, 21),
+    'Qoh': (200, 21),
+    'Ecc': (200, 21),
+    'Ec': (200, 21),
+    'Song of Solomon': (200, 22),
+    'Song': (200, 22),
+    'Canticles': (200, 22),
+    'Cant': (200, 22),
+    'Sng': (200, 22),
+    'So': (200, 22),
+    'Isaiah': (200, 23),
+    'Isa': (200, 23),
+    'Is': (200, 23),
+    'Jeremiah': (200, 24),
+    'Jer': (200, 24),
+    'Je': (200, 24),
+    'Lamentations': (200, 25),
+    'Lam': (200, 25),
+    'La': (200, 25),
+    'Ezekiel': (200, 26),
+    'Ezek': (200, 26),
+    'Ezk': (200, 26),
+    'Eze': (200, 26),
+    'Daniel': (200, 27),
+    'Dan': (200, 27),
+    'Da': (200, 27),
+    'Hosea': (200, 28),
+    'Hos': (200, 28),
+    'Ho': (200, 28),
+    'Joel': (200, 29),
+    'Joe': (200, 29),
+    'Jol': (200, 29),
+    'Amos': (200, 30),
+    'Amo': (200, 30),
+    'Am': (200, 30),
+    'Obadiah': (200, 31),
+    'Obad': (200, 31),
+    'Oba': (200, 31),
+    'Ob': (200, 31),
+    'Jonah': (200, 32),
+    'Jon': (200, 32),
+    'Micah': (200, 33),
+    'Mic': (200, 33),
+    'Nahum': (200, 34),
+    'Nah': (200, 34),
+    'Nam': (200, 34),
+    'Na': (200, 34),
+    'Habakkuk': (200, 35),
+    'Hab': (200, 35),
+    'Zephaniah': (200, 36),
+    'Zeph': (200, 36),
+    'Zep': (200, 36),
+    'Haggai': (200, 37),
+    'Hag': (200, 37),
+    'Hg': (200, 37),
+    'Zechariah': (200, 38),
+    'Zech': (200, 38),
+    'Zec': (200, 38),
+    'Malachi': (200, 39),
+    'Mal': (200, 39),
+    'Matthew': (400, 1),
+    'Matt': (400, 1),
+    'Mat': (400, 1),
+    'Mt': (400, 1),
+    'Mark': (400, 2),
+    'Mrk': (400, 2),
+    'Mk': (400, 2),
+    'Luke': (400, 3),
+    'Luk': (400, 3),
+    'Lk': (400, 3),
+    'John': (400, 4),
+    'Jhn': (400, 4),
+    'Jn': (400, 4),
+    'Acts': (400, 5),
+    'Act': (400, 5),
+    'Ac': (400, 5),
+    'Romans': (400, 6),
+    'Rom': (400, 6),
+    'Ro': (400, 6),
+    '1 Corinthians': (400, 7),
+    '1 Cor': (400, 7),
+    '1 Co': (400, 7),
+    '2 Corinthians': (400, 8),
+    '2 Cor': (400, 8),
+    '2 Co': (400, 8),
+    'Galatians': (400, 9),
+    'Gal': (400, 9),
+    'Ga': (400, 9),
+    'Ephesians': (400, 10),
+    'Eph': (400, 10),
+    'Philippians': (400, 11),
+    'Phil': (400, 11),
+    'Php': (400, 11),
+    'Phlp': (400, 11),
+    'Colossians': (400, 12),
+    'Col': (400, 12),
+    '1 Thessalonians': (400, 13),
+    '1 Thess': (400, 13),
+    '1 Th': (400, 13),
+    '2 Thessalonians': (400, 14),
+    '2 Thess': (400, 14),
+    '2 Th': (400, 14),
+    '1 Timothy': (400, 15),
+    '1 Tim': (400, 15),
+    '1 Ti': (400, 15),
+    '2 Timothy': (400, 16),
+    '2 Tim': (400, 16),
+    '2 Ti': (400, 16),
+    'Titus': (400, 17),
+    'Tit': (400, 17),
+    'Tt': (400, 17),
+    'Philemon': (400, 18),
+    'Phlm': (400, 18),
+    'Phm': (400, 18),
+    'Hebrews': (400, 19),
+    'Heb': (400, 19),
+    'James': (400, 20),
+    'Jam': (400, 20),
+    'Jas': (400, 20),
+    '1 Peter': (400, 21),
+    '1 Pet': (400, 21),
+    '1 Pe': (400, 21),
+    '2 Peter': (400, 22),
+    '2 Pet': (400, 22),
+    '2 Pe': (400, 22),
+    '1 John': (400, 23),
+    '1 Jn': (400, 23),
+    '2 John': (400, 24),
+    '2 Jn': (400, 24),
+    '3 John': (400, 25),
+    '3 Jn': (400, 25),
+    'Jude': (400, 26),
+    'Jud': (400, 26),
+    'Jd': (400, 26),
+    'Revelation': (400, 27),
+    'Rev': (400, 27),
+    'Apocalypse': (400, 27),
+    'Apoc': (400, 27),
+    'Re': (400, 27),
+    'Rv': (400, 27),
+}
+
+EXPANDED_BOOK_ALIASES = {
+    'Genesis': (200, 1),
+    'Gen': (200, 1),
+    'Ge': (200, 1),
+    'Gn': (200, 1),
+    'Exodus': (200, 2),
+    'Exod': (200, 2),
+    'Exo': (200, 2),
+    'Ex': (200, 2),
+    'Leviticus': (200, 3),
+    'Lev': (200, 3),
+    'Le': (200, 3),
+    'Numbers': (200, 4),
+    'Num': (200, 4),
+    'Nu': (200, 4),
+    'Deuteronomy': (200, 5),
+    'Deut': (200, 5),
+    'Deu': (200, 5),
+    'De': (200, 5),
+    'Dt': (200, 5),
+    'Joshua': (200, 6),
+    'Josh': (200, 6),
+    'Jos': (200, 6),
+    'Judges': (200, 7),
+    'Judg': (200, 7),
+    'Jdg': (200, 7),
+    'Ruth': (200, 8),
+    'Rut': (200, 8),
+    'Ru': (200, 8),
+    '1 Samuel': (200, 9),
+    'First Letter to the Samuel': (200, 9),
+    'First Samuel': (200, 9),
+    '1st Samuel': (200, 9),
+    'I Samuel': (200, 9),
+    '1 Sam': (200, 9),
+    'First Letter to the Sam': (200, 9),
+    'First Sam': (200, 9),
+    '1st Sam': (200, 9),
+    'I Sam': (200, 9),
+    '1 Sa': (200, 9),
+    'First Letter to the Sa': (200, 9),
+    'First Sa': (200, 9),
+    '1st Sa': (200, 9),
+    'I Sa': (200, 9),
+    '2 Samuel': (200, 10),
+    'Second Letter to the Samuel': (200, 10),
+    'Second Samuel': (200, 10),
+    '2nd Samuel': (200, 10),
+    'II Samuel': (200, 10),
+    '2 Sam': (200, 10),
+    'Second Letter to the Sam': (200, 10),
+    'Second Sam': (200, 10),
+    '2nd Sam': (200, 10),
+    'II Sam': (200, 10),
+    '2 Sa': (200, 10),
+    'Second Letter to the Sa': (200, 10),
+    'Second Sa': (200, 10),
+    '2nd Sa': (200, 10),
+    'II Sa': (200, 10),
+    '1 Kings': (200, 11),
+    'First Letter to the Kings': (200, 11),
+    'First Kings': (200, 11),
+    '1st Kings': (200, 11),
+    'I Kings': (200, 11),
+    '1 Kgs': (200, 11),
+    'First Letter to the Kgs': (200, 11),
+    'First Kgs': (200, 11),
+    '1st Kgs': (200, 11),
+    'I Kgs': (200, 11),
+    '1 Ki': (200, 11),
+    'First Letter to the Ki': (200, 11),
+    'First Ki': (200, 11),
+    '1st Ki': (200, 11),
+    'I Ki': (200, 11),
+    '2 Kings': (200, 12),
+    'Second Letter to the Kings': (200, 12),
+    'Second Kings': (200, 12),
+    '2nd Kings': (200, 12),
+    'II Kings': (200, 12),
+    '2 Kgs': (200, 12),
+    'Second Letter to the Kgs': (200, 12),
+    'Second Kgs': (200, 12),
+    '2nd Kgs': (200, 12),
+    'II Kgs': (200, 12),
+    '2 Ki': (200, 12),
+    'Second Letter to the Ki': (200, 12),
+    'Second Ki': (200, 12),
+    '2nd Ki': (200, 12),
+    'II Ki': (200, 12),
+    '1 Chronicles': (200, 13),
+    'First Letter to the Chronicles': (200, 13),
+    'First Chronicles': (200, 13),
+    '1st Chronicles': (200, 13),
+    'I Chronicles': (200, 13),
+    '1 Chr': (200, 13),
+    'First Letter to the Chr': (200, 13),
+    'First Chr': (200, 13),
+    '1st Chr': (200, 13),
+    'I Chr': (200, 13),
+    '1 Ch': (200, 13),
+    'First Letter to the Ch': (200, 13),
+    'First Ch': (200, 13),
+    '1st Ch': (200, 13),
+    'I Ch': (200, 13),
+    '2 Chronicles': (200, 14),
+    'Second Letter to the Chronicles': (200, 14),
+    'Second Chronicles': (200, 14),
+    '2nd Chronicles': (200, 14),
+    'II Chronicles': (200, 14),
+    '2 Chr': (200, 14),
+    'Second Letter to the Chr': (200, 14),
+    'Second Chr': (200, 14),
+    '2nd Chr': (200, 14),
+    'II Chr': (200, 14),
+    '2 Ch': (200, 14),
+    'Second Letter to the Ch': (200, 14),
+    'Second Ch': (200, 14),
+    '2nd Ch': (200, 14),
+    'II Ch': (200, 14),
+    'Ezra': (200, 15),
+    'Ezr': (200, 15),
+    'Nehemiah': (200, 16),
+    'Neh': (200, 16),
+    'Ne': (200, 16),
+    'Esther': (200, 17),
+    'Esth': (200, 17),
+    'Est': (200, 17),
+    'Es': (200, 17),
+    'Job': (200, 18),
+    'Psalm': (200, 19),
+    'Ps': (200, 19),
+    'Psa': (200, 19),
+    'Proverbs': (200, 20),
+    'Prov': (200, 20),
+    'Pro': (200, 20),
+    'Pr': (200, 20),
+    'Ecclesiastes': (200, 21),
+    'Eccl': (200, 21),
+    'Qoheleth': (200, 21),
+    'Qoh': (200, 21),
+    'Ecc': (200, 21),
+    'Ec': (200, 21),
+    'Song of Solomon': (200, 22),
+    'Song': (200, 22),
+    'Canticles': (200, 22),
+    'Cant': (200, 22),
+    'Sng': (200, 22),
+    'So': (200, 22),
+    'Isaiah': (200, 23),
+    'Isa': (200, 23),
+    'Is': (200, 23),
+    'Jeremiah': (200, 24),
+    'Jer': (200, 24),
+    'Je': (200, 24),
+    'Lamentations': (200, 25),
+    'Lam': (200, 25),
+    'La': (200, 25),
+    'Ezekiel': (200, 26),
+    'Ezek': (200, 26),
+    'Ezk': (200, 26),
+    'Eze': (200, 26),
+    'Daniel': (200, 27),
+    'Dan': (200, 27),
+    'Da': (200, 27),
+    'Hosea': (200, 28),
+    'Hos': (200, 28),
+    'Ho': (200, 28),
+    'Joel': (200, 29),
+    'Joe': (200, 29),
+    'Jol': (200, 29),
+    'Amos': (200, 30),
+    'Amo': (200, 30),
+    'Am': (200, 30),
+    'Obadiah': (200, 31),
+    'Obad': (200, 31),
+    'Oba': (200, 31),
+    'Ob': (200, 31),
+    'Jonah': (200, 32),
+    'Jon': (200, 32),
+    'Micah': (200, 33),
+    'Mic': (200, 33),
+    'Nahum': (200, 34),
+    'Nah': (200, 34),
+    'Nam': (200, 34),
+    'Na': (200, 34),
+    'Habakkuk': (200, 35),
+    'Hab': (200, 35),
+    'Zephaniah': (200, 36),
+    'Zeph': (200, 36),
+    'Zep': (200, 36),
+    'Haggai': (200, 37),
+    'Hag': (200, 37),
+    'Hg': (200, 37),
+    'Zechariah': (200, 38),
+    'Zech': (200, 38),
+    'Zec': (200, 38),
+    'Malachi': (200, 39),
+    'Mal': (200, 39),
+    'Matthew': (400, 1),
+    'Matt': (400, 1),
+    'Mat': (400, 1),
+    'Mt': (400, 1),
+    'Mark': (400, 2),
+    'Mrk': (400, 2),
+    'Mk': (400, 2),
+    'Luke': (400, 3),
+    'Luk': (400, 3),
+    'Lk': (400, 3),
+    'John': (400, 4),
+    'Jhn': (400, 4),
+    'Jn': (400, 4),
+    'Acts': (400, 5),
+    'Act': (400, 5),
+    'Ac': (400, 5),
+    'Romans': (400, 6),
+    'Rom': (400, 6),
+    'Ro': (400, 6),
+    '1 Corinthians': (400, 7),
+    'First Letter to the Corinthians': (400, 7),
+    'First Corinthians': (400, 7),
+    '1st Corinthians': (400, 7),
+    'I Corinthians': (400, 7),
+    '1 Cor': (400, 7),
+    'First Letter to the Cor': (400, 7),
+    'First Cor': (400, 7),
+    '1st Cor': (400, 7),
+    'I Cor': (400, 7),
+    '1 Co': (400, 7),
+    'First Letter to the Co': (400, 7),
+    'First Co': (400, 7),
+    '1st Co': (400, 7),
+    'I Co': (400, 7),
+    '2 Corinthians': (400, 8),
+    'Second Letter to the Corinthians': (400, 8),
+    'Second Corinthians': (400, 8),
+    '2nd Corinthians': (400, 8),
+    'II Corinthians': (400, 8),
+    '2 Cor': (400, 8),
+    'Second Letter to the Cor': (400, 8),
+    'Second Cor': (400, 8),
+    '2nd Cor': (400, 8),
+    'II Cor': (400, 8),
+    '2 Co': (400, 8),
+    'Second Letter to the Co': (400, 8),
+    'Second Co': (400, 8),
+    '2nd Co': (400, 8),
+    'II Co': (400, 8),
+    'Galatians': (400, 9),
+    'Gal': (400, 9),
+    'Ga': (400, 9),
+    'Ephesians': (400, 10),
+    'Eph': (400, 10),
+    'Philippians': (400, 11),
+    'Phil': (400, 11),
+    'Php': (400, 11),
+    'Phlp': (400, 11),
+    'Colossians': (400, 12),
+    'Col': (400, 12),
+    '1 Thessalonians': (400, 13),
+    'First Letter to the Thessalonians': (400, 13),
+    'First Thessalonians': (400, 13),
+    '1st Thessalonians': (400, 13),
+    'I Thessalonians': (400, 13),
+    '1 Thess': (400, 13),
+    'First Letter to the Thess': (400, 13),
+    'First Thess': (400, 13),
+    '1st Thess': (400, 13),
+    'I Thess': (400, 13),
+    '1 Th': (400, 13),
+    'First Letter to the Th': (400, 13),
+    'First Th': (400, 13),
+    '1st Th': (400, 13),
+    'I Th': (400, 13),
+    '2 Thessalonians': (400, 14),
+    'Second Letter to the Thessalonians': (400, 14),
+    'Second Thessalonians': (400, 14),
+    '2nd Thessalonians': (400, 14),
+    'II Thessalonians': (400, 14),
+    '2 Thess': (400, 14),
+    'Second Letter to the Thess': (400, 14),
+    'Second Thess': (400, 14),
+    '2nd Thess': (400, 14),
+    'II Thess': (400, 14),
+    '2 Th': (400, 14),
+    'Second Letter to the Th': (400, 14),
+    'Second Th': (400, 14),
+    '2nd Th': (400, 14),
+    'II Th': (400, 14),
+    '1 Timothy': (400, 15),
+    'First Letter to the Timothy': (400, 15),
+    'First Timothy': (400, 15),
+    '1st Timothy': (400, 15),
+    'I Timothy': (400, 15),
+    '1 Tim': (400, 15),
+    'First Letter to the Tim': (400, 15),
+    'First Tim': (400, 15),
+    '1st Tim': (400, 15),
+    'I Tim': (400, 15),
+    '1 Ti': (400, 15),
+    'First Letter to the Ti': (400, 15),
+    'First Ti': (400, 15),
+    '1st Ti': (400, 15),
+    'I Ti': (400, 15),
+    '2 Timothy': (400, 16),
+    'Second Letter to the Timothy': (400, 16),
+    'Second Timothy': (400, 16),
+    '2nd Timothy': (400, 16),
+    'II Timothy': (400, 16),
+    '2 Tim': (400, 16),
+    'Second Letter to the Tim': (400, 16),
+    'Second Tim': (400, 16),
+    '2nd Tim': (400, 16),
+    'II Tim': (400, 16),
+    '2 Ti': (400, 16),
+    'Second Letter to the Ti': (400, 16),
+    'Second Ti': (400, 16),
+    '2nd Ti': (400, 16),
+    'II Ti': (400, 16),
+    'Titus': (400, 17),
+    'Tit': (400, 17),
+    'Tt': (400, 17),
+    'Philemon': (400, 18),
+    'Phlm': (400, 18),
+    'Phm': (400, 18),
+    'Hebrews': (400, 19),
+    'Heb': (400, 19),
+    'James': (400, 20),
+    'Jam': (400, 20),
+    'Jas': (400, 20),
+    '1 Peter': (400, 21),
+    'First Letter to the Peter': (400, 21),
+    'First Peter': (400, 21),
+    '1st Peter': (400, 21),
+    'I Peter': (400, 21),
+    '1 Pet': (400, 21),
+    'First Letter to the Pet': (400, 21),
+    'First Pet': (400, 21),
+    '1st Pet': (400, 21),
+    'I Pet': (400, 21),
+    '1 Pe': (400, 21),
+    'First Letter to the Pe': (400, 21),
+    'First Pe': (400, 21),
+    '1st Pe': (400, 21),
+    'I Pe': (400, 21),
+    '2 Peter': (400, 22),
+    'Second Letter to the Peter': (400, 22),
+    'Second Peter': (400, 22),
+    '2nd Peter': (400, 22),
+    'II Peter': (400, 22),
+    '2 Pet': (400, 22),
+    'Second Letter to the Pet': (400, 22),
+    'Second Pet': (400, 22),
+    '2nd Pet': (400, 22),
+    'II Pet': (400, 22),
+    '2 Pe': (400, 22),
+    'Second Letter to the Pe': (400, 22),
+    'Second Pe': (400, 22),
+    '2nd Pe': (400, 22),
+    'II Pe': (400, 22),
+    '1 John': (400, 23),
+    'First Letter to the John': (400, 23),
+    'First John': (400, 23),
+    '1st John': (400, 23),
+    'I John': (400, 23),
+    '1 Jn': (400, 23),
+    'First Letter to the Jn': (400, 23),
+    'First Jn': (400, 23),
+    '1st Jn': (400, 23),
+    'I Jn': (400, 23),
+    '2 John': (400, 24),
+    'Second Letter to the John': (400, 24),
+    'Second John': (400, 24),
+    '2nd John': (400, 24),
+    'II John': (400, 24),
+    '2 Jn': (400, 24),
+    'Second Letter to the Jn': (400, 24),
+    'Second Jn': (400, 24),
+    '2nd Jn': (400, 24),
+    'II Jn': (400, 24),
+    '3 John': (400, 25),
+    'Third Letter to the John': (400, 25),
+    'Third John': (400, 25),
+    '3rd John': (400, 25),
+    'III John': (400, 25),
+    '3 Jn': (400, 25),
+    'Third Letter to the Jn': (400, 25),
+    'Third Jn': (400, 25),
+    '3rd Jn': (400, 25),
+    'III Jn': (400, 25),
+    'Jude': (400, 26),
+    'Jud': (400, 26),
+    'Jd': (400, 26),
+    'Revelation': (400, 27),
+    'Rev': (400, 27),
+    'Apocalypse': (400, 27),
+    'Apoc': (400, 27),
+    'Re': (400, 27),
+    'Rv': (400, 27),
+}
+
+REFERENCE_PATTERN = '(?P<book_match>\\b(?P<book>(?:3|Third\\s+Letter\\s+to\\s+the|Third|3rd|III)\\s*(?:J(?:n|ohn))\\b\\.?|(?:2|Second\\s+Letter\\s+to\\s+the|Second|2nd|II)\\s*(?:(?:C(?:h(?:r(?:onicles)?)?|o(?:r(?:inthians)?)?)|J(?:n|ohn)|K(?:gs|i(?:ngs)?)|Pe(?:t(?:er)?)?|Sa(?:m(?:uel)?)?|T(?:h(?:ess(?:alonians)?)?|i(?:m(?:othy)?)?)))\\b\\.?|(?:1|First\\s+Letter\\s+to\\s+the|First|1st|I)\\s*(?:(?:C(?:h(?:r(?:onicles)?)?|o(?:r(?:inthians)?)?)|J(?:n|ohn)|K(?:gs|i(?:ngs)?)|Pe(?:t(?:er)?)?|Sa(?:m(?:uel)?)?|T(?:h(?:ess(?:alonians)?)?|i(?:m(?:othy)?)?)))\\b\\.?|(?:(?:A(?:c(?:t(?:s)?)?|m(?:o(?:s)?)?|poc(?:alypse)?)|C(?:ant(?:icles)?|ol(?:ossians)?)|D(?:a(?:n(?:iel)?)?|e(?:u(?:t(?:eronomy)?)?)?|t)|E(?:c(?:c(?:l(?:esiastes)?)?)?|ph(?:esians)?|s(?:t(?:h(?:er)?)?)?|x(?:o(?:d(?:us)?)?)?|z(?:e(?:k(?:iel)?)?|k|r(?:a)?))|G(?:a(?:l(?:atians)?)?|e(?:n(?:esis)?)?|n)|H(?:a(?:b(?:akkuk)?|g(?:gai)?)|eb(?:rews)?|g|o(?:s(?:ea)?)?)|Is(?:a(?:iah)?)?|J(?:a(?:m(?:es)?|s)|d(?:g)?|e(?:r(?:emiah)?)?|hn|n|o(?:b|e(?:l)?|hn|l|n(?:ah)?|s(?:h(?:ua)?)?)|ud(?:e|g(?:es)?)?)|L(?:a(?:m(?:entations)?)?|e(?:v(?:iticus)?)?|k|uk(?:e)?)|M(?:a(?:l(?:achi)?|rk|t(?:t(?:hew)?)?)|ic(?:ah)?|k|rk|t)|N(?:a(?:h(?:um)?|m)?|e(?:h(?:emiah)?)?|u(?:m(?:bers)?)?)|Ob(?:a(?:d(?:iah)?)?)?|P(?:h(?:il(?:emon|ippians)?|l(?:m|p)|m|p)|r(?:o(?:v(?:erbs)?)?)?|s(?:a(?:lm)?)?)|Qoh(?:eleth)?|R(?:e(?:v(?:elation)?)?|o(?:m(?:ans)?)?|u(?:t(?:h)?)?|v)|S(?:ng|o(?:ng(?:\\s+of\\s+Solomon)?)?)|T(?:it(?:us)?|t)|Ze(?:c(?:h(?:ariah)?)?|p(?:h(?:aniah)?)?)))\\b\\.?)(?!\\s+[A-Z])(?P<book_numbers>\\s*(?P<book_c1>\\d+[a-d]?)[:,]\\s*(?P<book_v1>\\d+[a-d]?)[–\\-](?P<book_c2>\\d+[a-d]?)[:,]\\s*(?P<book_v2>\\d+[a-d]?)|\\s*(?P<book_chapter>\\d+[a-d]?)[:,]\\s*(?P<book_verses>(?:\\d+[a-d]?[–\\-]\\d+[a-d]?|\\d+[a-d]?)(?:[\\.]\\s*(?:\\d+[a-d]?[–\\-]\\d+[a-d]?|(?:3(?![:,]\\s*|\\s*(?:Jn|John))|2(?![:,]\\s*|\\s*(?:Ch|Chr|Chronicles|Co|Cor|Corinthians|Jn|John|Kgs|Ki|Kings|Pe|Pet|Peter|Sa|Sam|Samuel|Th|Thess|Thessalonians|Ti|Tim|Timothy))|1(?![:,]\\s*|\\s*(?:Ch|Chr|Chronicles|Co|Cor|Corinthians|Jn|John|Kgs|Ki|Kings|Pe|Pet|Peter|Sa|Sam|Samuel|Th|Thess|Thessalonians|Ti|Tim|Timothy))|(?:[4-9]|\\d{2,3})(?![:,]\\s*))\\b))*)|\\s*(?P<book_list>(?:\\d+[a-d]?[–\\-]\\d+[a-d]?|\\d+[a-d]?)(?:[\\.]\\s*(?:\\d+[a-d]?[–\\-]\\d+[a-d]?|(?:3(?![:,]\\s*|\\s*(?:Jn|John))|2(?![:,]\\s*|\\s*(?:Ch|Chr|Chronicles|Co|Cor|Corinthians|Jn|John|Kgs|Ki|Kings|Pe|Pet|Peter|Sa|Sam|Samuel|Th|Thess|Thessalonians|Ti|Tim|Timothy))|1(?![:,]\\s*|\\s*(?:Ch|Chr|Chronicles|Co|Cor|Corinthians|Jn|John|Kgs|Ki|Kings|Pe|Pet|Peter|Sa|Sam|Samuel|Th|Thess|Thessalonians|Ti|Tim|Timothy))|(?:[4-9]|\\d{2,3})(?![:,]\\s*))\\b))*))?)|(?P<numbers>(?P<numbers_c1>\\d+[a-d]?)[:,]\\s*(?P<numbers_v1>\\d+[a-d]?)[–\\-](?P<numbers_c2>\\d+[a-d]?)[:,]\\s*(?P<numbers_v2>\\d+[a-d]?)|(?P<numbers_chapter>\\d+[a-d]?)[:,]\\s*(?P<numbers_verses>(?:\\d+[a-d]?[–\\-]\\d+[a-d]?|\\d+[a-d]?)(?:[\\.]\\s*(?:\\d+[a-d]?[–\\-]\\d+[a-d]?|(?:3(?![:,]\\s*|\\s*(?:Jn|John))|2(?![:,]\\s*|\\s*(?:Ch|Chr|Chronicles|Co|Cor|Corinthians|Jn|John|Kgs|Ki|Kings|Pe|Pet|Peter|Sa|Sam|Samuel|Th|Thess|Thessalonians|Ti|Tim|Timothy))|1(?![:,]\\s*|\\s*(?:Ch|Chr|Chronicles|Co|Cor|Corinthians|Jn|John|Kgs|Ki|Kings|Pe|Pet|Peter|Sa|Sam|Samuel|Th|Thess|Thessalonians|Ti|Tim|Timothy))|(?:[4-9]|\\d{2,3})(?![:,]\\s*))\\b))*)|(?:v\\.\\s*|vv\\.\\s*)(?P<numbers_list>(?:\\d+[a-d]?[–\\-]\\d+[a-d]?|\\d+[a-d]?)(?:[\\.]\\s*(?:\\d+[a-d]?[–\\-]\\d+[a-d]?|(?:3(?![:,]\\s*|\\s*(?:Jn|John))|2(?![:,]\\s*|\\s*(?:Ch|Chr|Chronicles|Co|Cor|Corinthians|Jn|John|Kgs|Ki|Kings|Pe|Pet|Peter|Sa|Sam|Samuel|Th|Thess|Thessalonians|Ti|Tim|Timothy))|1(?![:,]\\s*|\\s*(?:Ch|Chr|Chronicles|Co|Cor|Corinthians|Jn|John|Kgs|Ki|Kings|Pe|Pet|Peter|Sa|Sam|Samuel|Th|Thess|Thessalonians|Ti|Tim|Timothy))|(?:[4-9]|\\d{2,3})(?![:,]\\s*))\\b))*))'
+# fmt: on
@@ -1,7 +1,12 @@
 """Initialisation helpers for Refspy package."""
 
+from functools import lru_cache
+
+from refspy.backends import get_backend
 from refspy.config import LANGUAGES, LIBRARIES, SYNTAX
+from refspy.generated import load_generated
 
+from refspy.manager import Manager
 from refspy.models.language import Language
 from refspy.models.library import Library
 from refspy.models.syntax import Syntax
@@ -28,3 +33,50 @@ def get_syntax(syntax_name: str) -> Syntax:
     if syntax_name in SYNTAX:
         return SYNTAX[syntax_name]
     raise ValueError(f"Canon '{syntax_name}' not found.")
+
+
+def create_manager(
+    canon_name: str = "protestant",
+    locale_name: str = "en_US",
+    syntax_name: str | None = None,
+    include_two_letter_aliases: bool = True,
+    backend_name: str | None = None,
+) -> Manager:
+    """Create a Manager from names; see `refspy.refspy()` for the arguments.
+
+    The manager uses the build-time data of `refspy.generated` where there
+    is a module for the names (and two-letter aliases are included).
+    """
+    libraries = get_canon(canon_name, locale_name)
+    language = get_language(locale_name[:2])
+    syntax = get_syntax(syntax_name) if syntax_name is not None else None
+    data = None
+    if include_two_letter_aliases:
+        data = load_generated(
+            canon_name, locale_name, (syntax or language.syntax).abbrev
+        )
+    return Manager(
+        libraries,
+        language,
+        syntax,
+        include_two_letter_aliases=include_two_letter_aliases,
+        data=data,
+        backend=get_backend(backend_name),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_manager(
+    canon_name: str = "protestant",
+    locale_name: str = "en_US",
+    syntax_name: str | None = None,
+    backend_name: str | None = None,
+) -> Manager:
+    """Create a Manager once per process for a canon, locale, and syntax.
+
+    This is for workers, services, and scripts that share one Manager per
+    locale; see `refspy.refspy()` for the arguments.
+    """
+    return create_manager(
+        canon_name, locale_name, syntax_name, backend_name=backend_name
+    )
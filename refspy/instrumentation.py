@@ -0,0 +1,250 @@
+"""Optional counters and timings for the matcher's hot path.
+
+Instrumentation is attached to one `refspy.matcher.Matcher` instance by
+shadowing a few of its attributes (the compiled regexes and
+`generate_matches()`) with measuring wrappers. Nothing is checked per match
+when it is not attached, so an uninstrumented matcher runs exactly as before.
+
+Example:
+    ```
+    stats = __.matcher.instrument()
+    __.find_references(text)
+    print(stats.snapshot())
+    __.matcher.uninstrument()
+    ```
+
+Note:
+    A `MatcherStats` object is not thread-safe; instrument a matcher that is
+    used by one thread at a time.
+"""
+
+from collections.abc import Callable, Generator, Iterator
+from re import Match, Pattern
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from refspy.matcher import Matcher
+
+BRANCHES = ("chapter_range", "chapter_verses", "number_ranges", "book_only")
+"""The resolution branches that are counted.
+
+These are the structures captured by the matcher's reference regexp (see
+`refspy.matcher.Matcher.build_reference_regexp()`): a chapter range like
+`1:2-3:4`, a chapter and verses like `3:4,6-9`, a number list like `3-4` or
+`vv.3-4`, or a book name without numbers.
+"""
+
+SHADOWED = (
+    "brackets_regexp",
+    "reference_regexp",
+    "on_value_error",
+    "generate_matches",
+)
+"""The matcher attributes replaced while instrumented."""
+
+
+class MatcherStats:
+    """
+    Accumulated measurements for an instrumented matcher.
+
+    Times are in seconds. `scan_seconds` is the time spent inside the regex
+    match iterators; `resolve_seconds` is the rest of the time spent producing
+    matches (parsing numbers, building references, and tracking context).
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero all counters and timings."""
+        self.calls = 0
+        self.reference_matches = 0
+        self.bracket_matches = 0
+        self.results = 0
+        self.nones = 0
+        self.value_errors = 0
+        self.branches = dict.fromkeys(BRANCHES, 0)
+        self.max_bracket_depth = 0
+        self.total_seconds = 0.0
+        self.scan_seconds = 0.0
+        self.overhead_seconds = 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current measurements as a JSON-compatible dict.
+
+        Example:
+            ```
+            {
+                "calls": 1,
+                "reference_matches": 120,
+                "bracket_matches": 8,
+                "results": 112,
+                "nones": 3,
+                "value_errors": 1,
+                "branches": {"chapter_range": 4, "chapter_verses": 80, ...},
+                "max_bracket_depth": 2,
+                "seconds": {"total": 0.012, "scan": 0.002, "resolve": 0.010},
+            }
+            ```
+
+        `nones` counts matches that could not be resolved to a reference,
+        whether or not they were yielded; `value_errors` is the subset of them
+        that raised a `ValueError`. `max_bracket_depth` is the greatest depth
+        of the matcher's bracket stack of book contexts (see
+        `refspy.matcher.Matcher.generate_matches()`): 1 once there is a book
+        context, plus 1 for each open parenthesis inside it. Parentheses
+        before any book context don't add to it.
+        """
+        resolve = self.total_seconds - self.scan_seconds - self.overhead_seconds
+        return {
+            "calls": self.calls,
+            "reference_matches": self.reference_matches,
+            "bracket_matches": self.bracket_matches,
+            "results": self.results,
+            "nones": self.nones,
+            "value_errors": self.value_errors,
+            "branches": dict(self.branches),
+            "max_bracket_depth": self.max_bracket_depth,
+            "seconds": {
+                "total": self.total_seconds,
+                "scan": self.scan_seconds,
+                "resolve": max(0.0, resolve),
+            },
+        }
+
+
+class _TimedPattern:
+    """Wrap a compiled pattern so its `finditer()` is timed and observed."""
+
+    def __init__(
+        self, pattern: Pattern, stats: MatcherStats, observe: Callable[[], Callable]
+    ) -> None:
+        self.pattern = pattern
+        self.stats = stats
+        self.observe = observe
+
+    def finditer(self, text: str, *args: int, **kwargs: Any) -> Iterator[Match]:
+        stats = self.stats
+        observe = self.observe()
+        matches = self.pattern.finditer(text, *args, **kwargs)
+        while True:
+            started = perf_counter()
+            match = next(matches, None)
+            stopped = perf_counter()
+            stats.scan_seconds += stopped - started
+            if match is None:
+                return
+            observe(match)
+            stats.overhead_seconds += perf_counter() - stopped
+            yield match
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.pattern, name)
+
+
+def _observe_references(stats: MatcherStats) -> Callable[[Match], None]:
+    def observe(match: Match) -> None:
+        stats.reference_matches += 1
+        prefix = "book" if match["book"] else "numbers"
+        if match["book"] and not match["book_numbers"]:
+            stats.branches["book_only"] += 1
+        elif match[prefix + "_c1"]:
+            stats.branches["chapter_range"] += 1
+        elif match[prefix + "_chapter"]:
+            stats.branches["chapter_verses"] += 1
+        else:
+            stats.branches["number_ranges"] += 1
+
+    return observe
+
+
+def _observe_brackets(stats: MatcherStats) -> Callable[[Match], None]:
+    def observe(match: Match) -> None:
+        stats.bracket_matches += 1
+
+    return observe
+
+
+class _DepthStack(list):
+    """A bracket stack that records its greatest depth in the stats.
+
+    The matcher only grows its stack with `append()`.
+    """
+
+    def __init__(self, items: list, stats: MatcherStats) -> None:
+        super().__init__(items)
+        self.stats = stats
+        stats.max_bracket_depth = max(stats.max_bracket_depth, len(self))
+
+    def append(self, item: Any) -> None:
+        super().append(item)
+        if len(self) > self.stats.max_bracket_depth:
+            self.stats.max_bracket_depth = len(self)
+
+
+def instrument(matcher: "Matcher") -> MatcherStats:
+    """Attach instrumentation to a matcher, and return its stats.
+
+    Instrumenting an instrumented matcher returns its existing stats.
+    """
+    if isinstance(vars(matcher).get("stats"), MatcherStats):
+        return matcher.stats
+    stats = MatcherStats()
+    generate_matches = matcher.generate_matches
+    matcher.brackets_regexp = _TimedPattern(
+        matcher.brackets_regexp, stats, lambda: _observe_brackets(stats)
+    )
+    matcher.reference_regexp = _TimedPattern(
+        matcher.reference_regexp, stats, lambda: _observe_references(stats)
+    )
+
+    def on_value_error(error: ValueError) -> None:
+        stats.value_errors += 1
+
+    def instrumented_matches(
+        text: str,
+        yield_books: bool = False,
+        yield_nones: bool = False,
+        use_context: bool = True,
+        context: list | None = None,
+        pos: int = 0,
+        endpos: int | None = None,
+        resolve_book: Callable[[str], tuple] | None = None,
+    ) -> Generator[tuple, None, None]:
+        # Nones are always generated, so they can be counted, then filtered.
+        stats.calls += 1
+        stack = _DepthStack([] if context is None else context, stats)
+        matches = generate_matches(
+            text, yield_books, True, use_context, stack, pos, endpos, resolve_book
+        )
+        while True:
+            started = perf_counter()
+            item = next(matches, None)
+            stats.total_seconds += perf_counter() - started
+            if context is not None:
+                context[:] = stack  # <-- keep the caller's context current
+            if item is None:
+                return
+            if item[3] is None:
+                stats.nones += 1
+                if not yield_nones:
+                    continue
+            stats.results += 1
+            yield item
+
+    matcher.on_value_error = on_value_error
+    matcher.generate_matches = instrumented_matches
+    matcher.stats = stats
+    return stats
+
+
+def uninstrument(matcher: "Matcher") -> None:
+    """Remove instrumentation from a matcher, if any."""
+    if isinstance(vars(matcher).get("stats"), MatcherStats):
+        for name in SHADOWED:
+            if name.endswith("_regexp"):
+                setattr(matcher, name, getattr(matcher, name).pattern)
+            else:
+                delattr(matcher, name)
+        del matcher.stats
@@ -1,5 +1,6 @@
 from refspy.models.book import Book
 from refspy.models.library import DC_ID, DCO_ID, NT_ID, OT_ID, Library
+from refspy.libraries.versification import NT_VERSES, OT_VERSES
 
 # See README.md for Library ID numbers
 # English language libraries follow SBL style guide for books and
@@ -16,6 +17,7 @@ OT = Library(
             abbrev="Gen",
             aliases=["Ge", "Gn"],
             chapters=50,
+            verses=OT_VERSES[1],
         ),
         Book(
             id=2,
@@ -23,6 +25,7 @@ OT = Library(
             abbrev="Exod",
             aliases=["Exo", "Ex"],
             chapters=40,
+            verses=OT_VERSES[2],
         ),
         Book(
             id=3,
@@ -30,6 +33,7 @@ OT = Library(
             abbrev="Lev",
             aliases=["Le"],
             chapters=27,
+            verses=OT_VERSES[3],
         ),
         Book(
             id=4,
@@ -37,6 +41,7 @@ OT = Library(
             abbrev="Num",
             aliases=["Nu"],
             chapters=36,
+            verses=OT_VERSES[4],
         ),
         Book(
             id=5,
@@ -44,6 +49,7 @@ OT = Library(
             abbrev="Deut",
             aliases=["Deu", "De", "Dt"],
             chapters=34,
+            verses=OT_VERSES[5],
         ),
         Book(
             id=6,
@@ -51,6 +57,7 @@ OT = Library(
             abbrev="Josh",
             aliases=["Jos"],
             chapters=24,
+            verses=OT_VERSES[6],
         ),
         Book(
             id=7,
@@ -58,6 +65,7 @@ OT = Library(
             abbrev="Judg",
             aliases=["Jdg"],
             chapters=21,
+            verses=OT_VERSES[7],
         ),
         Book(
             id=8,
@@ -65,6 +73,7 @@ OT = Library(
             abbrev="Ruth",
             aliases=["Rut", "Ru"],
             chapters=4,
+            verses=OT_VERSES[8],
         ),
         Book(
             id=9,
@@ -72,6 +81,7 @@ OT = Library(
             abbrev="1 Sam",
             aliases=["1 Sa"],
             chapters=31,
+            verses=OT_VERSES[9],
         ),
         Book(
             id=10,
@@ -79,6 +89,7 @@ OT = Library(
             abbrev="2 Sam",
             aliases=["2 Sa"],
             chapters=24,
+            verses=OT_VERSES[10],
         ),
         Book(
             id=11,
@@ -86,13 +97,15 @@ OT = Library(
             abbrev="1 Kgs",
             aliases=["1 Ki"],
             chapters=22,
+            verses=OT_VERSES[11],
         ),
         Book(
             id=12,
             name="2 Kings",
             abbrev="2 Kgs",
             aliases=["2 Ki"],
-            chapters=22,
+            chapters=25,
+            verses=OT_VERSES[12],
         ),
         Book(
             id=13,
@@ -100,6 +113,7 @@ OT = Library(
             abbrev="1 Chr",
             aliases=["1 Ch"],
             chapters=29,
+            verses=OT_VERSES[13],
         ),
         Book(
             id=14,
@@ -107,6 +121,7 @@ OT = Library(
             abbrev="2 Chr",
             aliases=["2 Ch"],
             chapters=36,
+            verses=OT_VERSES[14],
         ),
         Book(
             id=15,
@@ -114,6 +129,7 @@ OT = Library(
             abbrev="Ezra",
             aliases=["Ezr"],
             chapters=10,
+            verses=OT_VERSES[15],
         ),
         Book(
             id=16,
@@ -121,6 +137,7 @@ OT = Library(
             abbrev="Neh",
             aliases=["Ne"],
             chapters=13,
+            verses=OT_VERSES[16],
         ),
         Book(
             id=17,
@@ -128,6 +145,7 @@ OT = Library(
             abbrev="Esth",
             aliases=["Est", "Es"],
             chapters=10,
+            verses=OT_VERSES[17],
         ),
         Book(
             id=18,
@@ -135,6 +153,7 @@ OT = Library(
             abbrev="Job",
             aliases=[],
             chapters=42,
+            verses=OT_VERSES[18],
         ),
         Book(
             id=19,
@@ -142,6 +161,7 @@ OT = Library(
             abbrev="Ps",
             aliases=["Psa"],
             chapters=150,
+            verses=OT_VERSES[19],
         ),
         Book(
             id=20,
@@ -149,6 +169,7 @@ OT = Library(
             abbrev="Prov",
             aliases=["Pro", "Pr"],
             chapters=31,
+            verses=OT_VERSES[20],
         ),
         Book(
             id=21,
@@ -156,6 +177,7 @@ OT = Library(
             abbrev="Eccl",
             aliases=["Qoheleth", "Qoh", "Ecc", "Ec"],
             chapters=12,
+            verses=OT_VERSES[21],
         ),
         Book(
             id=22,
@@ -163,6 +185,7 @@ OT = Library(
             abbrev="Song",
             aliases=["Canticles", "Cant", "Sng", "So"],
             chapters=8,
+            verses=OT_VERSES[22],
         ),
         Book(
             id=23,
@@ -170,6 +193,7 @@ OT = Library(
             abbrev="Isa",
             aliases=["Is"],
             chapters=66,
+            verses=OT_VERSES[23],
         ),
         Book(
             id=24,
@@ -177,6 +201,7 @@ OT = Library(
             abbrev="Jer",
             aliases=["Je"],
             chapters=52,
+            verses=OT_VERSES[24],
         ),
         Book(
             id=25,
@@ -184,6 +209,7 @@ OT = Library(
             abbrev="Lam",
             aliases=["La"],
             chapters=5,
+            verses=OT_VERSES[25],
         ),
         Book(
             id=26,
@@ -191,6 +217,7 @@ OT = Library(
             abbrev="Ezek",
             aliases=["Ezk", "Eze"],
             chapters=48,
+            verses=OT_VERSES[26],
         ),
         Book(
             id=27,
@@ -198,6 +225,7 @@ OT = Library(
             abbrev="Dan",
             aliases=["Da"],
             chapters=12,
+            verses=OT_VERSES[27],
         ),
         Book(
             id=28,
@@ -205,6 +233,7 @@ OT = Library(
             abbrev="Hos",
             aliases=["Ho"],
             chapters=14,
+            verses=OT_VERSES[28],
         ),
         Book(
             id=29,
@@ -212,6 +241,7 @@ OT = Library(
             abbrev="Joel",
             aliases=["Joe", "Jol"],
             chapters=3,
+            verses=OT_VERSES[29],
         ),
         Book(
             id=30,
@@ -219,6 +249,7 @@ OT = Library(
             abbrev="Amos",
             aliases=["Amo", "Am"],
             chapters=9,
+            verses=OT_VERSES[30],
         ),
         Book(
             id=31,
@@ -226,6 +257,7 @@ OT = Library(
             abbrev="Obad",
             aliases=["Oba", "Ob"],
             chapters=1,
+            verses=OT_VERSES[31],
         ),
         Book(
             id=32,
@@ -233,6 +265,7 @@ OT = Library(
             abbrev="Jonah",
             aliases=["Jon"],
             chapters=4,
+            verses=OT_VERSES[32],
         ),
         Book(
             id=33,
@@ -240,6 +273,7 @@ OT = Library(
             abbrev="Mic",
             aliases=[],
             chapters=7,
+            verses=OT_VERSES[33],
         ),
         Book(
             id=34,
@@ -247,6 +281,7 @@ OT = Library(
             abbrev="Nah",
             aliases=["Nam", "Na"],
             chapters=3,
+            verses=OT_VERSES[34],
         ),
         Book(
             id=35,
@@ -254,6 +289,7 @@ OT = Library(
             abbrev="Hab",
             aliases=[],
             chapters=3,
+            verses=OT_VERSES[35],
         ),
         Book(
             id=36,
@@ -261,6 +297,7 @@ OT = Library(
             abbrev="Zeph",
             aliases=["Zep"],
             chapters=3,
+            verses=OT_VERSES[36],
         ),
         Book(
             id=37,
@@ -268,6 +305,7 @@ OT = Library(
             abbrev="Hag",
             aliases=["Hg"],
             chapters=2,
+            verses=OT_VERSES[37],
         ),
         Book(
             id=38,
@@ -275,6 +313,7 @@ OT = Library(
             abbrev="Zech",
             aliases=["Zec"],
             chapters=14,
+            verses=OT_VERSES[38],
         ),
         Book(
             id=39,
@@ -282,6 +321,7 @@ OT = Library(
             abbrev="Mal",
             aliases=[],
             chapters=4,
+            verses=OT_VERSES[39],
         ),
     ],
 )
@@ -446,6 +486,7 @@ NT = Library(
             abbrev="Matt",
             aliases=["Mat", "Mt"],
             chapters=28,
+            verses=NT_VERSES[1],
         ),
         Book(
             id=2,
@@ -453,6 +494,7 @@ NT = Library(
             abbrev="Mark",
             aliases=["Mrk", "Mk"],
             chapters=16,
+            verses=NT_VERSES[2],
         ),
         Book(
             id=3,
@@ -460,6 +502,7 @@ NT = Library(
             abbrev="Luke",
             aliases=["Luk", "Lk"],
             chapters=24,
+            verses=NT_VERSES[3],
         ),
         Book(
             id=4,
@@ -467,6 +510,7 @@ NT = Library(
             abbrev="John",
             aliases=["Jhn", "Jn"],
             chapters=21,
+            verses=NT_VERSES[4],
         ),
         Book(
             id=5,
@@ -474,6 +518,7 @@ NT = Library(
             abbrev="Acts",
             aliases=["Act", "Ac"],
             chapters=28,
+            verses=NT_VERSES[5],
         ),
         Book(
             id=6,
@@ -481,6 +526,7 @@ NT = Library(
             abbrev="Rom",
             aliases=["Ro"],
             chapters=16,
+            verses=NT_VERSES[6],
         ),
         Book(
             id=7,
@@ -488,6 +534,7 @@ NT = Library(
             abbrev="1 Cor",
             aliases=["1 Co"],
             chapters=16,
+            verses=NT_VERSES[7],
         ),
         Book(
             id=8,
@@ -495,6 +542,7 @@ NT = Library(
             abbrev="2 Cor",
             aliases=["2 Co"],
             chapters=13,
+            verses=NT_VERSES[8],
         ),
         Book(
             id=9,
@@ -502,6 +550,7 @@ NT = Library(
             abbrev="Gal",
             aliases=["Ga"],
             chapters=6,
+            verses=NT_VERSES[9],
         ),
         Book(
             id=10,
@@ -509,6 +558,7 @@ NT = Library(
             abbrev="Eph",
             aliases=[],
             chapters=6,
+            verses=NT_VERSES[10],
         ),
         Book(
             id=11,
@@ -516,6 +566,7 @@ NT = Library(
             abbrev="Phil",
             aliases=["Php", "Phlp"],
             chapters=4,
+            verses=NT_VERSES[11],
         ),
         Book(
             id=12,
@@ -523,6 +574,7 @@ NT = Library(
             abbrev="Col",
             aliases=[],
             chapters=4,
+            verses=NT_VERSES[12],
         ),
         Book(
             id=13,
@@ -530,6 +582,7 @@ NT = Library(
             abbrev="1 Thess",
             aliases=["1 Th"],
             chapters=5,
+            verses=NT_VERSES[13],
         ),
         Book(
             id=14,
@@ -537,6 +590,7 @@ NT = Library(
             abbrev="2 Thess",
             aliases=["2 Th"],
             chapters=3,
+            verses=NT_VERSES[14],
         ),
         Book(
             id=15,
@@ -544,6 +598,7 @@ NT = Library(
             abbrev="1 Tim",
             aliases=["1 Ti"],
             chapters=6,
+            verses=NT_VERSES[15],
         ),
         Book(
             id=16,
@@ -551,6 +606,7 @@ NT = Library(
             abbrev="2 Tim",
             aliases=["2 Ti"],
             chapters=4,
+            verses=NT_VERSES[16],
         ),
         Book(
             id=17,
@@ -558,6 +614,7 @@ NT = Library(
             abbrev="Tit",
             aliases=["Tt"],
             chapters=3,
+            verses=NT_VERSES[17],
         ),
         Book(
             id=18,
@@ -565,6 +622,7 @@ NT = Library(
             abbrev="Phlm",
             aliases=["Phm"],
             chapters=1,
+            verses=NT_VERSES[18],
         ),
         Book(
             id=19,
@@ -572,6 +630,7 @@ NT = Library(
             abbrev="Heb",
             aliases=[],
             chapters=13,
+            verses=NT_VERSES[19],
         ),
         Book(
             id=20,
@@ -579,6 +638,7 @@ NT = Library(
             abbrev="Jam",
             aliases=["Jas"],
             chapters=5,
+            verses=NT_VERSES[20],
         ),
         Book(
             id=21,
@@ -586,6 +646,7 @@ NT = Library(
             abbrev="1 Pet",
             aliases=["1 Pe"],
             chapters=5,
+            verses=NT_VERSES[21],
         ),
         Book(
             id=22,
@@ -593,6 +654,7 @@ NT = Library(
             abbrev="2 Pet",
             aliases=["2 Pe"],
             chapters=3,
+            verses=NT_VERSES[22],
         ),
         Book(
             id=23,
@@ -600,6 +662,7 @@ NT = Library(
             abbrev="1 John",
             aliases=["1 Jn"],
             chapters=5,
+            verses=NT_VERSES[23],
         ),
         Book(
             id=24,
@@ -607,6 +670,7 @@ NT = Library(
             abbrev="2 John",
             aliases=["2 Jn"],
             chapters=1,
+            verses=NT_VERSES[24],
         ),
         Book(
             id=25,
@@ -614,6 +678,7 @@ NT = Library(
             abbrev="3 John",
             aliases=["3 Jn"],
             chapters=1,
+            verses=NT_VERSES[25],
         ),
         Book(
             id=26,
@@ -621,6 +686,7 @@ NT = Library(
             abbrev="Jude",
             aliases=["Jud", "Jd"],
             chapters=1,
+            verses=NT_VERSES[26],
         ),
         Book(
             id=27,
@@ -628,6 +694,7 @@ NT = Library(
             abbrev="Rev",
             aliases=["Apocalypse", "Apoc", "Re", "Rv"],
             chapters=22,
+            verses=NT_VERSES[27],
         ),
     ],
 )
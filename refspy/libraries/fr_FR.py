@@ -1,5 +1,6 @@
 from refspy.models.book import Book
 from refspy.models.library import Library, OT_ID, NT_ID, DC_ID, DCO_ID
+from refspy.libraries.versification import NT_VERSES, OT_VERSES
 
 # See README.md for Library ID numbers
 # French language libraries follow style guides for books
@@ -19,6 +20,7 @@ OT = Library(
             abbrev="Gn",
             aliases=[],
             chapters=50,
+            verses=OT_VERSES[1],
         ),
         Book(
             id=2,
@@ -26,6 +28,7 @@ OT = Library(
             abbrev="Ex",
             aliases=[],
             chapters=40,
+            verses=OT_VERSES[2],
         ),
         Book(
             id=3,
@@ -33,6 +36,7 @@ OT = Library(
             abbrev="Lv",
             aliases=[],
             chapters=27,
+            verses=OT_VERSES[3],
         ),
         Book(
             id=4,
@@ -40,6 +44,7 @@ OT = Library(
             abbrev="Nb",
             aliases=[],
             chapters=36,
+            verses=OT_VERSES[4],
         ),
         Book(
             id=5,
@@ -47,6 +52,7 @@ OT = Library(
             abbrev="Dt",
             aliases=[],
             chapters=34,
+            verses=OT_VERSES[5],
         ),
         Book(
             id=6,
@@ -54,6 +60,7 @@ OT = Library(
             abbrev="Jos",
             aliases=[],
             chapters=24,
+            verses=OT_VERSES[6],
         ),
         Book(
             id=7,
@@ -61,6 +68,7 @@ OT = Library(
             abbrev="Jg",
             aliases=[],
             chapters=21,
+            verses=OT_VERSES[7],
         ),
         Book(
             id=8,
@@ -68,6 +76,7 @@ OT = Library(
             abbrev="Rt",
             aliases=[],
             chapters=4,
+            verses=OT_VERSES[8],
         ),
         Book(
             id=9,
@@ -75,6 +84,7 @@ OT = Library(
             abbrev="1 S",
             aliases=[],
             chapters=31,
+            verses=OT_VERSES[9],
         ),
         Book(
             id=10,
@@ -82,6 +92,7 @@ OT = Library(
             abbrev="2 S",
             aliases=[],
             chapters=24,
+            verses=OT_VERSES[10],
         ),
         Book(
             id=11,
@@ -89,13 +100,15 @@ OT = Library(
             abbrev="1 R",
             aliases=[],
             chapters=22,
+            verses=OT_VERSES[11],
         ),
         Book(
             id=12,
             name="2 Rois",
             abbrev="2 R",
             aliases=[],
-            chapters=22,
+            chapters=25,
+            verses=OT_VERSES[12],
         ),
         Book(
             id=13,
@@ -103,6 +116,7 @@ OT = Library(
             abbrev="1 Ch",
             aliases=[],
             chapters=29,
+            verses=OT_VERSES[13],
         ),
         Book(
             id=14,
@@ -110,6 +124,7 @@ OT = Library(
             abbrev="2 Ch",
             aliases=[],
             chapters=36,
+            verses=OT_VERSES[14],
         ),
         Book(
             id=15,
@@ -117,6 +132,7 @@ OT = Library(
             abbrev="Esd",
             aliases=[],
             chapters=10,
+            verses=OT_VERSES[15],
         ),
         Book(
             id=16,
@@ -124,6 +140,7 @@ OT = Library(
             abbrev="Ne",
             aliases=[],
             chapters=13,
+            verses=OT_VERSES[16],
         ),
         Book(
             id=17,
@@ -131,6 +148,7 @@ OT = Library(
             abbrev="Est",
             aliases=[],
             chapters=10,
+            verses=OT_VERSES[17],
         ),
         Book(
             id=18,
@@ -138,6 +156,7 @@ OT = Library(
             abbrev="Jb",
             aliases=[],
             chapters=42,
+            verses=OT_VERSES[18],
         ),
         Book(
             id=19,
@@ -145,6 +164,7 @@ OT = Library(
             abbrev="Ps",
             aliases=[],
             chapters=150,
+            verses=OT_VERSES[19],
         ),
         Book(
             id=20,
@@ -152,6 +172,7 @@ OT = Library(
             abbrev="Pr",
             aliases=[],
             chapters=31,
+            verses=OT_VERSES[20],
         ),
         Book(
             id=21,
@@ -159,6 +180,7 @@ OT = Library(
             abbrev="Qo",
             aliases=["Ecc", "Ec"],
             chapters=12,
+            verses=OT_VERSES[21],
         ),
         Book(
             id=22,
@@ -166,6 +188,7 @@ OT = Library(
             abbrev="Ct",
             aliases=[],
             chapters=8,
+            verses=OT_VERSES[22],
         ),
         Book(
             id=23,
@@ -173,6 +196,7 @@ OT = Library(
             abbrev="Is",
             aliases=["Es"],
             chapters=66,
+            verses=OT_VERSES[23],
         ),
         Book(
             id=24,
@@ -180,6 +204,7 @@ OT = Library(
             abbrev="Jr",
             aliases=[],
             chapters=52,
+            verses=OT_VERSES[24],
         ),
         Book(
             id=25,
@@ -187,6 +212,7 @@ OT = Library(
             abbrev="Lm",
             aliases=[],
             chapters=5,
+            verses=OT_VERSES[25],
         ),
         Book(
             id=26,
@@ -194,6 +220,7 @@ OT = Library(
             abbrev="Ez",
             aliases=[],
             chapters=48,
+            verses=OT_VERSES[26],
         ),
         Book(
             id=27,
@@ -201,6 +228,7 @@ OT = Library(
             abbrev="Dn",
             aliases=[],
             chapters=12,
+            verses=OT_VERSES[27],
         ),
         Book(
             id=28,
@@ -208,6 +236,7 @@ OT = Library(
             abbrev="Os",
             aliases=[],
             chapters=14,
+            verses=OT_VERSES[28],
         ),
         Book(
             id=29,
@@ -215,6 +244,7 @@ OT = Library(
             abbrev="Jl",
             aliases=[],
             chapters=3,
+            verses=OT_VERSES[29],
         ),
         Book(
             id=30,
@@ -222,6 +252,7 @@ OT = Library(
             abbrev="Am",
             aliases=[],
             chapters=9,
+            verses=OT_VERSES[30],
         ),
         Book(
             id=31,
@@ -229,6 +260,7 @@ OT = Library(
             abbrev="Ab",
             aliases=[],
             chapters=1,
+            verses=OT_VERSES[31],
         ),
         Book(
             id=32,
@@ -236,6 +268,7 @@ OT = Library(
             abbrev="Jon",
             aliases=[],
             chapters=4,
+            verses=OT_VERSES[32],
         ),
         Book(
             id=33,
@@ -243,6 +276,7 @@ OT = Library(
             abbrev="Mi",
             aliases=[],
             chapters=7,
+            verses=OT_VERSES[33],
         ),
         Book(
             id=34,
@@ -250,6 +284,7 @@ OT = Library(
             abbrev="Na",
             aliases=[],
             chapters=3,
+            verses=OT_VERSES[34],
         ),
         Book(
             id=35,
@@ -257,6 +292,7 @@ OT = Library(
             abbrev="Ha",
             aliases=[],
             chapters=3,
+            verses=OT_VERSES[35],
         ),
         Book(
             id=36,
@@ -264,6 +300,7 @@ OT = Library(
             abbrev="So",
             aliases=[],
             chapters=3,
+            verses=OT_VERSES[36],
         ),
         Book(
             id=37,
@@ -271,6 +308,7 @@ OT = Library(
             abbrev="Ag",
             aliases=[],
             chapters=2,
+            verses=OT_VERSES[37],
         ),
         Book(
             id=38,
@@ -278,6 +316,7 @@ OT = Library(
             abbrev="Za",
             aliases=[],
             chapters=14,
+            verses=OT_VERSES[38],
         ),
         Book(
             id=39,
@@ -285,6 +324,7 @@ OT = Library(
             abbrev="Ml",
             aliases=[],
             chapters=4,
+            verses=OT_VERSES[39],
         ),
     ],
 )
@@ -449,6 +489,7 @@ NT = Library(
             abbrev="Mt",
             aliases=[],
             chapters=28,
+            verses=NT_VERSES[1],
         ),
         Book(
             id=2,
@@ -456,6 +497,7 @@ NT = Library(
             abbrev="Mc",
             aliases=[],
             chapters=16,
+            verses=NT_VERSES[2],
         ),
         Book(
             id=3,
@@ -463,6 +505,7 @@ NT = Library(
             abbrev="Lc",
             aliases=[],
             chapters=24,
+            verses=NT_VERSES[3],
         ),
         Book(
             id=4,
@@ -470,6 +513,7 @@ NT = Library(
             abbrev="Jn",
             aliases=[],
             chapters=21,
+            verses=NT_VERSES[4],
         ),
         Book(
             id=5,
@@ -477,6 +521,7 @@ NT = Library(
             abbrev="Ac",
             aliases=[],
             chapters=28,
+            verses=NT_VERSES[5],
         ),
         Book(
             id=6,
@@ -484,6 +529,7 @@ NT = Library(
             abbrev="Rm",
             aliases=[],
             chapters=16,
+            verses=NT_VERSES[6],
         ),
         Book(
             id=7,
@@ -491,6 +537,7 @@ NT = Library(
             abbrev="1 Co",
             aliases=[""],
             chapters=16,
+            verses=NT_VERSES[7],
         ),
         Book(
             id=8,
@@ -498,6 +545,7 @@ NT = Library(
             abbrev="2 Co",
             aliases=[""],
             chapters=13,
+            verses=NT_VERSES[8],
         ),
         Book(
             id=9,
@@ -505,6 +553,7 @@ NT = Library(
             abbrev="Ga",
             aliases=[],
             chapters=6,
+            verses=NT_VERSES[9],
         ),
         Book(
             id=10,
@@ -512,6 +561,7 @@ NT = Library(
             abbrev="Ep",
             aliases=[],
             chapters=6,
+            verses=NT_VERSES[10],
         ),
         Book(
             id=11,
@@ -519,6 +569,7 @@ NT = Library(
             abbrev="Ph",
             aliases=[],
             chapters=4,
+            verses=NT_VERSES[11],
         ),
         Book(
             id=12,
@@ -526,6 +577,7 @@ NT = Library(
             abbrev="Col",
             aliases=[],
             chapters=4,
+            verses=NT_VERSES[12],
         ),
         Book(
             id=13,
@@ -533,6 +585,7 @@ NT = Library(
             abbrev="1 Th",
             aliases=[],
             chapters=5,
+            verses=NT_VERSES[13],
         ),
         Book(
             id=14,
@@ -540,6 +593,7 @@ NT = Library(
             abbrev="2 Th",
             aliases=[],
             chapters=3,
+            verses=NT_VERSES[14],
         ),
         Book(
             id=15,
@@ -547,6 +601,7 @@ NT = Library(
             abbrev="1 Tm",
             aliases=[],
             chapters=6,
+            verses=NT_VERSES[15],
         ),
         Book(
             id=16,
@@ -554,6 +609,7 @@ NT = Library(
             abbrev="2 Tm",
             aliases=[],
             chapters=4,
+            verses=NT_VERSES[16],
         ),
         Book(
             id=17,
@@ -561,6 +617,7 @@ NT = Library(
             abbrev="Tt",
             aliases=[],
             chapters=3,
+            verses=NT_VERSES[17],
         ),
         Book(
             id=18,
@@ -568,6 +625,7 @@ NT = Library(
             abbrev="Phm",
             aliases=[],
             chapters=1,
+            verses=NT_VERSES[18],
         ),
         Book(
             id=19,
@@ -575,6 +633,7 @@ NT = Library(
             abbrev="Hb",
             aliases=[],
             chapters=13,
+            verses=NT_VERSES[19],
         ),
         Book(
             id=20,
@@ -582,6 +641,7 @@ NT = Library(
             abbrev="Jc",
             aliases=[],
             chapters=5,
+            verses=NT_VERSES[20],
         ),
         Book(
             id=21,
@@ -589,6 +649,7 @@ NT = Library(
             abbrev="1 P",
             aliases=[],
             chapters=5,
+            verses=NT_VERSES[21],
         ),
         Book(
             id=22,
@@ -596,6 +657,7 @@ NT = Library(
             abbrev="2 P",
             aliases=[],
             chapters=3,
+            verses=NT_VERSES[22],
         ),
         Book(
             id=23,
@@ -603,6 +665,7 @@ NT = Library(
             abbrev="1 Jn",
             aliases=[],
             chapters=5,
+            verses=NT_VERSES[23],
         ),
         Book(
             id=24,
@@ -610,6 +673,7 @@ NT = Library(
             abbrev="2 Jn",
             aliases=[],
             chapters=1,
+            verses=NT_VERSES[24],
         ),
         Book(
             id=25,
@@ -617,6 +681,7 @@ NT = Library(
             abbrev="3 Jn",
             aliases=[],
             chapters=1,
+            verses=NT_VERSES[25],
         ),
         Book(
             id=26,
@@ -624,6 +689,7 @@ NT = Library(
             abbrev="Jude",
             aliases=[],
             chapters=1,
+            verses=NT_VERSES[26],
         ),
         Book(
             id=27,
@@ -631,6 +697,7 @@ NT = Library(
             abbrev="Ap",
             aliases=[],
             chapters=22,
+            verses=NT_VERSES[27],
         ),
     ],
 )
@@ -4,7 +4,10 @@ See `refspy.refspy()` for a useful helper function.
 """
 
 import re
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator, Iterable, Iterator
+from functools import lru_cache, partial
+from types import ModuleType
+from typing import TYPE_CHECKING
 from pydantic import TypeAdapter
 
 from refspy.models.book import Book
@@ -15,6 +18,7 @@ from refspy.models.reference import (
     Reference,
     book_reference,
     chapter_reference,
+    fingerprint_references,
     join_references,
     reference,
     split_reference,
@@ -23,19 +27,51 @@ from refspy.models.reference import (
     verse_reference,
 )
 from refspy.models.syntax import Syntax
-from refspy.models.verse import verse
+from refspy.models.verse import VerseTuple, verse
 
 from refspy.types.number import Number
 
+from refspy.columns import (
+    PARSE_CHUNK_SIZE,
+    MatchColumns,
+    ParsedReferences,
+    match_columns,
+    parse_strings,
+)
+from refspy.collation import collation_dict, collation_list, generate_collation
+from refspy.document import DocumentMatcher
 from refspy.formatter import Formatter
 from refspy.indexers import (
     index_book_aliases,
     index_books,
     index_libraries,
 )
-from refspy.matcher import Matcher
+from refspy.matcher import Matcher, match_segment
 from refspy.navigator import Navigator
-from refspy.utils import url_param, url_escape
+from refspy.tables import ReferenceTables
+from refspy.utils import segment_paragraphs, url_param, url_escape
+
+if TYPE_CHECKING:  # <-- imported when used, to keep `import refspy` fast
+    from concurrent.futures import Executor
+
+    from refspy.backends import RegexBackend
+
+ASYNC_BATCH_SIZE = 50
+"""The number of matches to yield before handing control back to the event
+loop in `refspy.manager.Manager.agenerate_references()`."""
+
+ASYNC_EXECUTOR_THRESHOLD = 100_000
+"""The text length (in characters) at which
+`refspy.manager.Manager.afind_references()` offloads matching to an
+executor."""
+
+PARSE_CACHE_SIZE = 4096
+"""The default number of strings whose first reference is kept by
+`refspy.manager.Manager.r()` and `refspy.manager.Manager.first_reference()`."""
+
+PARAGRAPH_SEGMENT_SIZE = 100_000
+"""The minimum text length (in characters) of the segments that
+`refspy.manager.Manager.find_paragraph_matches()` sends to an executor."""
 
 """
 References can always be formatted with Manager.template(ref). If no
@@ -48,6 +84,18 @@ class Manager:
     """
     The manager object integrates the main library features into a single
     convenient facade.
+
+    Note:
+        Thread safety: a manager and its matcher, formatter and navigator
+        are not modified after construction, and every method keeps its
+        working state in local variables and returns new objects. One
+        manager can therefore be shared by any number of threads, including
+        on free-threaded Python builds, without locks. Don't modify its
+        attributes (e.g. `books` or `book_aliases`) while it is in use, and
+        don't call `__.matcher.instrument()` on a shared manager. (Its
+        `tables` of shared book and chapter references are filled on first
+        use, but filling an entry is idempotent, and its parse cache is an
+        `lru_cache`, which is thread-safe.)
     """
 
     def __init__(
@@ -56,6 +104,9 @@ class Manager:
         language: Language,
         syntax: Syntax | None = None,
         include_two_letter_aliases: bool = True,
+        parse_cache_size: int = PARSE_CACHE_SIZE,
+        data: ModuleType | None = None,
+        backend: "RegexBackend | None" = None,
     ):
         """
         Construct a new Manager object.
@@ -66,6 +117,14 @@ class Manager:
             language: A syntax object like INTERNATIONAL.
             include_two_letter_aliases: Whether to allow `len(alias) == 2`
                 (default: True)
+            parse_cache_size: The number of strings whose first reference is
+                cached by `r()` and `first_reference()`, or 0 for no cache.
+            data: A module of `refspy.generated` for these libraries,
+                language and syntax, whose book aliases and reference regexp
+                are used instead of building them (see
+                `refspy.generated.load_generated()`).
+            backend: The regexp engine for matching (default:
+                `refspy.backends.get_backend()`).
         """
         self.libraries: dict[Number, Library] = index_libraries(libraries)
         """A lookup dictionary for Libraries by library.id """
@@ -73,8 +132,12 @@ class Manager:
         self.books: dict[tuple[Number, Number], Book] = index_books(libraries)
         """A lookup dictionary for Books by (library.id, book.id)"""
 
-        self.book_aliases: dict[str, tuple[Number, Number]] = index_book_aliases(
-            libraries, include_two_letter_aliases=include_two_letter_aliases
+        self.book_aliases: dict[str, tuple[Number, Number]] = (
+            dict(data.BOOK_ALIASES)
+            if data is not None
+            else index_book_aliases(
+                libraries, include_two_letter_aliases=include_two_letter_aliases
+            )
         )
         """A lookup dictionary for (library.id, book.id) by book alias strings."""
 
@@ -84,17 +147,30 @@ class Manager:
         self.syntax: Syntax = syntax or language.syntax
         """Syntax-specific program data."""
 
+        self.tables: ReferenceTables = ReferenceTables(self.books)
+        """Shared book and chapter references, made on first use."""
+
         self.matcher: Matcher = Matcher(
-            self.books, self.book_aliases, self.language, self.syntax
+            self.books,
+            self.book_aliases,
+            self.language,
+            self.syntax,
+            self.tables,
+            data,
+            backend,
         )
         """Delegate reference matching tasks."""
 
         self.formatter: Formatter = Formatter(self.books, self.book_aliases)
         """Delegate formatting tasks."""
 
-        self.navigator: Navigator = Navigator(self.books, self.book_aliases)
+        self.navigator: Navigator = Navigator(
+            self.books, self.book_aliases, self.tables
+        )
         """Delegate navigation tasks."""
 
+        self._parse_first = lru_cache(maxsize=parse_cache_size)(self._parse_first)
+
     # -----------------------------------
     # Index and summary functions
     # -----------------------------------
@@ -103,8 +179,8 @@ class Manager:
         self, references: list[Reference]
     ) -> list[Reference]:
         """Return a sorted, combined, simplified list of references by book."""
-        collation = self.collate_chapter_references(
-            sorted([ref for ref in references if ref and not ref.is_book()])
+        collation = self.generate_collation(
+            [ref for ref in references if ref and not ref.is_book()], "chapter"
         )
         indexes = []
         for _, book_collation in collation:
@@ -137,8 +213,8 @@ class Manager:
 
     def make_summary_references(self, references: list[Reference]) -> list[Reference]:
         """Return a sorted, combined, simplified list of References."""
-        collation = self.collate(
-            sorted([ref for ref in references if ref and not ref.is_book()])
+        collation = self.generate_collation(
+            [ref for ref in references if ref and not ref.is_book()], "book"
         )
         summary = []
         for _, book_collation in collation:
@@ -174,8 +250,8 @@ class Manager:
         self, references: list[Reference]
     ) -> list[Reference]:
         """Return a sorted, combined, simplified list of references by book."""
-        collation = self.collate_chapter_references(
-            sorted([ref for ref in references if ref and not ref.is_book()])
+        collation = self.generate_collation(
+            [ref for ref in references if ref and not ref.is_book()], "chapter"
         )
         summary = []
         for _, book_collation in collation:
@@ -284,6 +360,63 @@ class Manager:
         else:
             return None
 
+    def distribution(
+        self, references: Iterable[Reference | None], granularity: str = "book"
+    ) -> list[int]:
+        """
+        Count references in each book or chapter, in canonical order.
+
+        Each range counts once in every book or chapter it spans; see
+        `refspy.distribution`. The counts line up with
+        `distribution_labels()`, and can be passed to e.g. `numpy.asarray()`.
+
+        Args:
+            granularity: One of 'book' or 'chapter'.
+        """
+        from refspy.distribution import count_distribution
+
+        return count_distribution(references, self.tables.ordinals, granularity)
+
+    def distribution_labels(self, granularity: str = "book") -> list[str]:
+        """
+        Return abbreviated names for the bins of `distribution()`, e.g. 'Rom'
+        or 'Rom 3'.
+
+        Args:
+            granularity: One of 'book' or 'chapter'.
+        """
+        from refspy.distribution import distribution_keys
+
+        return [
+            self.abbrev_name(chapter_reference(*key))
+            if len(key) == 3
+            else self.abbrev_book(book_reference(*key))
+            for key in distribution_keys(self.tables.ordinals, granularity)
+        ]
+
+    def distribution_svg(
+        self,
+        references: Iterable[Reference | None],
+        granularity: str = "book",
+        width: int = 800,
+        height: int = 200,
+    ) -> str:
+        """
+        Return an SVG bar chart of `distribution()`, with a labelled tooltip
+        for each bar.
+
+        Args:
+            granularity: One of 'book' or 'chapter'.
+        """
+        from refspy.distribution import distribution_svg
+
+        return distribution_svg(
+            self.distribution(references, granularity),
+            self.distribution_labels(granularity),
+            width,
+            height,
+        )
+
     # -----------------------------------
     # Merging functions
     # -----------------------------------
@@ -300,6 +433,17 @@ class Manager:
         """
         return unique_references(references)
 
+    def fingerprint(
+        self, references: list[Reference | None], normalize: bool = False
+    ) -> str:
+        """Return a stable hash of a list of references, to detect changes.
+
+        Note:
+            - See `refspy.models.reference.fingerprint_references()`.
+            - With `normalize=True`, order and duplicates are ignored.
+        """
+        return fingerprint_references(references, normalize)
+
     def split(self, reference: Reference) -> list[Reference]:
         """Split a reference into a list, with one range per reference
 
@@ -365,6 +509,48 @@ class Manager:
         """
         return self.collate_book_references(references)
 
+    def generate_collation(
+        self,
+        references: Iterable[Reference],
+        depth: str = "book",
+        verse_labels: bool = False,
+    ) -> Iterator[tuple[Library, Iterator]]:
+        """
+        Lazily collate references by library, book, chapter, and verse ranges.
+
+        References are sorted once by integer keys and grouped with
+        `itertools.groupby`; see `refspy.collation`. Multi-book references are
+        ignored.
+
+        Args:
+            depth: One of 'book', 'chapter', or 'verse'.
+            verse_labels: Key verse groups by formatted numbers (e.g. '1, 5–6,
+                13') rather than by tuples of `(start.index(), end.index())`.
+
+        Example:
+            ```
+            for library, book_collation in __.generate_collation(refs, "chapter"):
+                for book, chapter_collation in book_collation:
+                    for chapter_number, references in chapter_collation:
+                        # ...
+            ```
+
+        Note:
+            Each group must be iterated before the next group is taken.
+        """
+
+        def resolve(key: tuple, first: Reference):
+            if len(key) == 1:
+                return self.libraries[key[0]]
+            elif len(key) == 2:
+                return self.books[key]
+            elif len(key) == 3 or not verse_labels:
+                return key[-1]
+            else:
+                return self.numbers(first)
+
+        return generate_collation(references, depth, resolve)
+
     def collate_book_references(
         self, references: list[Reference]
     ) -> list[tuple[Library, list[tuple[Book, list[Reference]]]]]:
@@ -379,13 +565,7 @@ class Manager:
                     # ...
             ```
         """
-        library_list = list()
-        for library_id, books_dict in self.collate_by_book(references).items():
-            book_list = list()
-            for book_id, references in books_dict.items():
-                book_list.append(tuple([self.books[library_id, book_id], references]))
-            library_list.append(tuple([self.libraries[library_id], book_list]))
-        return library_list
+        return collation_list(self.generate_collation(references, "book"))
 
     def collate_by_book(
         self, references: list[Reference]
@@ -394,15 +574,7 @@ class Manager:
         A collation groups single-book references by library and book IDs.
         Multi-book references are ignored.
         """
-        collation = dict()
-        for ref in [_ for _ in references if _.count_books() == 1]:
-            v1 = ref.ranges[0].start
-            if v1.library not in collation:
-                collation[v1.library] = dict()
-            if v1.book not in collation[v1.library]:
-                collation[v1.library][v1.book] = list()
-            collation[v1.library][v1.book].append(ref)
-        return collation
+        return collation_dict(generate_collation(references, "book"))
 
     def collate_chapter_references(
         self, references: list[Reference]
@@ -419,16 +591,7 @@ class Manager:
                         # ...
             ```
         """
-        library_list = list()
-        for library_id, books_dict in self.collate_by_chapter(references).items():
-            book_list = list()
-            for book_id, chapters_dict in books_dict.items():
-                chapter_list = list()
-                for chapter_id, references in chapters_dict.items():
-                    chapter_list.append(tuple([chapter_id, references]))
-                book_list.append(tuple([self.books[library_id, book_id], chapter_list]))
-            library_list.append(tuple([self.libraries[library_id], book_list]))
-        return library_list
+        return collation_list(self.generate_collation(references, "chapter"))
 
     def collate_by_chapter(
         self, references: list[Reference]
@@ -437,17 +600,7 @@ class Manager:
         A collation groups single-book references by library, book, and chapter
         IDs. Multi-book references are ignored.
         """
-        collation = dict()
-        for ref in [_ for _ in references if _.count_books() == 1]:
-            v1 = ref.ranges[0].start
-            if v1.library not in collation:
-                collation[v1.library] = dict()
-            if v1.book not in collation[v1.library]:
-                collation[v1.library][v1.book] = dict()
-            if v1.chapter not in collation[v1.library][v1.book]:
-                collation[v1.library][v1.book][v1.chapter] = list()
-            collation[v1.library][v1.book][v1.chapter].append(ref)
-        return collation
+        return collation_dict(generate_collation(references, "chapter"))
 
     def collate_verse_references(
         self, references: list[Reference]
@@ -473,19 +626,9 @@ class Manager:
             - verse_numbers is a unique string representing the verse ranges,
               e.g. '1, 5-6, 13'
         """
-        library_list = list()
-        for library_id, books_dict in self.collate_by_verse(references).items():
-            book_list = list()
-            for book_id, chapters_dict in books_dict.items():
-                chapter_list = list()
-                for chapter_id, verses_dict in chapters_dict.items():
-                    verse_list = list()
-                    for ref_numbers, references in verses_dict.items():
-                        verse_list.append(tuple([ref_numbers, references]))
-                    chapter_list.append(tuple([chapter_id, verse_list]))
-                book_list.append(tuple([self.books[library_id, book_id], chapter_list]))
-            library_list.append(tuple([self.libraries[library_id], book_list]))
-        return library_list
+        return collation_list(
+            self.generate_collation(references, "verse", verse_labels=True)
+        )
 
     def collate_by_verse(
         self, references: list[Reference], aggregate_function=None
@@ -495,19 +638,16 @@ class Manager:
         number, and a string reresenting the verse ranges. Multi-book
         references are ignored.
         """
-        collation = dict()
-        for ref in [_ for _ in references if _.count_books() == 1]:
-            v1 = ref.ranges[0].start
-            if v1.library not in collation:
-                collation[v1.library] = dict()
-            if v1.book not in collation[v1.library]:
-                collation[v1.library][v1.book] = dict()
-            if v1.chapter not in collation[v1.library][v1.book]:
-                collation[v1.library][v1.book][v1.chapter] = dict()
-            ref_numbers = self.numbers(ref)
-            if ref_numbers not in collation[v1.library][v1.book][v1.chapter]:
-                collation[v1.library][v1.book][v1.chapter][ref_numbers] = list()
-            collation[v1.library][v1.book][v1.chapter][ref_numbers].append(ref)
+
+        collation = collation_dict(generate_collation(references, "verse"))
+        for books in collation.values():
+            for chapters in books.values():
+                for chapter, groups in chapters.items():
+                    # Different ranges can format alike, e.g. "3:1, 3"
+                    labelled: dict[str, list[Reference]] = {}
+                    for group in groups.values():
+                        labelled.setdefault(self.numbers(group[0]), []).extend(group)
+                    chapters[chapter] = labelled
         return collation
 
     # -----------------------------------
@@ -518,9 +658,59 @@ class Manager:
         """
         Return the first tuple of (match_str, reference) found by
         `refspy.manager.Manager.generate_references()`
+
+        Results are cached by text (see `parse_cache_info()`); the cache holds
+        verse tuples, and each call builds a new reference from them, so a
+        returned reference can be modified without affecting the cache.
         """
-        generator = self.matcher.generate_references(text)
-        return next(generator, (None, None))
+        match_str, ranges = self._parse_first(text)
+        if ranges is None:
+            return match_str, None
+        return match_str, reference(
+            *[range(verse(*start), verse(*end)) for start, end in ranges]
+        )
+
+    def _parse_first(
+        self, text: str
+    ) -> tuple[str | None, tuple[tuple[VerseTuple, VerseTuple], ...] | None]:
+        """The first match_str of a text, and its reference's verse tuples."""
+        match_str, ref = next(self.matcher.generate_references(text), (None, None))
+        if ref is None:
+            return match_str, None
+        return match_str, tuple((_.start.tuple(), _.end.tuple()) for _ in ref.ranges)
+
+    def parse_many(
+        self,
+        strings: Iterable[str],
+        executor: "Executor | None" = None,
+        chunk_size: int = PARSE_CHUNK_SIZE,
+    ) -> ParsedReferences:
+        """Parse a column of reference strings, as by `r()`, into columns of
+        `(input, start, end, failed)` rows; see `refspy.columns`.
+
+        Identical strings are parsed once, and no references are returned,
+        only `refspy.models.verse.Verse.index()` integers.
+
+        Args:
+            executor: A `concurrent.futures.Executor`, e.g. a
+                `ProcessPoolExecutor`, or None to parse in this thread.
+            chunk_size: The number of distinct strings sent to the executor
+                at a time.
+        """
+        return parse_strings(self.matcher, strings, executor, chunk_size)
+
+    def parse_cache_info(self) -> tuple[int, int, int, int]:
+        """Statistics of the cache of `r()` and `first_reference()`.
+
+        A `(hits, misses, maxsize, currsize)` named tuple, as from
+        `functools.lru_cache`; the hit rate is `hits / (hits + misses)`.
+        """
+        return self._parse_first.cache_info()
+
+    def parse_cache_clear(self) -> None:
+        """Empty the cache of `r()` and `first_reference()`, and reset its
+        statistics."""
+        self._parse_first.cache_clear()
 
     def find_references(
         self,
@@ -538,6 +728,113 @@ class Manager:
         )
         return list(generator)
 
+    def find_matches(
+        self,
+        text: str,
+        include_books: bool = False,
+        include_nones: bool = False,
+        use_context: bool = True,
+    ) -> list[tuple[int, int, str, Reference | None]]:
+        """
+        Return a list of tuples of (start, end, match_str, reference) found by
+        `refspy.matcher.Matcher.generate_matches()`, where `start` and `end`
+        are the offsets of `match_str` in `text`.
+        """
+        generator = self.matcher.generate_matches(
+            text, include_books, include_nones, use_context
+        )
+        return list(generator)
+
+    def find_references_columnar(
+        self,
+        texts: Iterable[str],
+        include_books: bool = False,
+        include_nones: bool = False,
+        use_context: bool = True,
+    ) -> MatchColumns:
+        """
+        Return the matches of many texts as columns of integers, with one row
+        per range: `doc_id`, `match_start`, `match_end`, `range_start_index`,
+        `range_end_index`, and `flags`; see `refspy.columns.MatchColumns`.
+
+        The columns are `array` objects; `to_numpy()` makes a NumPy structured
+        array of them, for vectorized grouping, filtering, and histograms.
+        """
+        return match_columns(
+            self.matcher, texts, include_books, include_nones, use_context
+        )
+
+    def find_paragraph_matches(
+        self,
+        text: str,
+        include_books: bool = False,
+        include_nones: bool = False,
+        use_context: bool = True,
+        executor: "Executor | None" = None,
+        segment_size: int = PARAGRAPH_SEGMENT_SIZE,
+    ) -> list[tuple[int, int, str, Reference | None]]:
+        """
+        Return a list of tuples of (start, end, match_str, reference), like
+        `find_matches()`, but with book context limited to each paragraph.
+
+        See `refspy.matcher.Matcher.generate_paragraph_matches()`. Because
+        paragraphs are independent, a long text is split into segments of
+        whole paragraphs, which are matched in the executor if one is given;
+        the results are the same with or without one.
+
+        Args:
+            executor: A `concurrent.futures.Executor`, e.g. a
+                `ProcessPoolExecutor`, or None to match in this thread.
+            segment_size: The minimum length of each segment.
+        """
+        function = partial(
+            match_segment, self.matcher, include_books, include_nones, use_context
+        )
+        segments = segment_paragraphs(text, segment_size)
+        if executor is None or len(segments) == 1:
+            results = map(function, segments)
+        else:
+            results = executor.map(function, segments)
+        return [match for matches in results for match in matches]
+
+    def find_markup_matches(
+        self,
+        markup_text: str,
+        markup: str = "html",
+        skip_code: bool = False,
+        include_books: bool = False,
+        include_nones: bool = False,
+        use_context: bool = True,
+    ) -> list[tuple[int, int, str, Reference | None]]:
+        """
+        Return a list of tuples of (start, end, match_str, reference), like
+        `find_matches()`, from the text of HTML or Markdown.
+
+        Tags, attributes and comments are skipped (and code, with
+        `skip_code`), without stripping them first, so `start` and `end` are
+        offsets in `markup_text`; see `refspy.markup`.
+
+        Raises:
+            ValueError: If markup is not one of `refspy.markup.MARKUP_TYPES`.
+        """
+        generator = self.matcher.generate_markup_matches(
+            markup_text, markup, skip_code, include_books, include_nones, use_context
+        )
+        return list(generator)
+
+    def document_matcher(
+        self,
+        yield_books: bool = False,
+        yield_nones: bool = False,
+        use_context: bool = True,
+    ) -> DocumentMatcher:
+        """Create a matcher for a document that will be edited and re-matched.
+
+        Updating a `refspy.document.DocumentMatcher` with the edited text only
+        matches the changed paragraphs again, and reports the changed matches.
+        """
+        return DocumentMatcher(self.matcher, yield_books, yield_nones, use_context)
+
     def generate_references(
         self,
         text: str,
@@ -565,6 +862,76 @@ class Manager:
             text, yield_books, yield_nones, use_context
         )
 
+    async def afind_references(
+        self,
+        text: str,
+        include_books: bool = False,
+        include_nones: bool = False,
+        use_context: bool = True,
+        executor: "Executor | None" = None,
+        executor_threshold: int = ASYNC_EXECUTOR_THRESHOLD,
+    ) -> list[tuple[str, Reference | None]]:
+        """
+        Return a list of tuples of (match_str, reference) without blocking
+        the event loop.
+
+        Texts shorter than `executor_threshold` are matched in the event loop
+        by `refspy.manager.Manager.agenerate_references()`, which hands back
+        control regularly; longer texts are matched in an executor.
+
+        Args:
+            executor: A `concurrent.futures.Executor`, or None for the event
+                loop's default executor.
+            executor_threshold: The text length at which to use the executor.
+        """
+        if len(text) >= executor_threshold:
+            import asyncio
+
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                executor,
+                partial(
+                    self.find_references,
+                    text,
+                    include_books,
+                    include_nones,
+                    use_context,
+                ),
+            )
+        return [
+            match
+            async for match in self.agenerate_references(
+                text, include_books, include_nones, use_context
+            )
+        ]
+
+    async def agenerate_references(
+        self,
+        text: str,
+        yield_books: bool = False,
+        yield_nones: bool = False,
+        use_context: bool = True,
+        batch_size: int = ASYNC_BATCH_SIZE,
+    ) -> AsyncGenerator[tuple[str, Reference | None], None]:
+        """
+        Generate tuples of (match_str, reference) for `async for` loops.
+
+        See `refspy.manager.Manager.generate_references()`.
+
+        Args:
+            batch_size: The number of matches to yield before handing control
+                back to the event loop.
+        """
+        import asyncio
+
+        generator = self.matcher.generate_references(
+            text, yield_books, yield_nones, use_context
+        )
+        for count, match in enumerate(generator, 1):
+            yield match
+            if count % batch_size == 0:
+                await asyncio.sleep(0)
+
     # -----------------------------------
     # Reference creator functions
     # -----------------------------------
@@ -676,6 +1043,25 @@ class Manager:
         """
         return self.navigator.prev_chapter(ref)
 
+    def move_chapters(self, ref: Reference, count: int) -> Reference | None:
+        """Get the chapter `count` chapters after (or, if negative, before) the
+        one containing this reference.
+
+        This steps across books and libraries, using dense chapter ordinals
+        (see `refspy.tables.ChapterOrdinals`).
+        """
+        return self.navigator.move_chapters(ref, count)
+
+    def chapter_distance(self, ref: Reference, other: Reference) -> int:
+        """Get the number of chapters from the one containing this reference to
+        the one containing the other (negative if the other comes first)."""
+        return self.navigator.chapter_distance(ref, other)
+
+    def chapter_window(self, ref: Reference, size: int) -> list[Reference]:
+        """Get the chapters within `size` chapters of the one containing this
+        reference, in order."""
+        return self.navigator.chapter_window(ref, size)
+
     # -----------------------------------
     # Manipulation functions
     # -----------------------------------
@@ -689,23 +1075,13 @@ class Manager:
         """Create a reference to the book containing this reference's first
         range."""
         v1 = ref.ranges[0].start
-        return reference(
-            range(
-                verse(v1.library, v1.book, 1, 1),
-                verse(v1.library, v1.book, 999, 999),
-            )
-        )
+        return book_reference(v1.library, v1.book)
 
     def chapter_reference(self, ref: Reference) -> Reference:
         """Create a reference to the chapter containing this reference's first
         range."""
         v1 = ref.ranges[0].start
-        return reference(
-            range(
-                verse(v1.library, v1.book, v1.chapter, 1),
-                verse(v1.library, v1.book, v1.chapter, 999),
-            )
-        )
+        return chapter_reference(v1.library, v1.book, v1.chapter)
 
     # -----------------------------------
     # Formatting functions
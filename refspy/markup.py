@@ -0,0 +1,80 @@
+"""Find the text spans of HTML or Markdown, for matching markup in place.
+
+Markup is matched without building a stripped copy of it: a small tokenizer
+(one regular expression) finds the spans to skip, such as tags and their
+attributes, comments, and `<script>` and `<style>` elements, and optionally
+code. The text between them is matched where it lies, with
+`re.Pattern.finditer(text, pos, endpos)`, so match offsets point into the
+original markup, and matches can be replaced in place.
+
+Example:
+    ```
+    html = '<p class="Rom 1:1">See <a href="#">Rom 3:4</a>.</p>'
+    matches = __.find_markup_matches(html)
+    assert matches[0][:3] == (34, 41, "Rom 3:4")
+    ```
+
+Note:
+    A reference is never matched across markup, so `<b>Rom</b> 3:4` is
+    not matched, and `Rom&nbsp;3:4` is not matched, as character references
+    are not decoded. The book context (for number-only references like `v.4`)
+    carries across markup, as it does across the lines of plain text.
+"""
+
+import re
+from collections.abc import Generator
+from re import Pattern
+
+MARKUP_TYPES = ("html", "markdown")
+"""The kinds of markup that can be skipped."""
+
+_HTML_SKIP = [
+    r"<!--.*?(?:-->|\Z)",
+    r"<(?P<raw>script|style)\b[^>]*>.*?(?:</(?P=raw)\s*>|\Z)",
+    r"<[!?][^>]*>",
+    r"</?[A-Za-z][^>\"']*(?:(?:\"[^\"]*\"|'[^']*')[^>\"']*)*>",
+]
+_HTML_CODE = [
+    r"<(?P<code>pre|code)\b[^>]*>.*?(?:</(?P=code)\s*>|\Z)",
+]
+_MARKDOWN_SKIP = [
+    r"(?<=\])\([^()\s]*(?:\s+\"[^\"]*\")?\)",
+]
+_MARKDOWN_CODE = [
+    r"^[ ]{0,3}(?P<fence>`{3,}|~{3,}).*?(?:^[ ]{0,3}(?P=fence)[^\n]*$|\Z)",
+    r"(?P<ticks>`+).+?(?P=ticks)",
+]
+
+
+def markup_skip_regexp(markup: str = "html", skip_code: bool = False) -> Pattern:
+    """A regular expression matching the spans of markup not to match.
+
+    HTML skips tags (with their attributes), comments, declarations, and
+    `<script>` and `<style>` elements. Markdown skips the same (as Markdown
+    may contain HTML), and link destinations like `(https://...)`. With
+    `skip_code`, HTML also skips `<pre>` and `<code>` elements, and Markdown
+    also skips fenced code blocks and inline code spans.
+
+    Raises:
+        ValueError: If markup is not one of `MARKUP_TYPES`.
+    """
+    if markup not in MARKUP_TYPES:
+        raise ValueError(f"Markup type '{markup}' not found.")
+    patterns = (_HTML_CODE if skip_code else []) + _HTML_SKIP
+    if markup == "markdown":
+        patterns = (_MARKDOWN_CODE if skip_code else []) + patterns + _MARKDOWN_SKIP
+    return re.compile("|".join(patterns), re.IGNORECASE | re.DOTALL | re.MULTILINE)
+
+
+def generate_text_spans(
+    text: str, skip_regexp: Pattern
+) -> Generator[tuple[int, int], None, None]:
+    """Yield the `(start, end)` of each non-empty span of text between the
+    spans matched by `skip_regexp` (see `markup_skip_regexp()`)."""
+    start = 0
+    for match in skip_regexp.finditer(text):
+        if match.start() > start:
+            yield start, match.start()
+        start = match.end()
+    if start < len(text):
+        yield start, len(text)
@@ -3,18 +3,19 @@
 import math
 import re
 from re import Match
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+from types import ModuleType
 
+from refspy.backends import RegexBackend, get_backend
+from refspy.instrumentation import MatcherStats, instrument, uninstrument
+from refspy.markup import generate_text_spans, markup_skip_regexp
 from refspy.models.book import Book
 from refspy.models.language import Language
-from refspy.models.range import Range, range, verse_range
-from refspy.models.reference import (
-    Reference,
-    book_reference,
-    reference,
-)
+from refspy.models.range import Range, range
+from refspy.models.reference import Reference, reference
 from refspy.models.syntax import Syntax
 from refspy.models.verse import verse
+from refspy.tables import ReferenceTables
 
 from refspy.types.number import Number
 
@@ -22,18 +23,36 @@ from refspy.utils import (
     add_space_after_book_number,
     get_unnumbered_book_aliases,
     parse_number,
+    split_paragraphs,
     normalize_spacing,
     trim_trailing_period,
 )
 
 
+class ModelBuilder:
+    """
+    Build the verses, ranges and references of matches as pydantic models.
+
+    This is the default `Matcher.builder`. A builder with the same three
+    methods can make other objects with the same attributes (see
+    `refspy.columns`); like the models, its `verse()` and `range()` must
+    raise `ValueError` for numbers out of range or verses out of order.
+    """
+
+    verse = staticmethod(verse)
+    range = staticmethod(range)
+    reference = staticmethod(reference)
+
+
 class Matcher:
     """
     Match:
     - Opening and closing brackets
       - So we don't carry book context past the end of parentheses
-    - [PROPOSED] Ends of sentence and end of paragraph.
-      - So we don't carry book context for an undue distance within the text.
+    - Ends of paragraphs, with `generate_paragraph_matches()`.
+      - So we don't carry book context for an undue distance within the text,
+        and paragraphs can be matched independently (e.g. in parallel).
+    - [PROPOSED] Ends of sentences.
     - References
       - Book names (incl. substitutions like 'First' for '1':
         - with no reference: sets context; only returned as a reference if
@@ -52,6 +71,12 @@ class Matcher:
         - 1:1,2-3 etc (must not end with a number that starts a book name)
     Yield:
       - a (match_str, reference) tuple for each match.
+
+    Note:
+        A matcher is immutable after construction, and all matching state is
+        local to each call, so one matcher can be used from many threads at
+        once; see `refspy.manager.Manager`. The exception is
+        `instrument()`, which is for profiling a single thread.
     """
 
     def __init__(
@@ -60,12 +85,34 @@ class Matcher:
         book_aliases: dict[str, tuple[Number, Number]],
         language: Language,
         syntax: Syntax | None = None,
+        tables: ReferenceTables | None = None,
+        data: ModuleType | None = None,
+        backend: RegexBackend | None = None,
     ):
+        """
+        Args:
+            data: A module of `refspy.generated` for these books, language
+                and syntax, whose expanded book aliases and reference regexp
+                are used instead of building them (default: build them).
+            backend: The regexp engine to compile and scan with (default:
+                `refspy.backends.get_backend()`).
+        """
+        self.backend = backend or get_backend()
+        self.builder = ModelBuilder
+        """Builds matched references; see `ModelBuilder`."""
         self.books = books
+        self.tables = tables or ReferenceTables(books)
         self.language = language
         self.syntax = syntax or language.syntax
-        self.book_alias_keys = book_aliases.keys()
-        self.book_aliases = self.expand_book_aliases(book_aliases)
+        self.book_alias_keys = list(book_aliases)
+        self.book_aliases = (
+            dict(data.EXPANDED_BOOK_ALIASES)
+            if data is not None
+            else self.expand_book_aliases(book_aliases)
+        )
+        self.unnumbered_book_aliases = frozenset(
+            get_unnumbered_book_aliases(self.book_aliases)
+        )
 
         # Regexes for matching are generated on intiialisation,
         # using the language object for punctuation.
@@ -86,20 +133,16 @@ class Matcher:
         self.RANGE = f"{self.NUMBER}{self.DASH}{self.NUMBER}"
         self.LIST = f"(?:{self.RANGE}|{self.NUMBER})(?:{self.COMMA}(?:{self.RANGE}|{self.NUMBER}))*"
 
-        self.RANGE_OR_NUMBER_COMPILED = re.compile(f"({self.RANGE}|{self.NUMBER})")
-
-        self.NUMBER_CAPTURE = re.compile(f"({self.NUMBER})")
-        self.RANGE_CAPTURE = re.compile(f"({self.NUMBER}){self.DASH}({self.NUMBER})")
-        self.CHAPTER_RANGE_CAPTURE = re.compile(
-            f"{self.END}({self.NUMBER}){self.COLON}({self.NUMBER}){self.DASH}"
-            + f"({self.NUMBER}){self.COLON}({self.NUMBER}){self.END}"
-        )
-        self.CHAPTER_VERSES_CAPTURE = re.compile(
-            f"{self.END}({self.NUMBER}){self.COLON}({self.LIST}){self.END}"
+        self.NUMBER_PAIR_CAPTURE = self.backend.compile(
+            f"({self.NUMBER})(?:{self.DASH}({self.NUMBER}))?"
         )
 
-        self.brackets_regexp = re.compile(self.build_brackets_regexp())
-        self.reference_regexp = re.compile(self.build_reference_regexp())
+        self.brackets_regexp = self.backend.compile(self.build_brackets_regexp())
+        self.reference_regexp = self.backend.compile(
+            data.REFERENCE_PATTERN
+            if data is not None
+            else self.build_reference_regexp()
+        )
 
     def build_reference_regexp(self) -> str:
         """
@@ -120,6 +163,17 @@ class Matcher:
             ( None,             None,         None,   '2:3-6')
             ```
 
+        These are the named groups `book_match`, `book`, `book_numbers`, and
+        `numbers`. Within the numbers, the structure of the reference is also
+        captured, so it can be made from a single match (prefixed with `book_`
+        or `numbers_`):
+
+            ```
+            c1, v1, c2, v2    1:2-3:4   (a chapter range)
+            chapter, verses   3:4,6-9   (a chapter and a verse list)
+            list              3-4       (a number list, after a book or marker)
+            ```
+
         Additionally, we want to minimize bad matches like John Smith, or John
         B. Smith; a negative lookahead for a following capital eliminates a lot
         of false positives; may be necessary to treat known names differently
@@ -128,29 +182,46 @@ class Matcher:
         NAME_PATTERN = self.build_book_name_regexp()
         VERSE_MARKER = self.build_verse_marker_regexp()
         NUMBER_LIST = self.build_number_list_regexp()
+
+        def chapter_range(prefix: str) -> str:
+            return "".join(
+                [
+                    f"(?P<{prefix}_c1>{self.NUMBER}){self.COLON}",
+                    f"(?P<{prefix}_v1>{self.NUMBER}){self.DASH}",
+                    f"(?P<{prefix}_c2>{self.NUMBER}){self.COLON}",
+                    f"(?P<{prefix}_v2>{self.NUMBER})",
+                ]
+            )
+
+        def chapter_verses(prefix: str) -> str:
+            return (
+                f"(?P<{prefix}_chapter>{self.NUMBER}){self.COLON}"
+                + f"(?P<{prefix}_verses>{NUMBER_LIST})"
+            )
+
         REGEXP = "".join(
             [
-                "(",
-                f"{self.END}({NAME_PATTERN})(?!{self.SPACE}[A-Z])",  # John, but not John B.
-                "(",
+                "(?P<book_match>",
+                f"{self.END}(?P<book>{NAME_PATTERN})(?!{self.SPACE}[A-Z])",  # John, but not John B.
+                "(?P<book_numbers>",
                 "".join(
                     [
-                        f"{self.OPTIONAL_SPACE}{self.NUMBER}{self.COLON}{self.NUMBER}{self.DASH}{self.NUMBER}{self.COLON}{self.NUMBER}",  # Rom 1:2-3:4
+                        f"{self.OPTIONAL_SPACE}{chapter_range('book')}",  # Rom 1:2-3:4
                         "|",
-                        f"{self.OPTIONAL_SPACE}{self.NUMBER}{self.COLON}{NUMBER_LIST}",  # Rom 3:4,6-9
+                        f"{self.OPTIONAL_SPACE}{chapter_verses('book')}",  # Rom 3:4,6-9
                         "|",
-                        f"{self.OPTIONAL_SPACE}{NUMBER_LIST}",  # Phlm 3-4 (verse), Rom 3-4 (chapter)
+                        f"{self.OPTIONAL_SPACE}(?P<book_list>{NUMBER_LIST})",  # Phlm 3-4 (verse), Rom 3-4 (chapter)
                     ]
                 ),
                 ")?",
-                ")|(",
+                ")|(?P<numbers>",
                 "".join(
                     [
-                        f"{self.NUMBER}{self.COLON}{self.NUMBER}{self.DASH}{self.NUMBER}{self.COLON}{self.NUMBER}",  # 1:2-3:4
+                        chapter_range("numbers"),  # 1:2-3:4
                         "|",
-                        f"{self.NUMBER}{self.COLON}{NUMBER_LIST}",  # 3:4,6-9
+                        chapter_verses("numbers"),  # 3:4,6-9
                         "|",
-                        f"(?:{VERSE_MARKER}){NUMBER_LIST}",  # vv.3-4
+                        f"(?:{VERSE_MARKER})(?P<numbers_list>{NUMBER_LIST})",  # vv.3-4
                     ]
                 ),
                 ")",
@@ -180,7 +251,8 @@ class Matcher:
 
     def build_book_name_regexp(self):
         """
-        Sort bookname DESC to match the longest first.
+        Match the longest book name first, as a trie (see
+        `book_names_regexp()`).
         Replace spaces with multi-space matchers in book names.
         Group book names by prefixes.
         Match substitute prefixes for each prefix number:
@@ -213,7 +285,7 @@ class Matcher:
                 + r")"
                 + self.OPTIONAL_SPACE
                 + "(?:"
-                + "|".join([escape_book_name(_) for _ in long_names_first(aliases)])
+                + book_names_regexp(aliases)
                 + ")"
                 # + r"(?![^A-Za-z])"  # <-- Need a non-alpha lookahead?
                 + r"\b"
@@ -225,7 +297,7 @@ class Matcher:
         ]
         regexp_parts.append(
             r"(?:"
-            + "|".join([escape_book_name(_) for _ in long_names_first(aliases)])
+            + book_names_regexp(aliases)
             + ")"
             # + r"(?![^A-Za-z])"  # <-- Need a non-alpha lookahead?
             + r"\b"
@@ -311,30 +383,72 @@ class Matcher:
         yield_nones: bool = False,
         use_context: bool = True,
     ) -> Generator[tuple[str, Reference | None], None, None]:
+        """
+        Yield a `(match_str, reference)` tuple for each match.
+
+        This is the base function used by `__.find_references()` and
+        `__.first_reference()`. See `generate_matches()`.
+        """
+        for _, _, match_str, ref in self.generate_matches(
+            text, yield_books, yield_nones, use_context
+        ):
+            yield match_str, ref
+
+    def generate_matches(
+        self,
+        text: str,
+        yield_books: bool = False,
+        yield_nones: bool = False,
+        use_context: bool = True,
+        context: list[Range] | None = None,
+        pos: int = 0,
+        endpos: int | None = None,
+        resolve_book: Callable[[str], tuple[Number, Number]] | None = None,
+    ) -> Generator[tuple[int, int, str, Reference | None], None, None]:
         """
         Match references and parentheses separately, then take the next lowest
         item (by starting match position) from the regexp match generators, and
         process. Yield references for book names and chapter/verse numbers.
 
-        This is the base function used by `__.find_references()` and
-        `__.first_reference()`. It keeps all the logic in one place.
+        It keeps all the matching logic in one place.
 
         Args:
             text: In which to find references
             yield_books: Whether to match book names alone
             yield_nones: Whether to match malformed references
             use_context: Whether to use context for number-only references.
+            context: The book context to start from, which is updated in place
+                as matching proceeds; pass the same list to continue matching
+                where the previous text left off (see `refspy.document`).
+            pos: Where to start matching in text, as for `re.Pattern.finditer()`.
+            endpos: Where to stop matching in text (default: the end). Offsets
+                are always from the start of the text, so spans of a larger
+                text can be matched without copying them (see
+                `generate_markup_matches()`).
+            resolve_book: Resolves the alias (a key of `book_aliases`) of each
+                book name matched to its `(library.id, book.id)`, instead of
+                `book_aliases`; it is called in text order, whether or not the
+                match is yielded, before the match is yielded (see
+                `refspy.multimatcher`).
+
+        Yield:
+            A `(start, end, match_str, reference)` tuple for each match, where
+            `text[start:end] == match_str`.
         """
-        brackets_matches = self.brackets_regexp.finditer(text)
-        reference_matches = self.reference_regexp.finditer(text)
+        if endpos is None:
+            endpos = len(text)
+        brackets_matches = self.backend.finditer(
+            self.brackets_regexp, text, pos, endpos
+        )
+        reference_matches = self.backend.finditer(
+            self.reference_regexp, text, pos, endpos
+        )
 
-        bracket_stack = []
+        bracket_stack = [] if context is None else context
 
         brackets_match = next(brackets_matches, None)
         reference_match = next(reference_matches, None)
 
-        unnumbered_book_aliases = get_unnumbered_book_aliases(self.book_aliases)
-
         while reference_match or brackets_match:
             # Handle the start or end of a bracket
             # 0 means bracket, 1 means reference
@@ -356,61 +470,53 @@ class Matcher:
                 brackets_match = next(brackets_matches, None)
 
             if reference_match and index_of_minimum == 1:
-                match_str, book_name, match_with_book, match_without_book = (
-                    reference_match.groups()
-                )
+                match_str = reference_match["book_match"]
+                book_name = reference_match["book"]
+                match_without_book = reference_match["numbers"]
+                book_span = reference_match.span("book_match")
+                number_span = reference_match.span("numbers")
                 try:
                     if book_name:
                         respaced_book_name = add_space_after_book_number(
                             normalize_spacing(trim_trailing_period(book_name)),
-                            unnumbered_book_aliases,
+                            self.unnumbered_book_aliases,
                             self.language.number_prefixes,
                         )
 
                         if respaced_book_name in self.book_aliases:
-                            library_id, book_id = self.book_aliases[respaced_book_name]
+                            if resolve_book is None:
+                                library_id, book_id = self.book_aliases[
+                                    respaced_book_name
+                                ]
+                            else:
+                                library_id, book_id = resolve_book(respaced_book_name)
                             book = self.books[library_id, book_id]
-                            last_range = book_reference(
-                                library_id, book_id
-                            ).last_range()
-                            if match_with_book:
-                                if matches := self.match_chapter_range(match_with_book):
-                                    # Rom 1:2-3:4
-                                    book_ref = make_chapter_range(last_range, matches)
-                                    if book_ref is not None or yield_nones:
-                                        yield (match_str, book_ref)
-                                elif matches := self.match_chapter_verses(
-                                    match_with_book
-                                ):
-                                    # Rom 3:4,6-9
-                                    book_ref = self.make_chapter_verses(
-                                        last_range, matches
-                                    )
-                                    if book_ref is not None or yield_nones:
-                                        yield (match_str, book_ref)
-                                elif matches := self.match_number_ranges(
-                                    match_with_book
-                                ):
+                            last_range = self.tables.book_range(library_id, book_id)
+                            if reference_match["book_numbers"]:
+                                if numbers := reference_match["book_list"]:
                                     if book.chapters == 1:
                                         # Phlm 3-4 (verse)
-                                        v = verse_range(
-                                            last_range.start.library,
-                                            last_range.start.book,
-                                            1,
-                                            1,
+                                        v1 = self.builder.verse(
+                                            library_id, book_id, 1, 1
                                         )
-                                        book_ref = self.make_number_ranges(v, matches)
-                                        if book_ref is not None or yield_nones:
-                                            yield (match_str, book_ref)
-                                    if book.chapters > 1:
+                                        v = self.builder.range(v1, v1)
+                                        book_ref = self.make_number_pairs(
+                                            v, self.match_number_pairs(numbers)
+                                        )
+                                    else:
                                         # Rom 3-4 (chapter)
-                                        book_ref = self.make_number_ranges(
-                                            last_range, matches, as_chapters=True
+                                        book_ref = self.make_number_pairs(
+                                            last_range,
+                                            self.match_number_pairs(numbers),
+                                            as_chapters=True,
                                         )
-                                        if book_ref is not None or yield_nones:
-                                            yield (match_str, book_ref)
                                 else:
-                                    yield (match_str, None)
+                                    # Rom 1:2-3:4, Rom 3:4,6-9
+                                    book_ref = self.make_structured_reference(
+                                        last_range, reference_match, "book"
+                                    )
+                                if book_ref is not None or yield_nones:
+                                    yield (*book_span, match_str, book_ref)
                             else:  # no associated reference
                                 if bracket_stack:
                                     bracket_stack[-1] = last_range
@@ -421,45 +527,46 @@ class Matcher:
                                     not in self.language.ambiguous_aliases
                                 ):
                                     yield (
+                                        *book_span,
                                         match_str,
-                                        book_reference(library_id, book_id),
+                                        self.builder.reference(
+                                            self.builder.range(
+                                                self.builder.verse(
+                                                    library_id, book_id, 1, 1
+                                                ),
+                                                self.builder.verse(
+                                                    library_id, book_id, 999, 999
+                                                ),
+                                            )
+                                        ),
                                     )
                     elif match_without_book and use_context:
                         if bracket_stack:
                             last_range = bracket_stack[-1]
-                            library_id, book_id = (
-                                last_range.start.library,
-                                last_range.start.book,
-                            )
-                            if matches := self.match_chapter_range(match_without_book):
-                                # 1:2-3:4
-                                book_ref = make_chapter_range(last_range, matches)
-                                if book_ref is not None or yield_nones:
-                                    yield (match_without_book, book_ref)
-                            elif matches := self.match_chapter_verses(
-                                match_without_book
-                            ):
-                                # 3:4,6-9
-                                book_ref = self.make_chapter_verses(last_range, matches)
-                                if book_ref is not None or yield_nones:
-                                    yield (match_without_book, book_ref)
-                            elif matches := self.match_number_ranges(
-                                match_without_book
-                            ):
+                            if numbers := reference_match["numbers_list"]:
                                 # v.2, vv.3-4
-                                book_ref = self.make_number_ranges(last_range, matches)
-                                if book_ref is not None or yield_nones:
-                                    yield (match_without_book, book_ref)
+                                book_ref = self.make_number_pairs(
+                                    last_range, self.match_number_pairs(numbers)
+                                )
                             else:
-                                if yield_nones:
-                                    yield (match_without_book, None)
+                                # 1:2-3:4, 3:4,6-9
+                                book_ref = self.make_structured_reference(
+                                    last_range, reference_match, "numbers"
+                                )
+                            if book_ref is not None or yield_nones:
+                                yield (*number_span, match_without_book, book_ref)
                         else:
                             if yield_nones:
-                                yield (match_without_book, None)
+                                yield (*number_span, match_without_book, None)
 
-                except ValueError:
+                except ValueError as error:
+                    self.on_value_error(error)
                     if yield_nones:
-                        yield (match_str or match_without_book, None)
+                        yield (
+                            *(book_span if match_str else number_span),
+                            match_str or match_without_book,
+                            None,
+                        )
 
                 if book_ref:
                     last_range = book_ref.ranges[-1]
@@ -470,42 +577,93 @@ class Matcher:
 
                 reference_match = next(reference_matches, None)
 
-    def match_chapter_range(self, text) -> Match | None:
-        """Match a pair of chapter-and-verse references.
+    def generate_paragraph_matches(
+        self,
+        text: str,
+        yield_books: bool = False,
+        yield_nones: bool = False,
+        use_context: bool = True,
+    ) -> Generator[tuple[int, int, str, Reference | None], None, None]:
+        """
+        As `generate_matches()`, but with the book context reset at the end
+        of each paragraph (a blank line), and no references matched across
+        paragraph breaks.
 
-        Example:
-            `Rom 1:2-3:4`
+        Each paragraph is matched independently, so any text made of whole
+        paragraphs can be matched separately; see `match_segment()`.
         """
-        if match := self.CHAPTER_RANGE_CAPTURE.search(text):
-            return match
-        return None
+        start = 0
+        for paragraph in split_paragraphs(text):
+            for match in self.generate_matches(
+                paragraph, yield_books, yield_nones, use_context
+            ):
+                yield (match[0] + start, match[1] + start, *match[2:])
+            start += len(paragraph)
+
+    def generate_markup_matches(
+        self,
+        text: str,
+        markup: str = "html",
+        skip_code: bool = False,
+        yield_books: bool = False,
+        yield_nones: bool = False,
+        use_context: bool = True,
+    ) -> Generator[tuple[int, int, str, Reference | None], None, None]:
+        """
+        As `generate_matches()`, but only in the text of HTML or Markdown,
+        skipping tags, attributes and comments (and code, with `skip_code`);
+        see `refspy.markup`.
 
-    def match_chapter_verses(self, text) -> Match | None:
-        """Match a verse list preceded by a chapter marker.
+        Offsets are into the markup itself, and the book context carries
+        across markup, so each span of text is matched as part of the whole.
 
-        Example:
-            `Rom 3:4,6-9`
+        Raises:
+            ValueError: If markup is not one of `refspy.markup.MARKUP_TYPES`.
         """
-        if match := self.CHAPTER_VERSES_CAPTURE.search(text):
-            return match
-        return None
+        skip_regexp = markup_skip_regexp(markup, skip_code)
+        context: list[Range] = []
+        for start, end in generate_text_spans(text, skip_regexp):
+            yield from self.generate_matches(
+                text, yield_books, yield_nones, use_context, context, start, end
+            )
+
+    def on_value_error(self, error: ValueError) -> None:
+        """Called when a match cannot be resolved because of a ValueError.
+
+        This does nothing, unless the matcher is instrumented. It is only
+        reached on the error path, so it adds nothing to normal matching.
+        """
+
+    def instrument(self) -> MatcherStats:
+        """Start collecting counters and timings for this matcher.
+
+        See `refspy.instrumentation`. When not instrumented (the default),
+        matching carries no instrumentation cost at all.
+        """
+        return instrument(self)
 
-    def match_number_ranges(self, text) -> list[str]:
-        """Match a list of numbers and number ranges.
+    def uninstrument(self) -> None:
+        """Stop collecting counters and timings for this matcher."""
+        uninstrument(self)
+
+    def match_number_pairs(self, text: str) -> list[tuple[str, str]]:
+        """Split a list of numbers and number ranges into `(start, end)` pairs.
+
+        The end is an empty string for single numbers.
 
         Example:
-            `Phlm 1,3-4` (verse), `Rom 1,3-4` (chapter)
+            `1,3-4` becomes `[("1", ""), ("3", "4")]`
         """
-        return self.RANGE_OR_NUMBER_COMPILED.findall(text)
+        return self.NUMBER_PAIR_CAPTURE.findall(text)
 
-    def make_number_ranges(
-        self, last: Range, matches: list[str], as_chapters: bool = False
+    def make_number_pairs(
+        self, last: Range, pairs: list[tuple[str, str]], as_chapters: bool = False
     ) -> Reference | None:
-        """Create a reference from a list of numbers and number ranges.
+        """Create a reference from the result of `match_number_pairs()`.
 
         Args:
             last: a verse to which this number list is relative.
-            matches: the result of `match_number_ranges()`
+            pairs: the result of `match_number_pairs()`
             as_chapters: Treat these numbers as chapters rather than verses.
 
         Example:
@@ -518,95 +676,117 @@ class Matcher:
             second number has fewer digits than the first.
         """
         ranges = []
-        for text in matches:
-            if range_matches := self.RANGE_CAPTURE.match(text):
-                start, end = range_matches.group(1, 2)
-            elif number_matches := self.NUMBER_CAPTURE.match(text):
-                start = end = number_matches.group(1)
-            else:
-                continue
-            if parse_number(end) < parse_number(start):
+        for start, end in pairs:
+            end = end or start
+            start_number, end_number = parse_number(start), parse_number(end)
+            if end_number < start_number:
                 if new_end := infer_abbreviation(start, end):
-                    end = new_end
+                    end_number = parse_number(new_end)
                 else:
                     return None
             if as_chapters:
                 if last.is_same_book():
                     ranges.append(
-                        range(
-                            verse(
-                                last.start.library,
-                                last.start.book,
-                                parse_number(start),
-                                1,
+                        self.builder.range(
+                            self.builder.verse(
+                                last.start.library, last.start.book, start_number, 1
                             ),
-                            verse(
-                                last.end.library, last.end.book, parse_number(end), 999
+                            self.builder.verse(
+                                last.end.library, last.end.book, end_number, 999
                             ),
                         )
                     )
             else:
                 if last.is_same_chapter():
                     ranges.append(
-                        range(
-                            verse(
+                        self.builder.range(
+                            self.builder.verse(
                                 last.start.library,
                                 last.start.book,
                                 last.start.chapter,
-                                parse_number(start),
+                                start_number,
                             ),
-                            verse(
+                            self.builder.verse(
                                 last.end.library,
                                 last.end.book,
                                 last.end.chapter,
-                                parse_number(end),
+                                end_number,
                             ),
                         )
                     )
         if ranges:
-            return reference(*ranges)
+            return self.builder.reference(*ranges)
         else:
             return None
 
-    def make_chapter_verses(self, last: Range, match: Match) -> Reference | None:
-        """Create a reference from verse list preceded by a chapter marker.
-
-        See `match_chapter_verses`.
+    def make_chapter_list(
+        self, last: Range, chapter: str, numbers: str
+    ) -> Reference | None:
+        """Create a reference from a chapter number and a verse list.
 
         Example:
             `Rom 3:4,6-9`
         """
         if last.is_same_book():
-            chapter, numbers = match.groups()
-            if range_match := self.match_number_ranges(numbers):
-                last_range = range(
-                    verse(last.start.library, last.start.book, int(chapter), 1),
-                    verse(last.end.library, last.end.book, int(chapter), 999),
+            if pairs := self.match_number_pairs(numbers):
+                last_range = self.builder.range(
+                    self.builder.verse(
+                        last.start.library, last.start.book, int(chapter), 1
+                    ),
+                    self.builder.verse(
+                        last.end.library, last.end.book, int(chapter), 999
+                    ),
                 )
-                if reference := self.make_number_ranges(last_range, range_match):
+                if reference := self.make_number_pairs(last_range, pairs):
                     return reference
         return None
 
+    def make_structured_reference(
+        self, last: Range, match: Match, prefix: str
+    ) -> Reference | None:
+        """Create a chapter range or chapter-and-verses reference from the
+        named groups of a `reference_regexp` match.
+
+        Args:
+            prefix: `book` or `numbers`; see `build_reference_regexp()`.
+        """
+        if match[prefix + "_c1"]:
+            return make_chapter_range_numbers(
+                last,
+                match[prefix + "_c1"],
+                match[prefix + "_v1"],
+                match[prefix + "_c2"],
+                match[prefix + "_v2"],
+                self.builder,
+            )
+        return self.make_chapter_list(
+            last, match[prefix + "_chapter"], match[prefix + "_verses"]
+        )
 
-def make_chapter_range(last: Range, match: Match) -> Reference | None:
-    """Create pair of chapter-and-verse references from a match.
 
-    See `match_chapter_range`.
+def make_chapter_range_numbers(
+    last: Range,
+    c1: str,
+    v1: str,
+    c2: str,
+    v2: str,
+    builder: type[ModelBuilder] = ModelBuilder,
+) -> Reference | None:
+    """Create pair of chapter-and-verse references from four number strings.
 
     Example:
         `Rom 1:2-3:4`
     """
     if last.is_same_book():
-        c1, v1, c2, v2 = match.groups()
-        return reference(
-            range(
-                verse(
+        return builder.reference(
+            builder.range(
+                builder.verse(
                     last.start.library,
                     last.start.book,
                     parse_number(c1),
                     parse_number(v1),
                 ),
-                verse(
+                builder.verse(
                     last.end.library, last.end.book, parse_number(c2), parse_number(v2)
                 ),
             )
@@ -623,6 +803,40 @@ def escape_book_name(name: str) -> str:
     return r"\s+".join([re.escape(_) for _ in name.split(" ")])
 
 
+def book_names_regexp(names: list[str]) -> str:
+    """A regexp matching any of the names, longest first, as a trie.
+
+    An alternation of every name (`Rom|Romans|Ruth|...`) is tried one name
+    at a time at each position; factoring out common prefixes
+    (`R(?:om(?:ans)?|uth)`) lets the regexp engine try each character once,
+    so the cost grows slowly with the number of names. Optional suffixes are
+    greedy, so longer names are tried first, as with `long_names_first()`.
+    Spaces match multiple spaces, as with `escape_book_name()`.
+    """
+    trie: dict = {}
+    for name in names:
+        node = trie
+        for char in name:
+            node = node.setdefault(char, {})
+        node[""] = {}  # <-- the end of a name
+
+    def build(node: dict) -> str:
+        branches = [
+            (r"\s+" if char == " " else re.escape(char)) + build(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        if "" in node:
+            return "(?:" + "|".join(branches) + ")?"
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return build(trie)
+
+
 def long_names_first(names: list[str]) -> list[str]:
     """Remove duplicates and sort by length descending."""
     return sorted(set(names), key=len)[::-1]
@@ -649,3 +863,25 @@ def infer_abbreviation(start: str, end: str) -> str | None:
         else:
             return None
     return end
+
+
+def match_segment(
+    matcher: Matcher,
+    yield_books: bool,
+    yield_nones: bool,
+    use_context: bool,
+    segment: tuple[int, str],
+) -> list[tuple[int, int, str, Reference | None]]:
+    """Match an `(offset, text)` segment of whole paragraphs, with offsets in
+    the full text; see `refspy.manager.Manager.find_paragraph_matches()`.
+
+    A module function, so it can be sent to worker processes with a
+    (picklable) matcher.
+    """
+    offset, text = segment
+    return [
+        (start + offset, end + offset, match_str, ref)
+        for start, end, match_str, ref in matcher.generate_paragraph_matches(
+            text, yield_books, yield_nones, use_context
+        )
+    ]
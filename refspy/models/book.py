@@ -8,6 +8,7 @@ Attributes:
     abbrev: '1 Thess'
     aliases: ['1 Th'],
     chapters: 5
+    verses: [10, 20, 13, 18, 28]
 
 Note:
     Aliases should be capitalised.
@@ -17,9 +18,16 @@ If the book has a number (e.g. '1' Corinthians), then the
 substitute prefixes like 'I' or 'First'.
 
 A book with only one chapter will be formatted without chapter numbers.
+
+A book's `verses`, the verse counts of its chapters, are optional (see
+`refspy.libraries.versification`); they allow dense verse ordinals but are not
+used in matching, where a whole chapter is always verses `1-999`.
 """
 
-from pydantic import BaseModel
+from itertools import accumulate
+from typing import Self
+
+from pydantic import BaseModel, PrivateAttr, model_validator
 
 from refspy.types.number import Number
 
@@ -30,3 +38,51 @@ class Book(BaseModel):
     abbrev: str
     aliases: list[str]
     chapters: int
+    verses: list[int] | None = None
+    _verse_offsets: list[int] | None = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def check_verses(self) -> Self:
+        """Enforce one verse count in `1..999` per chapter, if given.
+
+        Raises:
+            ValueError: If the verse counts do not fit the chapters.
+        """
+        if self.verses is not None:
+            assert len(self.verses) == self.chapters
+            assert all(1 <= _ <= 999 for _ in self.verses)
+            self._verse_offsets = [0, *accumulate(self.verses)]
+        return self
+
+    def last_verse(self, chapter: int) -> int:
+        """The last verse of a chapter: its verse count, or 999 if unknown."""
+        if self.verses is not None and 1 <= chapter <= self.chapters:
+            return self.verses[chapter - 1]
+        return 999
+
+    def verse_total(self) -> int | None:
+        """The number of verses in the book, if its verse counts are known."""
+        return None if self._verse_offsets is None else self._verse_offsets[-1]
+
+    def verse_ordinal(self, chapter: int, verse: int) -> int:
+        """The zero-based position of a verse among all verses in the book.
+
+        Ordinals are dense: `0..verse_total() - 1`, so they can index arrays
+        sized for the book's actual verses.
+
+        Example:
+            ```
+            assert book.verse_ordinal(2, 1) == book.verses[0]
+            ```
+
+        Raises:
+            ValueError: If the book has no verse counts, or the chapter or
+                verse is out of range.
+        """
+        if self._verse_offsets is None:
+            raise ValueError(f"No verse counts for {self.name}")
+        if not 1 <= chapter <= self.chapters:
+            raise ValueError(f"No chapter {chapter} in {self.name}")
+        if not 1 <= verse <= self.verses[chapter - 1]:
+            raise ValueError(f"No verse {chapter}:{verse} in {self.name}")
+        return self._verse_offsets[chapter - 1] + verse - 1
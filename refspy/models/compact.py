@@ -0,0 +1,32 @@
+"""A base for the small, numerous data objects: verses, ranges, references.
+
+Pydantic gives every model instance its own `__pydantic_fields_set__`, a set
+of the field names that were supplied, which is larger than the instance's
+field values. Verses, ranges and references always have every field set, so
+their instances share one set per class instead, nearly halving the memory of
+each reference found in a text.
+
+Note:
+    The shared set already contains every field name, so pydantic's only
+    update of it, adding a field name on assignment, leaves it unchanged.
+"""
+
+from typing import Any, ClassVar
+
+from pydantic import BaseModel
+
+
+class CompactModel(BaseModel):
+    all_fields_set: ClassVar[set[str]] = set()
+    """The field-name set shared by fully populated instances of a class."""
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.all_fields_set = set(cls.model_fields)
+
+    def __init__(self, /, **data: Any) -> None:
+        # As BaseModel.__init__(), without an extra call on this hot path.
+        self.__pydantic_validator__.validate_python(data, self_instance=self)
+        if len(self.__pydantic_fields_set__) == len(self.all_fields_set):
+            object.__setattr__(self, "__pydantic_fields_set__", self.all_fields_set)
@@ -1,13 +1,15 @@
 """Data object for verse ranges."""
 
 from typing import Self
-from pydantic import BaseModel, model_validator
+from pydantic import model_validator
+
+from refspy.models.compact import CompactModel
 
 from refspy.types.number import Number
 from refspy.models.verse import verse, Verse
 
 
-class Range(BaseModel):
+class Range(CompactModel):
     start: Verse
     end: Verse
 
@@ -28,7 +30,7 @@ class Range(BaseModel):
         Raises:
             ValueError: If the start verse is greater than the end verse.
         """
-        assert tuple(self.start) <= tuple(self.end)
+        assert self.start.tuple() <= self.end.tuple()
         return self
 
     def __lt__(self, other: Self) -> bool:
@@ -6,16 +6,21 @@ They can be set to sort, merge, and join references when added together.
 """
 
 import collections
+from hashlib import blake2b
+from struct import pack
 from typing import Any, Self
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from refspy.models.compact import CompactModel
 
 from refspy.types.number import Number
 from refspy.models.range import Range, combine_ranges, merge_ranges, range as _range
 from refspy.models.verse import Verse, verse
+from refspy.utils import decode_varint, encode_varint
 
 
-class Reference(BaseModel):
+class Reference(CompactModel):
     """A reference object represents a list of verse ranges.
 
     References are entirely numeric entities. Matchers are used to find them in
@@ -187,6 +192,34 @@ class Reference(BaseModel):
         """
         return self.__class__(ranges=combine_ranges(self.ranges))
 
+    def to_bytes(self) -> bytes:
+        """A compact binary encoding of this reference; see `encode_reference()`.
+
+        Example:
+            ```
+            data = ref.to_bytes()
+            assert Reference.from_bytes(data) == ref
+            ```
+        """
+        out = bytearray()
+        encode_reference(self, out)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """Decode a reference encoded by `to_bytes()`.
+
+        Raises:
+            ValueError: If the data is not exactly one encoded reference.
+        """
+        try:
+            ref, pos = decode_reference(data)
+        except IndexError:
+            raise ValueError("Truncated reference data.")
+        if ref is None or pos != len(data):
+            raise ValueError("Invalid reference data.")
+        return ref
+
 
 # -----------------------------------
 # Shorthand constructor functions
@@ -303,6 +336,105 @@ def join_references(references: list[Reference]) -> Reference:
     return reference(*ranges)
 
 
+FINGERPRINT_PERSON = b"refspy.refs.v1"
+"""Personalises `fingerprint_references()` hashes; change it if the packing
+format changes, so that old and new fingerprints never match."""
+
+
+def fingerprint_references(
+    references: list[Reference | None], normalize: bool = False
+) -> str:
+    """
+    Return a stable hexadecimal fingerprint of a list of references.
+
+    Each reference is packed as its number of ranges, then the
+    `refspy.models.verse.Verse.index()` of each range's start and end, as
+    big-endian integers, and the packed references are hashed with 16-byte
+    BLAKE2b. A None (an unresolved match, from `yield_nones`) is packed as a
+    reference with no ranges, which no real reference has. Fingerprints are the same in every process and Python version,
+    so they can be stored to detect when a document's references change.
+
+    Args:
+        normalize: Ignore the order of references and any duplicates, so
+            that lists with the same set of references match.
+
+    Example:
+        ```
+        refs = [r for _, r in __.find_references(text)]
+        if fingerprint_references(refs) != stored_fingerprint:
+            # ... re-render the index
+        ```
+    """
+    packed = [
+        pack(
+            f">I{2 * len(ref.ranges)}Q",
+            len(ref.ranges),
+            *[n for _ in ref.ranges for n in (_.start.index(), _.end.index())],
+        )
+        if ref is not None
+        else pack(">I", 0)
+        for ref in references
+    ]
+    if normalize:
+        packed = sorted(set(packed))
+    digest = blake2b(digest_size=16, person=FINGERPRINT_PERSON)
+    digest.update(pack(">Q", len(packed)))
+    for _ in packed:
+        digest.update(_)
+    return digest.hexdigest()
+
+
+def encode_reference(ref: Reference | None, out: bytearray) -> None:
+    """
+    Append a reference (or None) to `out` in a compact binary form.
+
+    The encoding is a varint (see `refspy.utils.encode_varint()`) of the
+    number of ranges, then two varints per range, using the
+    `refspy.models.verse.Verse.index()` of its start and end: the start's
+    difference from the previous range's end (zigzag-encoded, as ranges need
+    not be sorted; the first is from zero), and the end's difference from the
+    start. A single verse takes about 8 bytes. None is a zero count.
+    """
+    if ref is None:
+        out.append(0)
+        return
+    encode_varint(len(ref.ranges), out)
+    previous = 0
+    for _ in ref.ranges:
+        start, end = _.start.index(), _.end.index()
+        delta = start - previous
+        encode_varint(delta << 1 if delta >= 0 else -(delta << 1) - 1, out)
+        encode_varint(end - start, out)
+        previous = end
+
+
+def decode_reference(data: bytes, pos: int = 0) -> tuple[Reference | None, int]:
+    """
+    Decode a reference (or None) encoded by `encode_reference()` at `pos`.
+
+    Raises:
+        IndexError: If the data ends within the reference.
+        ValueError: If the data does not encode valid verses.
+
+    Return:
+        The reference, and the position after it.
+    """
+    count, pos = decode_varint(data, pos)
+    if count == 0:
+        return None, pos
+    ranges = []
+    previous = 0
+    for _ in range(count):
+        delta, pos = decode_varint(data, pos)
+        length, pos = decode_varint(data, pos)
+        start = previous + ((delta >> 1) ^ -(delta & 1))
+        previous = start + length
+        ranges.append(
+            Range(start=Verse.from_index(start), end=Verse.from_index(previous))
+        )
+    return Reference(ranges=ranges), pos
+
+
 def count_references(references: list[Reference]) -> list[tuple[Reference, int]]:
     """
     Return tuples [(ref, count)].
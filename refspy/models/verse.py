@@ -9,7 +9,7 @@ Attributes:
 
 from typing import Self
 
-from pydantic import BaseModel
+from refspy.models.compact import CompactModel
 
 from refspy.types.index import Index
 from refspy.types.number import Number
@@ -18,7 +18,7 @@ from refspy.types.number import Number
 VerseTuple = tuple[Number, Number, Number, Number]
 
 
-class Verse(BaseModel):
+class Verse(CompactModel):
     """
     Library, Book, Chapter, Verse
     """
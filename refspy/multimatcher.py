@@ -0,0 +1,205 @@
+"""Match the references of several locales in a single scan.
+
+A corpus that mixes languages can be matched by one manager per locale, but
+then every text is scanned once per locale. A `MultiMatcher` combines the
+book aliases, verse markers and number prefixes of several locales into one
+matcher, so each text is scanned once, and tags each match with the locale
+of its book name.
+
+Example:
+    ```
+    multi = MultiMatcher.from_locales("catholic", ["en_US", "fr_FR"], "intl")
+    for start, end, match_str, ref, locale in multi.generate_locale_matches(text):
+        ...
+    ```
+
+Note:
+    Locales must share book numbering, as the shipped libraries do. Where
+    several locales have the same alias (e.g. `Es`, Esther in English and
+    Isaiah in French), it is resolved in the locale of the last book name
+    before it, if that locale has it, or else in the first locale listed
+    that has it, so `Romains 3:23; Es 53:5` finds Isaiah, as the French
+    manager does. One syntax is used for the whole scan (by default, the
+    first locale's), because `3,4` means a chapter and verse in European
+    syntax but two chapters in international syntax.
+"""
+
+from collections.abc import Callable, Generator
+
+from refspy.backends import RegexBackend
+from refspy.init import get_manager
+from refspy.manager import Manager
+from refspy.matcher import Matcher
+from refspy.models.language import Language
+from refspy.models.reference import Reference
+from refspy.models.range import Range
+from refspy.models.syntax import Syntax
+from refspy.types.number import Number
+
+
+def merge_languages(languages: list[Language]) -> Language:
+    """A language with the verse markers, ambiguous aliases and number
+    prefixes of all the languages; other fields are from the first."""
+    verse_markers: dict[str, None] = {}
+    ambiguous_aliases: dict[str, None] = {}
+    number_prefixes: dict[str, dict[str, None]] = {}
+    for language in languages:
+        verse_markers.update(dict.fromkeys(language.verse_markers))
+        ambiguous_aliases.update(dict.fromkeys(language.ambiguous_aliases))
+        for number, prefixes in language.number_prefixes.items():
+            number_prefixes.setdefault(number, {}).update(dict.fromkeys(prefixes))
+    return languages[0].model_copy(
+        update={
+            "verse_markers": list(verse_markers),
+            "ambiguous_aliases": list(ambiguous_aliases),
+            "number_prefixes": {k: list(v) for k, v in number_prefixes.items()},
+        }
+    )
+
+
+class MultiMatcher(Matcher):
+    """
+    A matcher for the books of several locales at once.
+
+    Args:
+        managers: A manager for each locale, by locale name, in priority
+            order (see the note on shared aliases in `refspy.multimatcher`).
+        syntax: The syntax to match (default: that of the first manager).
+        backend: The regexp engine (default: that of the first manager).
+
+    Raises:
+        ValueError: If there are no managers.
+
+    All of `refspy.matcher.Matcher`'s methods match every locale's books;
+    `generate_locale_matches()` also says which locale each match is from.
+    References are locale-neutral, so they can be formatted by any of the
+    managers, e.g. by the manager of their locale.
+    """
+
+    def __init__(
+        self,
+        managers: dict[str, Manager],
+        syntax: Syntax | None = None,
+        backend: RegexBackend | None = None,
+    ):
+        if not managers:
+            raise ValueError("No locales to match.")
+        books = {}
+        book_aliases = {}
+        for __ in managers.values():
+            for key, book in __.books.items():
+                books.setdefault(key, book)
+            for alias, key in __.book_aliases.items():
+                book_aliases.setdefault(alias, key)
+        first = next(iter(managers.values()))
+        language = merge_languages([_.language for _ in managers.values()])
+        super().__init__(
+            books,
+            book_aliases,
+            language,
+            syntax or first.syntax,
+            backend=backend or first.matcher.backend,
+        )
+
+        self.locales: list[str] = list(managers)
+        """The locale names, in priority order."""
+        self.locale_aliases: dict[str, dict[str, tuple[Number, Number]]] = {
+            locale: self.expand_book_aliases(__.book_aliases)
+            for locale, __ in managers.items()
+        }
+        """The (expanded) book aliases of each locale."""
+        self.alias_locales: dict[str, tuple[str, ...]] = {}
+        """The locales of each (expanded) book alias, in priority order."""
+        for locale, aliases in self.locale_aliases.items():
+            for alias in aliases:
+                locales = self.alias_locales.get(alias, ())
+                self.alias_locales[alias] = locales + (locale,)
+
+    @classmethod
+    def from_locales(
+        cls,
+        canon_name: str,
+        locale_names: list[str],
+        syntax_name: str | None = None,
+    ) -> "MultiMatcher":
+        """Create a multi-locale matcher from names, as for `refspy.refspy()`.
+
+        Raises:
+            ValueError: If a name is not found.
+        """
+        managers = {_: get_manager(canon_name, _) for _ in locale_names}
+        syntax = get_manager(canon_name, locale_names[0], syntax_name).syntax
+        return cls(managers, syntax)
+
+    def generate_matches(
+        self,
+        text: str,
+        yield_books: bool = False,
+        yield_nones: bool = False,
+        use_context: bool = True,
+        context: list[Range] | None = None,
+        pos: int = 0,
+        endpos: int | None = None,
+        resolve_book: Callable[[str], tuple[Number, Number]] | None = None,
+    ) -> Generator[tuple[int, int, str, Reference | None], None, None]:
+        """As `refspy.matcher.Matcher.generate_matches()`, resolving each
+        book name in its locale (see `LocaleResolver`) unless a
+        `resolve_book` is given."""
+        return super().generate_matches(
+            text,
+            yield_books,
+            yield_nones,
+            use_context,
+            context,
+            pos,
+            endpos,
+            resolve_book or LocaleResolver(self),
+        )
+
+    def generate_locale_matches(
+        self,
+        text: str,
+        yield_books: bool = False,
+        yield_nones: bool = False,
+        use_context: bool = True,
+    ) -> Generator[tuple[int, int, str, Reference | None, str | None], None, None]:
+        """
+        As `generate_matches()`, with the locale of each match as a fifth
+        item: the locale of its book name, or for a number-only match (like
+        `v.5`), that of the last book name before it (or None). A book name
+        shared by several locales keeps the locale of the last book name
+        (see `LocaleResolver`).
+
+        The locale is tracked as the scan resolves each book name, so this
+        is as fast as `generate_matches()`.
+        """
+        resolver = LocaleResolver(self)
+        for start, end, match_str, ref in self.generate_matches(
+            text, yield_books, yield_nones, use_context, resolve_book=resolver
+        ):
+            yield start, end, match_str, ref, resolver.locale
+
+
+class LocaleResolver:
+    """
+    Resolves the book names of one scan by a `MultiMatcher`, in text order,
+    in the locale of the last book name: a name that locale has (like `Jn`,
+    in both English and French) stays in it; any other name is resolved in,
+    and switches to, the first locale that has it.
+
+    Args:
+        matcher: The matcher whose locales to use.
+    """
+
+    def __init__(self, matcher: MultiMatcher):
+        self.matcher = matcher
+        self.locale: str | None = None
+        """The locale of the last book name resolved, or None before any."""
+
+    def __call__(self, alias: str) -> tuple[Number, Number]:
+        """The `(library.id, book.id)` of a book alias of the matcher."""
+        aliases = self.matcher.locale_aliases.get(self.locale)
+        if aliases is None or alias not in aliases:
+            self.locale = self.matcher.alias_locales[alias][0]
+            aliases = self.matcher.locale_aliases[self.locale]
+        return aliases[alias]
@@ -2,9 +2,8 @@
 
 from refspy.models.book import Book
 from refspy.types.number import Number
-from refspy.models.range import range
-from refspy.models.reference import Reference, reference
-from refspy.models.verse import verse
+from refspy.models.reference import Reference, chapter_reference
+from refspy.tables import ReferenceTables
 
 
 class Navigator:
@@ -12,11 +11,14 @@ class Navigator:
         self,
         books: dict[tuple[Number, Number], Book],
         book_aliases: dict[str, tuple[Number, Number]],
+        tables: ReferenceTables | None = None,
     ) -> None:
         """
         Note:
             Taking prev and next from references makes the most sense if ranges
             are sorted or have been collated by book and chapter.
+            A navigator holds no state between calls, and is safe to share
+            between threads; see `refspy.manager.Manager`.
         Example:
 
             Using the Navigator module on its own:
@@ -59,6 +61,25 @@ class Navigator:
         self.book_aliases: dict[str, tuple[Number, Number]] = book_aliases
         """Lookup `(library.id, book.id)` by book alias."""
 
+        self.tables: ReferenceTables = tables or ReferenceTables(books)
+        """Shared chapter references; see `refspy.tables`."""
+
+    def chapter_ordinal(self, ref: Reference) -> int:
+        """The chapter ordinal of a reference's first range (see
+        `refspy.tables.ChapterOrdinals`).
+
+        Raises:
+            ValueError: If the chapter is not in a known book.
+        """
+        v1 = ref.ranges[0].start
+        return self.tables.ordinals.ordinal(v1.library, v1.book, v1.chapter)
+
+    def chapter_at(self, ordinal: int) -> Reference | None:
+        """A reference to the chapter with this ordinal, if any."""
+        if not 0 <= ordinal < len(self.tables.ordinals):
+            return None
+        return chapter_reference(*self.tables.ordinals.chapter(ordinal))
+
     def prev_chapter(self, ref: Reference) -> Reference | None:
         """Find a reference to the previous chapter.
 
@@ -68,24 +89,15 @@ class Navigator:
             None: If this is the first chapter of a `refspy.library.Library`.
         """
         v1 = ref.ranges[0].start
-        if v1.chapter > 1:
-            return reference(
-                range(
-                    verse(v1.library, v1.book, v1.chapter - 1, 1),
-                    verse(v1.library, v1.book, v1.chapter - 1, 999),
-                )
-            )
+        ordinals = self.tables.ordinals
+        chapters = self.books[v1.library, v1.book].chapters
+        if v1.chapter > chapters:  # <-- beyond the book; step to its last chapter
+            ordinal = ordinals.ordinal(v1.library, v1.book, chapters)
         else:
-            if (v1.library, v1.book - 1) not in self.books:
-                return None
-            prev_book = self.books[v1.library, v1.book - 1]
-            end_chapter = prev_book.chapters
-            return reference(
-                range(
-                    verse(v1.library, prev_book.id, end_chapter, 1),
-                    verse(v1.library, prev_book.id, end_chapter, 999),
-                )
-            )
+            ordinal = ordinals.ordinal(v1.library, v1.book, v1.chapter) - 1
+        if ordinal < 0 or ordinals.libraries[ordinal] != v1.library:
+            return None
+        return self.chapter_at(ordinal)
 
     def next_chapter(self, ref: Reference) -> Reference | None:
         """Find a reference to the next chapter.
@@ -96,21 +108,48 @@ class Navigator:
             None: if this is the last chapter of a `refspy.library.Library`.
         """
         v1 = ref.ranges[0].start
-        end_chapter = self.books[v1.library, v1.book].chapters
-        if v1.chapter < end_chapter:
-            return reference(
-                range(
-                    verse(v1.library, v1.book, v1.chapter + 1, 1),
-                    verse(v1.library, v1.book, v1.chapter + 1, 999),
-                )
-            )
-        else:
-            if (v1.library, v1.book + 1) not in self.books:
-                return None
-            next_book = self.books[v1.library, v1.book + 1]
-            return reference(
-                range(
-                    verse(v1.library, next_book.id, 1, 1),
-                    verse(v1.library, next_book.id, 1, 999),
-                )
-            )
+        ordinals = self.tables.ordinals
+        chapters = self.books[v1.library, v1.book].chapters
+        ordinal = ordinals.ordinal(v1.library, v1.book, min(v1.chapter, chapters)) + 1
+        if ordinal == len(ordinals) or ordinals.libraries[ordinal] != v1.library:
+            return None
+        return self.chapter_at(ordinal)
+
+    def move_chapters(self, ref: Reference, count: int) -> Reference | None:
+        """Find the chapter `count` chapters after (or, if negative, before)
+        the chapter of this reference's first range.
+
+        Unlike `next_chapter()` and `prev_chapter()`, this steps across
+        libraries, in the order of the manager's libraries.
+
+        Returns:
+            None: If there is no chapter that far away.
+
+        Raises:
+            ValueError: If the chapter is not in a known book.
+        """
+        return self.chapter_at(self.chapter_ordinal(ref) + count)
+
+    def chapter_distance(self, ref: Reference, other: Reference) -> int:
+        """The number of chapters from this reference's first chapter to the
+        other's; negative if the other comes first.
+
+        Raises:
+            ValueError: If either chapter is not in a known book.
+        """
+        return self.chapter_ordinal(other) - self.chapter_ordinal(ref)
+
+    def chapter_window(self, ref: Reference, size: int) -> list[Reference]:
+        """References to the chapters within `size` chapters of this
+        reference's first chapter, in order, including that chapter.
+
+        The window is cut short at the first and last chapters of all books.
+
+        Raises:
+            ValueError: If the chapter is not in a known book.
+        """
+        ordinals = self.tables.ordinals
+        ordinal = self.chapter_ordinal(ref)
+        start = max(0, ordinal - size)
+        end = min(len(ordinals), ordinal + size + 1)
+        return [chapter_reference(*ordinals.chapter(_)) for _ in range(start, end)]
@@ -0,0 +1,371 @@
+"""A local HTTP service for matching, formatting, summarizing, and indexing.
+
+Run with `python -m refspy.server --port 8000`. Only the standard library is
+used: requests are read with asyncio streams, one `refspy.manager.Manager` is
+shared per canon, locale, and syntax, and concurrent small requests are
+grouped into batches that are handed to a worker pool.
+
+Every endpoint takes a POST with a JSON object, which may include `canon`,
+`locale`, and `syntax` (see `refspy.refspy()`):
+
+    ```
+    /match    {"text": "See Rom 3:4.", "include_books": false, "include_nones": false}
+              -> {"matches": [{"start": 4, "end": 11, "match": "Rom 3:4",
+                  "ranges": [[400006003004, 400006003004]], "name": "Rom 3:4"}]}
+    /format   {"references": ["Rom 3:4"], "pattern": "{NAME}"}
+              -> {"formatted": ["Romans 3:4"]}
+    /summary  {"text": "...", "pattern": null} -> {"summary": "Rom 3:4"}
+    /index    {"text": "...", "pattern": null} -> {"index": "Rom 3:4"}
+    ```
+
+Errors are returned as `{"error": "..."}` with a 4xx status, or a 500 status
+for an unexpected failure, which only affects its own request.
+
+See `benchmarks/server_load.py` for a load generator.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any
+
+from refspy.compact_json import reference_ranges
+from refspy.init import get_manager
+
+ACTIONS = ("match", "format", "summary", "index")
+"""The endpoints served, as `/match`, etc."""
+
+MAX_BODY_SIZE = 50_000_000
+"""The largest request body accepted, in bytes."""
+
+Job = tuple[str, dict[str, Any]]
+"""An action name and its JSON request body."""
+
+Result = tuple[int, dict[str, Any]]
+"""An HTTP status code and a JSON response body."""
+
+
+def run_job(action: str, body: dict[str, Any]) -> Result:
+    """Perform one request using the shared Manager for its locale.
+
+    Returns:
+        A 400 status if the request is malformed.
+    """
+    try:
+        __ = get_manager(
+            body.get("canon", "protestant"),
+            body.get("locale", "en_US"),
+            body.get("syntax"),
+        )
+        if action == "format":
+            references = body["references"]
+            if not isinstance(references, list):
+                raise ValueError("'references' must be a list of strings.")
+            pattern = body.get("pattern")
+            return HTTPStatus.OK, {
+                "formatted": [
+                    __.template(ref, pattern) if ref else None
+                    for ref in [__.r(str(_)) for _ in references]
+                ]
+            }
+        text = body["text"]
+        if not isinstance(text, str):
+            raise ValueError("'text' must be a string.")
+        if action == "match":
+            matches = __.find_matches(
+                text,
+                bool(body.get("include_books", False)),
+                bool(body.get("include_nones", False)),
+            )
+            return HTTPStatus.OK, {
+                "matches": [
+                    {
+                        "start": start,
+                        "end": end,
+                        "match": match_str,
+                        "ranges": reference_ranges(ref),
+                        "name": __.abbrev_name(ref) if ref else None,
+                    }
+                    for start, end, match_str, ref in matches
+                ]
+            }
+        references = [ref for _, ref in __.find_references(text) if ref]
+        if action == "summary":
+            return HTTPStatus.OK, {
+                "summary": __.make_summary(references, body.get("pattern"))
+            }
+        if action == "index":
+            return HTTPStatus.OK, {
+                "index": __.make_index(references, body.get("pattern"))
+            }
+        return HTTPStatus.NOT_FOUND, {"error": f"Action '{action}' not found."}
+    except KeyError as error:
+        return HTTPStatus.BAD_REQUEST, {"error": f"Missing key: {error}"}
+    except (TypeError, ValueError) as error:
+        return HTTPStatus.BAD_REQUEST, {"error": str(error)}
+
+
+def run_job_safely(action: str, body: dict[str, Any]) -> Result:
+    """Perform one request, as `run_job()`, with a 500 status for any
+    unexpected error, so that it doesn't fail the other jobs of its batch."""
+    try:
+        return run_job(action, body)
+    except Exception as error:
+        return HTTPStatus.INTERNAL_SERVER_ERROR, {
+            "error": f"{type(error).__name__}: {error}"
+        }
+
+
+def run_batch(jobs: list[Job]) -> list[Result]:
+    """Perform a batch of requests in one call to a worker."""
+    return [run_job_safely(action, body) for action, body in jobs]
+
+
+def job_size(body: dict[str, Any]) -> int:
+    """Estimate the work in a request, in characters of text or references."""
+    text = body.get("text")
+    references = body.get("references")
+    return (len(text) if isinstance(text, str) else 0) + 16 * (
+        len(references) if isinstance(references, list) else 0
+    )
+
+
+class Batcher:
+    """
+    Group concurrent small jobs into batches for a worker pool.
+
+    A batch is dispatched when it holds `max_batch` jobs, or `max_delay`
+    seconds after its first job arrived, whichever is sooner. Jobs larger than
+    `large_threshold` (see `job_size()`) are dispatched alone, without waiting.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        max_batch: int = 32,
+        max_delay: float = 0.002,
+        large_threshold: int = 20_000,
+    ) -> None:
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.large_threshold = large_threshold
+        self.queue: asyncio.Queue[tuple[Job, asyncio.Future]] = asyncio.Queue()
+        self.tasks: set[asyncio.Task] = set()
+
+    async def submit(self, action: str, body: dict[str, Any]) -> Result:
+        """Queue a job, and wait for its result."""
+        loop = asyncio.get_running_loop()
+        if job_size(body) >= self.large_threshold:
+            return await loop.run_in_executor(
+                self.executor, run_job_safely, action, body
+            )
+        future = loop.create_future()
+        await self.queue.put(((action, body), future))
+        return await future
+
+    async def run(self) -> None:
+        """Collect batches from the queue until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch:
+                if not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except TimeoutError:
+                    break
+            task = asyncio.create_task(self.dispatch(batch))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def dispatch(self, batch: list[tuple[Job, asyncio.Future]]) -> None:
+        """Run a batch in the worker pool and resolve its futures."""
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self.executor, run_batch, [job for job, _ in batch]
+            )
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+class Server:
+    """An HTTP/1.1 server (with keep-alive) for the refspy JSON endpoints."""
+
+    def __init__(self, batcher: Batcher) -> None:
+        self.batcher = batcher
+
+    async def start(self, host: str, port: int) -> asyncio.Server:
+        """Start listening and batching; port 0 picks a free port."""
+        self.batcher_task = asyncio.create_task(self.batcher.run())
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while request_line := await reader.readline():
+                parts = request_line.decode("latin-1").split()
+                if len(parts) != 3:
+                    await self.respond(
+                        writer,
+                        HTTPStatus.BAD_REQUEST,
+                        {"error": "Bad request line."},
+                        False,
+                    )
+                    break
+                method, path, version = parts
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                keep_alive = (
+                    version == "HTTP/1.1"
+                    and headers.get("connection", "").lower() != "close"
+                )
+                content_length = headers.get("content-length", "")
+                if method != "POST" and not content_length:
+                    content_length = "0"
+                if not content_length.isdecimal():
+                    # Without a length, neither the body nor the next request
+                    # can be found, so the connection is closed.
+                    await self.respond(
+                        writer,
+                        HTTPStatus.BAD_REQUEST,
+                        {"error": "Missing or invalid Content-Length."},
+                        False,
+                    )
+                    break
+                length = int(content_length)
+                if length > MAX_BODY_SIZE:
+                    await self.respond(
+                        writer,
+                        HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                        {"error": "Request body too large."},
+                        False,
+                    )
+                    break
+                body = await reader.readexactly(length) if length else b""
+                try:
+                    status, payload = await self.dispatch(method, path, body)
+                except Exception as error:  # <-- e.g. a broken worker pool
+                    status, payload = (
+                        HTTPStatus.INTERNAL_SERVER_ERROR,
+                        {"error": f"{type(error).__name__}: {error}"},
+                    )
+                await self.respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> Result:
+        """Validate a request and submit it to the batcher."""
+        action = path.strip("/")
+        if action not in ACTIONS:
+            return HTTPStatus.NOT_FOUND, {"error": f"Path '{path}' not found."}
+        if method != "POST":
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Use POST."}
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError:
+            return HTTPStatus.BAD_REQUEST, {"error": "Body is not valid JSON."}
+        if not isinstance(data, dict):
+            return HTTPStatus.BAD_REQUEST, {"error": "Body must be a JSON object."}
+        return await self.batcher.submit(action, data)
+
+    async def respond(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        payload: dict[str, Any],
+        keep_alive: bool,
+    ) -> None:
+        content = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = "\r\n".join(
+            [
+                f"HTTP/1.1 {status} {HTTPStatus(status).phrase}",
+                "Content-Type: application/json; charset=utf-8",
+                f"Content-Length: {len(content)}",
+                f"Connection: {'keep-alive' if keep_alive else 'close'}",
+                "",
+                "",
+            ]
+        )
+        writer.write(head.encode("latin-1") + content)
+        await writer.drain()
+
+
+async def serve(args: argparse.Namespace) -> None:
+    """Run the server until interrupted."""
+    if args.processes:
+        executor = ProcessPoolExecutor(args.workers, initializer=get_manager)
+    else:
+        executor = ThreadPoolExecutor(args.workers)
+        get_manager()
+    batcher = Batcher(
+        executor, args.max_batch, args.max_delay / 1000, args.large_threshold
+    )
+    server = await Server(batcher).start(args.host, args.port)
+    for socket in server.sockets:
+        print("refspy.server listening on http://%s:%d" % socket.getsockname()[:2])
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m refspy.server", description=__doc__.split("\n")[0]
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count(), help="worker pool size"
+    )
+    parser.add_argument(
+        "--processes", action="store_true", help="use processes instead of threads"
+    )
+    parser.add_argument(
+        "--max-batch", type=int, default=32, help="most requests per batch"
+    )
+    parser.add_argument(
+        "--max-delay",
+        type=float,
+        default=2.0,
+        help="milliseconds to wait while filling a batch",
+    )
+    parser.add_argument(
+        "--large-threshold",
+        type=int,
+        default=20_000,
+        help="request size (in characters) that is never batched",
+    )
+    try:
+        asyncio.run(serve(parser.parse_args(argv)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Per-manager tables of books and chapters.
+
+Each manager numbers its chapters densely (`ChapterOrdinals`), so that
+navigation is arithmetic, and per-chapter data can be kept in flat arrays.
+
+Whole-book ranges are needed in a hot loop (every book name matched in a
+text), so each manager keeps one shared, read-only instance per book, made on
+first use, for matching. References returned to callers are always made by
+the `refspy.models.reference` factories, so they are new objects, which
+callers are free to modify.
+"""
+
+from array import array
+
+from refspy.models.book import Book
+from refspy.models.range import Range
+from refspy.models.reference import book_reference
+from refspy.types.number import Number
+
+
+class ChapterOrdinals:
+    """
+    Dense ordinals `0..len(self) - 1` for every chapter of a set of books.
+
+    Chapters are numbered in canonical order, by library, book and chapter,
+    so consecutive ordinals are consecutive chapters, continuing across books
+    and libraries.
+
+    Example:
+        ```
+        ordinals = ChapterOrdinals(index_books([OT, NT]))
+        assert ordinals.ordinal(OT.id, 1, 1) == 0
+        assert ordinals.chapter(0) == (OT.id, 1, 1)
+        assert ordinals.chapter(len(ordinals) - 1) == (NT.id, 27, 22)
+        ```
+
+    The table is built once and never modified, so it can be shared by threads.
+    """
+
+    def __init__(self, books: dict[tuple[Number, Number], Book]) -> None:
+        self.book_offsets: dict[tuple[Number, Number], int] = {}
+        """The ordinal of chapter 1 of each book, by `(library.id, book.id)`."""
+        self.book_chapters: dict[tuple[Number, Number], int] = {}
+        """The number of chapters of each book, by `(library.id, book.id)`."""
+        self.libraries = array("H")
+        """The library ID of each ordinal."""
+        self.books = array("H")
+        """The book ID of each ordinal."""
+        self.chapters = array("H")
+        """The chapter number of each ordinal."""
+        for key in sorted(books):
+            chapters = books[key].chapters
+            self.book_offsets[key] = len(self.chapters)
+            self.book_chapters[key] = chapters
+            self.libraries.extend([key[0]] * chapters)
+            self.books.extend([key[1]] * chapters)
+            self.chapters.extend(range(1, chapters + 1))
+
+    def __len__(self) -> int:
+        return len(self.chapters)
+
+    def ordinal(self, library_id: Number, book_id: Number, chapter_id: Number) -> int:
+        """The ordinal of a chapter.
+
+        Raises:
+            ValueError: If the book is unknown, or has no such chapter.
+        """
+        key = library_id, book_id
+        if key not in self.book_offsets:
+            raise ValueError(f"Unknown book: {key}")
+        if not 1 <= chapter_id <= self.book_chapters[key]:
+            raise ValueError(f"Unknown chapter: {(*key, chapter_id)}")
+        return self.book_offsets[key] + chapter_id - 1
+
+    def chapter(self, ordinal: int) -> tuple[Number, Number, Number]:
+        """The `(library.id, book.id, chapter)` of an ordinal.
+
+        Raises:
+            ValueError: If the ordinal is out of range.
+        """
+        if not 0 <= ordinal < len(self.chapters):
+            raise ValueError(f"Chapter ordinal out of range: {ordinal}")
+        return self.libraries[ordinal], self.books[ordinal], self.chapters[ordinal]
+
+
+class ReferenceTables:
+    """
+    Chapter ordinals and shared book ranges for a set of books.
+
+    The whole-book range of each book in `books` is cached for the matcher
+    (`book_range()`), which only reads it as book context; it is never part of
+    a returned reference; for those, use `book_reference()` and
+    `chapter_reference()`, which make new ones.
+
+    Filling a table entry is idempotent, so tables can be shared by threads.
+    """
+
+    def __init__(self, books: dict[tuple[Number, Number], Book]) -> None:
+        self.books = books
+        self.ordinals = ChapterOrdinals(books)
+        """Dense chapter ordinals for the books."""
+        self._book_ranges: dict[tuple[Number, Number], Range] = {}
+
+    def book_range(self, library_id: Number, book_id: Number) -> Range:
+        """The shared whole-book range of a known book, for reading only.
+
+        Raises:
+            ValueError: If the numbers are out of range.
+        """
+        key = library_id, book_id
+        if (last := self._book_ranges.get(key)) is not None:
+            return last
+        last = book_reference(library_id, book_id).last_range()
+        if key in self.books:
+            last = self._book_ranges.setdefault(key, last)
+        return last
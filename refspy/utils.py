@@ -8,6 +8,9 @@ from typing import Any
 from refspy.constants import SPACE, NON_BREAKING_SPACE
 from refspy.types.number import Number
 
+PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+"""A blank line; it ends the paragraph that precedes it."""
+
 
 def parse_number(number_str: str) -> Number:
     """Remove non-digits and return an integer IF it falls between 1 and 999
@@ -23,7 +26,10 @@ def parse_number(number_str: str) -> Number:
     Return:
         None if no digits appear in `number_str` or not in range.
     """
-    digits = re.sub(r"\D", "", number_str)
+    if number_str.isdecimal():
+        digits = number_str  # <-- the common case, without a regex
+    else:
+        digits = re.sub(r"\D", "", number_str)
     if digits != "":
         number = int(digits)
         if 1 <= number <= 999:
@@ -173,3 +179,53 @@ def string_together(*args: Any) -> str:
         *args: A list of string-convertable values.
     """
     return "".join([str(arg) for arg in args])
+
+
+def split_paragraphs(text: str) -> list[str]:
+    """Split text after each paragraph break; the parts join to make the text."""
+    ends = [_.end() for _ in PARAGRAPH_BREAK.finditer(text)]
+    return [text[a:b] for a, b in zip([0, *ends], [*ends, len(text)])]
+
+
+def segment_paragraphs(text: str, size: int) -> list[tuple[int, str]]:
+    """Group consecutive paragraphs into segments of at least `size` chars
+    (except the last), and return them with their offsets in the text."""
+    segments = []
+    start = end = 0
+    for paragraph in split_paragraphs(text):
+        end += len(paragraph)
+        if end - start >= size:
+            segments.append((start, text[start:end]))
+            start = end
+    if end > start or not segments:
+        segments.append((start, text[start:end]))
+    return segments
+
+
+def encode_varint(number: int, out: bytearray) -> None:
+    """Append a non-negative integer to `out` as an unsigned LEB128 varint:
+    seven bits per byte, low bits first, with the high bit set on every byte
+    but the last."""
+    while number > 0x7F:
+        out.append(number & 0x7F | 0x80)
+        number >>= 7
+    out.append(number)
+
+
+def decode_varint(data: bytes, pos: int = 0) -> tuple[int, int]:
+    """Read an unsigned LEB128 varint from `data` at `pos`.
+
+    Raises:
+        IndexError: If the data ends within the varint.
+
+    Return:
+        The number, and the position after it.
+    """
+    number = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        number |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return number, pos
+        shift += 7
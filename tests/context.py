@@ -4,3 +4,7 @@ import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import refspy
+import refspy.backends
+
+# Run the suite with another regex backend, e.g. REFSPY_TEST_BACKEND=regex.
+refspy.backends.DEFAULT_BACKEND_NAME = os.environ.get("REFSPY_TEST_BACKEND", "re")
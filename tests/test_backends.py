@@ -0,0 +1,60 @@
+from context import *
+
+import pickle
+
+import pytest
+
+from refspy import refspy
+from refspy.backends import (
+    RegexBackend,
+    RegexModuleBackend,
+    available_backends,
+    get_backend,
+)
+from refspy.multimatcher import MultiMatcher
+
+TEXT = "See Rom 3:4, v.5 (cf. 1 Cor 2:1-3:4,6; Jn 3) and Romains 1:1, Gen."
+
+
+def test_get_backend():
+    assert isinstance(get_backend("re"), RegexBackend)
+    assert "re" in available_backends()
+    with pytest.raises(ValueError):
+        get_backend("nope")
+
+
+@pytest.mark.parametrize("backend_name", available_backends())
+def test_backends_match_alike(backend_name):
+    __ = refspy(backend_name=backend_name)
+    assert __.matcher.backend.name == backend_name
+    expected = refspy(backend_name="re").find_matches(TEXT, include_books=True)
+    assert __.find_matches(TEXT, include_books=True) == expected
+    restored = pickle.loads(pickle.dumps(__.matcher))
+    assert list(restored.generate_matches(TEXT)) == list(
+        __.matcher.generate_matches(TEXT)
+    )
+
+
+@pytest.mark.parametrize("backend_name", available_backends())
+def test_backends_match_locales_alike(backend_name):
+    managers = {
+        "en_US": refspy(backend_name=backend_name),
+        "fr_FR": refspy("protestant", "fr_FR", "intl", backend_name=backend_name),
+    }
+    multi = MultiMatcher(managers)
+    assert multi.backend.name == backend_name
+    assert [_[4] for _ in multi.generate_locale_matches(TEXT)] == [
+        "en_US",
+        "en_US",
+        "en_US",
+        "en_US",
+        "fr_FR",
+    ]
+
+
+def test_regex_module_timeout():
+    pytest.importorskip("regex")
+    __ = refspy(backend_name="regex")
+    __.matcher.backend = RegexModuleBackend(timeout=1e-6)
+    with pytest.raises(TimeoutError):
+        __.find_references(TEXT * 100_000)
@@ -0,0 +1,39 @@
+from context import *
+
+from io import BytesIO
+
+import pytest
+
+from refspy import refspy
+from refspy.binary import STREAM_HEADER, read_references, write_references
+
+__ = refspy()
+
+
+def test_stream_round_trip(monkeypatch):
+    refs = [__.r(f"Rom {n % 16 + 1}:{n % 20 + 1}-{n % 20 + 3}") for n in range(2000)]
+    refs[3] = None
+    stream = BytesIO()
+    assert write_references(stream, refs) == len(refs)
+    assert stream.getvalue().startswith(STREAM_HEADER)
+    # Small reads split references between chunks.
+    monkeypatch.setattr("refspy.binary.STREAM_BUFFER_SIZE", 7)
+    stream.seek(0)
+    assert list(read_references(stream)) == refs
+
+
+def test_stream_append():
+    stream = BytesIO()
+    write_references(stream, [__.r("Gen 1:1")])
+    write_references(stream, [__.r("Rev 22:21")], header=False)
+    stream.seek(0)
+    assert list(read_references(stream)) == [__.r("Gen 1:1"), __.r("Rev 22:21")]
+
+
+def test_stream_errors():
+    with pytest.raises(ValueError):
+        list(read_references(BytesIO(b"not a stream")))
+    stream = BytesIO()
+    write_references(stream, [__.r("Gen 1:1-3")])
+    with pytest.raises(ValueError):
+        list(read_references(BytesIO(stream.getvalue()[:-1])))
@@ -0,0 +1,54 @@
+from pydantic import ValidationError
+import pytest
+
+from refspy.libraries.en_US import DC, NT, OT
+from refspy.libraries.fr_FR import NT as FR_NT, OT as FR_OT
+from refspy.models.book import Book
+
+
+def make_book(chapters: int, verses: list[int] | None) -> Book:
+    return Book(
+        id=1, name="Book", abbrev="Bk", aliases=[], chapters=chapters, verses=verses
+    )
+
+
+def test_verses_are_optional():
+    book = make_book(3, None)
+    assert book.verses is None
+    assert book.last_verse(2) == 999
+    assert book.verse_total() is None
+    with pytest.raises(ValueError):
+        book.verse_ordinal(1, 1)
+
+
+def test_verses_must_fit_chapters():
+    with pytest.raises(ValidationError):
+        make_book(3, [10, 20])
+    with pytest.raises(ValidationError):
+        make_book(2, [10, 0])
+    with pytest.raises(ValidationError):
+        make_book(2, [10, 1000])
+
+
+def test_verse_ordinals():
+    book = make_book(3, [10, 20, 5])
+    assert book.verse_total() == 35
+    assert book.last_verse(2) == 20
+    assert book.last_verse(4) == 999
+    assert book.verse_ordinal(1, 1) == 0
+    assert book.verse_ordinal(2, 1) == 10
+    assert book.verse_ordinal(3, 5) == 34
+    for chapter, verse in [(0, 1), (4, 1), (1, 11), (3, 0)]:
+        with pytest.raises(ValueError):
+            book.verse_ordinal(chapter, verse)
+
+
+def test_library_versification():
+    assert sum(_.verse_total() for _ in OT.books) == 23145
+    assert sum(_.verse_total() for _ in NT.books) == 7957
+    assert [_.verses for _ in FR_OT.books] == [_.verses for _ in OT.books]
+    assert [_.verses for _ in FR_NT.books] == [_.verses for _ in NT.books]
+    assert all(_.verses is None for _ in DC.books)
+    psalms = OT.books[18]
+    assert psalms.last_verse(119) == 176
+    assert psalms.verse_ordinal(150, 6) == psalms.verse_total() - 1
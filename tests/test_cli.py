@@ -0,0 +1,65 @@
+import io
+import json
+
+from context import *
+
+from refspy.cli import iter_paths, main, make_parser, ordered_map, run
+
+
+def options(*argv):
+    return vars(make_parser().parse_args(list(argv)))
+
+
+def lines(output):
+    return [json.loads(_) for _ in output.getvalue().splitlines()]
+
+
+def test_iter_paths(tmp_path):
+    (tmp_path / "b").mkdir()
+    (tmp_path / "b" / "2.txt").write_text("")
+    (tmp_path / "1.txt").write_text("")
+    (tmp_path / "3.md").write_text("")
+    assert list(iter_paths([str(tmp_path)], "*.txt")) == [
+        str(tmp_path / "1.txt"),
+        str(tmp_path / "b" / "2.txt"),
+    ]
+    assert list(iter_paths([])) == ["-"]
+
+
+def test_ordered_map():
+    assert list(ordered_map(None, abs, [-1, 2, -3], 1)) == [1, 2, 3]
+
+
+def test_match_lines(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("See Rom 3:21-26 and John Smith. In Romans see 5:4.")
+    output = io.StringIO()
+    run(options(str(path), "--summary"), output)
+    records = lines(output)
+    assert [_["type"] for _ in records] == ["match", "match", "document"]
+    assert records[0]["match"] == "Rom 3:21-26"
+    assert records[0]["start"] == 4
+    assert records[0]["ranges"] == [[400006003021, 400006003026]]
+    assert records[1]["name"] == "Romans 5:4"
+    assert records[2]["summary"] == "Rom 3:21–26; 5:4"
+
+
+def test_document_lines_with_workers(tmp_path):
+    for n in range(1, 6):
+        (tmp_path / f"{n}.txt").write_text(f"Rom {n}:1; Rom {n}:2")
+    output = io.StringIO()
+    run(options(str(tmp_path), "--output", "document", "--workers", "2"), output)
+    records = lines(output)
+    assert [len(_["matches"]) for _ in records] == [2] * 5
+    assert [_["matches"][0]["abbrev_name"] for _ in records] == [
+        f"Rom {n}:1" for n in range(1, 6)
+    ]
+
+
+def test_stdin(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO("Gen 1:1"))
+    main(["--hotspots", "--index"])
+    records = [json.loads(_) for _ in capsys.readouterr().out.splitlines()]
+    assert records[0]["path"] == "-"
+    assert records[1]["index"] == "Gen 1:1"
+    assert records[1]["hotspots"] == []
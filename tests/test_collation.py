@@ -0,0 +1,78 @@
+import pytest
+from context import *
+
+from refspy.collation import (
+    collation_dict,
+    collation_key,
+    collation_list,
+    generate_collation,
+    is_single_book,
+)
+from refspy.libraries.en_US import NT, OT
+from refspy.models.range import range
+from refspy.models.reference import (
+    book_reference,
+    chapter_reference,
+    reference,
+    verse_reference,
+)
+from refspy.models.verse import verse
+
+ROM_3_1 = verse_reference(NT.id, 6, 3, 1)
+ROM_3_4 = verse_reference(NT.id, 6, 3, 4)
+ROM_1_2 = verse_reference(NT.id, 6, 1, 2)
+GEN_1 = chapter_reference(OT.id, 1, 1)
+MATT_1_1 = verse_reference(NT.id, 1, 1, 1)
+MATT_MARK = reference(range(verse(NT.id, 1, 1, 1), verse(NT.id, 2, 1, 1)))
+
+
+def test_is_single_book():
+    assert is_single_book(ROM_3_1)
+    assert is_single_book(book_reference(NT.id, 6))
+    assert not is_single_book(MATT_MARK)
+    assert not is_single_book(ROM_3_1 + MATT_1_1)
+
+
+def test_collation_key_sorts_like_references():
+    refs = [ROM_3_4, MATT_1_1, ROM_1_2, GEN_1, ROM_3_1]
+    assert sorted(refs, key=collation_key) == sorted(refs)
+
+
+def test_generate_collation_by_book():
+    refs = [ROM_3_4, MATT_MARK, ROM_1_2, GEN_1, MATT_1_1, ROM_3_1]
+    assert collation_list(generate_collation(refs)) == [
+        (OT.id, [(1, [GEN_1])]),
+        (NT.id, [(1, [MATT_1_1]), (6, [ROM_1_2, ROM_3_1, ROM_3_4])]),
+    ]
+
+
+def test_generate_collation_by_chapter():
+    refs = [ROM_3_4, ROM_1_2, ROM_3_1]
+    assert collation_dict(generate_collation(refs, "chapter")) == {
+        NT.id: {6: {1: [ROM_1_2], 3: [ROM_3_1, ROM_3_4]}}
+    }
+
+
+def test_generate_collation_by_verse():
+    refs = [ROM_3_4, ROM_3_1, ROM_3_4]
+    collation = collation_dict(generate_collation(refs, "verse"))
+    assert list(collation[NT.id][6][3].values()) == [[ROM_3_1], [ROM_3_4, ROM_3_4]]
+
+
+def test_generate_collation_is_lazy():
+    resolved = []
+
+    def resolve(key, first):
+        resolved.append(key)
+        return key[-1]
+
+    collation = generate_collation([ROM_1_2, GEN_1], "chapter", resolve)
+    assert resolved == []
+    library_id, _ = next(collation)
+    assert library_id == OT.id
+    assert resolved == [(OT.id,)]
+
+
+def test_generate_collation_depth():
+    with pytest.raises(ValueError):
+        generate_collation([ROM_1_2], "library")
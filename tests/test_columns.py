@@ -0,0 +1,96 @@
+from context import *
+
+from concurrent.futures import ThreadPoolExecutor
+
+from refspy import refspy
+import pytest
+
+import pickle
+
+from refspy.columns import (
+    FLAG_BOOK,
+    FLAG_CHAPTERS,
+    FLAG_NONE,
+    IndexBuilder,
+    IndexReference,
+    index_matcher,
+    parse_strings,
+)
+
+__ = refspy()
+
+
+def test_parse_many():
+    parsed = __.parse_many(["Rom 3:21-26", "Nothing", "Rom 1:1, 3", "Romans"])
+    assert len(parsed) == 5
+    assert list(parsed.rows()) == [
+        (0, 400006003021, 400006003026, 0),
+        (1, 0, 0, 1),
+        (2, 400006001001, 400006001001, 0),
+        (2, 400006001003, 400006001003, 0),
+        (3, 0, 0, 1),
+    ]
+
+
+def test_parse_many_matches_r():
+    strings = ["Gen 1:1-3", "Matt 5", "Jude 3", "Gen 1:1-3", "x", "1 Cor 2:3-4:5"]
+    parsed = __.parse_many(strings)
+    for row, start, end, failed in parsed.rows():
+        ref = __.r(strings[row])
+        assert failed == (ref is None)
+        if ref is not None:
+            assert (start, end) in [
+                (_.start.index(), _.end.index()) for _ in ref.ranges
+            ]
+
+
+def test_parse_many_in_chunks():
+    strings = [f"Rom {n % 16 + 1}:{n % 20 + 1}" for n in range(200)] + ["None"]
+    expected = list(__.parse_many(strings).rows())
+    with ThreadPoolExecutor(2) as executor:
+        parsed = parse_strings(__.matcher, strings, executor, chunk_size=7)
+    assert list(parsed.rows()) == expected
+
+
+def test_find_references_columnar():
+    texts = ["Rom 3:21-26, 1:2", "Romans 3-4; Rom 0:1", "", "Jude 3"]
+    columns = __.find_references_columnar(texts, include_books=True, include_nones=True)
+    assert list(columns.rows()) == [
+        (0, 0, 11, 400006003021, 400006003026, 0),
+        (0, 13, 16, 400006001002, 400006001002, 0),
+        (1, 0, 10, 400006003001, 400006004999, FLAG_CHAPTERS),
+        (1, 12, 19, 0, 0, FLAG_NONE),
+        (3, 0, 6, 400026001003, 400026001003, 0),
+    ]
+    columns = __.find_references_columnar(["See Romans."], include_books=True)
+    assert list(columns.flags) == [FLAG_BOOK]
+
+
+def ranges(ref):
+    return [(_.start.index(), _.end.index()) for _ in ref.ranges] if ref else None
+
+
+def test_index_matcher():
+    text = (
+        "Rom 3:4-6, 8; v.9 (cf. 1 Cor 2:1-3:4,6; Phlm 3-4; Jn 3-4) and Rom 0:1, "
+        "Rom 5:9-3, vv.12-14a, Jude 1:2, Ge 1:1-2:3, Romans."
+    )
+    indexed = index_matcher(__.matcher)
+    assert __.matcher.builder is not IndexBuilder
+    matches = list(indexed.generate_matches(text, True, True))
+    assert all(isinstance(ref, IndexReference | None) for *_, ref in matches)
+    assert [(s, e, m, ranges(r)) for s, e, m, r in matches] == [
+        (s, e, m, ranges(r))
+        for s, e, m, r in __.matcher.generate_matches(text, True, True)
+    ]
+    restored = pickle.loads(pickle.dumps(indexed))
+    assert list(restored.generate_matches(text)) == list(indexed.generate_matches(text))
+
+
+def test_columnar_to_numpy():
+    numpy = pytest.importorskip("numpy")
+    columns = __.find_references_columnar(["Rom 3:21-26, 1:2", "Jude 3"])
+    table = columns.to_numpy()
+    assert table.dtype.names == columns.COLUMNS
+    assert list(table["doc_id"]) == [0, 0, 1]
+    assert int(numpy.sum(table["range_end_index"] // 1_000_000 == 400006)) == 2
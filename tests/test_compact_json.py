@@ -0,0 +1,49 @@
+from context import *
+
+import json
+from io import StringIO
+
+import pytest
+
+from refspy import refspy
+from refspy.compact_json import (
+    decode_matches,
+    decode_references,
+    encode_matches,
+    encode_references,
+    read_matches_jsonl,
+    write_matches_jsonl,
+)
+
+__ = refspy()
+
+TEXT = "See Rom 3:21-26, 1 Cor 2:3-4:5 and v.7; Romans (cf. Nothing 3:4)."
+
+
+def test_encode_matches():
+    matches = __.find_matches(TEXT, include_books=True, include_nones=True)
+    data = encode_matches(matches)
+    assert json.loads(data)[0] == [4, 15, "Rom 3:21-26", [[400006003021, 400006003026]]]
+    assert decode_matches(data) == matches
+
+
+def test_encode_references():
+    refs = [__.r("Rom 3:4, 6"), None, __.r("Gen 1-2")]
+    data = encode_references(refs)
+    assert data.startswith("[[[400006003004,400006003004],[400006003006")
+    assert decode_references(data) == refs
+
+
+def test_decode_errors():
+    for data in ["[[[1, 2]]]", '[[["a", "b"]]]', "[[[400006003005, 400006003004]]]"]:
+        with pytest.raises(ValueError):
+            decode_references(data)
+
+
+def test_matches_jsonl():
+    documents = [__.find_matches(TEXT), [], __.find_matches("Jude 3")]
+    stream = StringIO()
+    assert write_matches_jsonl(stream, documents) == 3
+    assert stream.getvalue().count("\n") == 3
+    stream.seek(0)
+    assert list(read_matches_jsonl(stream)) == documents
@@ -0,0 +1,70 @@
+from xml.etree import ElementTree
+
+import pytest
+from context import *
+
+from refspy.distribution import (
+    count_distribution,
+    distribution_keys,
+    distribution_svg,
+)
+from refspy.indexers import index_books
+from refspy.libraries.en_US import NT, OT
+from refspy.manager import Manager
+from refspy.languages.english import ENGLISH
+from refspy.models.range import range as verse_range
+from refspy.models.reference import join_references, reference
+from refspy.models.verse import verse
+from refspy.tables import ChapterOrdinals
+
+__ = Manager([OT, NT], ENGLISH)
+ordinals = ChapterOrdinals(index_books([OT, NT]))
+
+
+def test_distribution_keys():
+    assert len(distribution_keys(ordinals, "book")) == 66
+    assert distribution_keys(ordinals, "book")[39] == (NT.id, 1)
+    assert distribution_keys(ordinals, "chapter")[0] == (OT.id, 1, 1)
+    with pytest.raises(ValueError):
+        distribution_keys(ordinals, "verse")
+
+
+def test_count_by_book():
+    refs = [
+        __.r("Rom 3:4"),
+        __.r("Rom 5"),
+        None,
+        join_references([__.r("Matt 1:1"), __.r("Mark 2")]),
+    ]
+    counts = count_distribution(refs, ordinals, "book")
+    assert len(counts) == 66
+    assert counts[39] == 1  # <-- Matt
+    assert counts[40] == 1  # <-- Mark
+    assert counts[44] == 2  # <-- Rom
+    assert sum(counts) == 4
+
+
+def test_count_spanning_ranges():
+    rom_15_1_cor_2 = reference(
+        verse_range(verse(NT.id, 6, 15, 1), verse(NT.id, 7, 2, 3))
+    )
+    counts = __.distribution([rom_15_1_cor_2], "chapter")
+    labels = __.distribution_labels("chapter")
+    spanned = [label for label, count in zip(labels, counts) if count]
+    assert spanned == ["Rom 15", "Rom 16", "1 Cor 1", "1 Cor 2"]
+    counts = __.distribution([__.bcv("Rom")], "chapter")  # <-- chapters 1-999
+    assert counts[labels.index("Rom 16")] == 1
+    assert sum(counts) == 16
+
+
+def test_distribution_svg():
+    svg = __.distribution_svg([__.r("Rom 3:4"), __.r("Rom 5")])
+    assert svg.startswith("<svg ")
+    assert svg.count("<rect ") == 1
+    assert "<title>Rom: 2</title>" in svg
+    assert distribution_svg([0, 0]).count("<rect ") == 0
+    color = 'red"><script>x</script>'
+    svg = ElementTree.fromstring(distribution_svg([1], color=color))
+    assert svg.find("{http://www.w3.org/2000/svg}g").get("fill") == color
+    with pytest.raises(ValueError):
+        distribution_svg([1, 2], ["a"])
@@ -0,0 +1,63 @@
+from context import *
+
+from refspy import refspy
+from refspy.document import DocumentMatcher, common_prefix_length
+
+__ = refspy()
+
+TEXT = "Rom 1:1 and v.2.\n\nSee 3:4 (cf. Gen 2:3).\n\nAlso v.5."
+
+
+def test_common_prefix_length():
+    assert common_prefix_length("abcdef", "abcxef") == 3
+    assert common_prefix_length("abc", "abc") == 3
+    assert common_prefix_length("", "abc") == 0
+
+
+def test_matches_equal_whole_text():
+    document = __.document_matcher()
+    diff = document.update(TEXT)
+    expected = list(__.matcher.generate_matches(TEXT))
+    assert document.matches() == expected
+    assert diff.added == expected
+    assert diff.removed == []
+    assert diff.scanned == 3
+
+
+def test_only_edited_paragraphs_are_scanned():
+    document = __.document_matcher()
+    document.update(TEXT)
+    diff = document.update(TEXT.replace("3:4", "3:5"))
+    assert [_[2] for _ in diff.removed] == ["3:4"]
+    assert [_[2] for _ in diff.added] == ["3:5"]
+    assert diff.added[0][3] == __.r("Rom 3:5")
+    # The context for v.5 changes from Rom 3:4 to 3:5, so the third paragraph
+    # is scanned again, but v.5 still means Rom 3:5.
+    assert diff.scanned == 2
+
+
+def test_unchanged_context_stops_scanning():
+    document = __.document_matcher()
+    document.update(TEXT)
+    diff = document.update(TEXT.replace("Gen 2:3", "Gen 2:4"))
+    assert [_[2] for _ in diff.added] == ["Gen 2:4"]
+    assert diff.scanned == 1
+
+
+def test_context_changes_propagate():
+    document = __.document_matcher()
+    document.update(TEXT)
+    edited = TEXT.replace("Rom 1:1", "Matt 1:1")
+    diff = document.update(edited)
+    assert document.matches() == list(__.matcher.generate_matches(edited))
+    # The bracketed Gen 2:3 does not change the context for v.5 (Matt 3:5).
+    assert [_[2] for _ in diff.added] == ["Matt 1:1", "v.2", "3:4", "v.5"]
+    assert diff.scanned == 3
+
+
+def test_moved_matches_are_not_changes():
+    document = DocumentMatcher(__.matcher)
+    document.update(TEXT)
+    diff = document.update("Intro.\n\n" + TEXT)
+    assert diff.removed == [] and diff.added == []
+    assert document.matches()[0][:2] == (8, 15)
@@ -0,0 +1,41 @@
+from context import *
+
+from refspy import refspy
+from refspy.generate import generate_modules
+from refspy.generated import load_generated
+from refspy.init import get_canon, get_language
+from refspy.manager import Manager
+
+
+def test_generated_modules_are_current():
+    for path, source in generate_modules().items():
+        with open(path, encoding="utf-8") as file:
+            assert file.read() == source, "Run: python -m refspy.generate"
+
+
+def test_load_generated():
+    data = load_generated("protestant", "en_US", "intl")
+    assert data is not None
+    assert data.BOOK_ALIASES["Rom"] == (400, 6)
+    assert load_generated("protestant", "en_US", "nope") is None
+
+
+def test_refspy_uses_generated_data():
+    __ = refspy("catholic", "fr_FR")
+    data = load_generated("catholic", "fr_FR", "euro")
+    assert __.matcher.reference_regexp.pattern == data.REFERENCE_PATTERN
+    assert __.book_aliases == data.BOOK_ALIASES
+
+
+def test_generated_matches_dynamic_matches():
+    text = "See Rom 3:4, v.5 and First Corinthians 2:1-3:4,6 (cf. Ge 1:1; Jn 3)."
+    generated = refspy()
+    dynamic = Manager(get_canon("protestant", "en_US"), get_language("en"))
+    assert generated.find_matches(text) == dynamic.find_matches(text)
+    assert generated.matcher.book_aliases == dynamic.matcher.book_aliases
+
+
+def test_without_two_letter_aliases():
+    __ = refspy(include_two_letter_aliases=False)
+    assert "Ge" not in __.book_aliases
+    assert __.find_references("Ge 1:1") == []
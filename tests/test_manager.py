@@ -1,8 +1,11 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from context import *
 
 from refspy.languages.english import ENGLISH
-from refspy.libraries.en_US import NT
+from refspy.libraries.en_US import NT, OT
 from refspy.manager import Manager
 
 from refspy.models.book import Book
@@ -135,6 +138,22 @@ def test_collate_by_verse():
                     assert verse_references == REFERENCES
 
 
+def test_collate_by_verse_merges_same_labels():
+    manager = Manager([OT, NT], ENGLISH)
+    rom_3 = manager.r("Rom 3")
+    with_chapter = manager.r("Rom 3:1") + rom_3
+    with_verse = manager.r("Rom 3:1, 3")
+    assert manager.numbers(with_chapter) == manager.numbers(with_verse) == "3:1, 3"
+    collation = manager.collate_by_verse([with_chapter, with_verse])
+    assert collation[NT.id][6][3] == {"3:1, 3": [with_chapter, with_verse]}
+
+
+def test_make_index_orders_prefixes_first():
+    manager = Manager([OT, NT], ENGLISH)
+    refs = [manager.r(_) for _ in ["Rom 3:10, 15-18", "Rom 3:10", "Rom 3:10, 14-16"]]
+    assert manager.make_index(refs) == "Rom 3:10, 10, 14–16, 10, 15–18"
+
+
 def test_collate():
     collation = __.collate(REFERENCES)
     for library, book_collation in collation:
@@ -205,6 +224,16 @@ def test_prev_chapter():
     assert __.prev_chapter(ch_2) == ch_1
 
 
+def test_move_chapters_across_libraries():
+    __ = Manager([OT, NT], ENGLISH)
+    mal_4, matt_1 = __.r("Mal 4"), __.r("Matt 1")
+    assert __.next_chapter(mal_4) is None
+    assert __.move_chapters(mal_4, 1) == matt_1
+    assert __.move_chapters(matt_1, -1) == mal_4
+    assert __.chapter_distance(mal_4, matt_1) == 1
+    assert __.chapter_window(matt_1, 1) == [mal_4, matt_1, __.r("Matt 2")]
+
+
 def test_bcv():
     bk = __.bcv("Book")
     assert __.name(bk) == "Book"
@@ -242,6 +271,20 @@ def test_r():
     assert __.name(ref) == "Book 1:1–2:4"
 
 
+def test_r_cache():
+    __ = Manager([LIBRARY], ENGLISH, parse_cache_size=2)
+    ref = __.r("Book 1:1")
+    ref.ranges.clear()
+    assert __.name(__.r("Book 1:1")) == "Book 1:1"
+    assert __.first_reference("See Book 1:2") == ("Book 1:2", __.r("Book 1:2"))
+    assert __.r("No reference") is None
+    assert __.r("No reference") is None
+    hits, misses, maxsize, currsize = __.parse_cache_info()
+    assert (hits, misses, maxsize, currsize) == (2, 4, 2, 2)
+    __.parse_cache_clear()
+    assert __.parse_cache_info()[3] == 0
+
+
 def test_get_book():
     ref = __.r("Book 1:1")
     assert ref is not None
@@ -311,3 +354,91 @@ def test_template():
         assert __.template(ref, "x {PARAM_NAME}") == "x 1cor+2:3-4,+5"
         assert __.template(ref, "x {PARAM_BOOK}") == "x 1cor"
         assert __.template(ref, "x {PARAM_NUMBERS}") == "x 2:3-4,+5"
+
+
+def test_generate_collation():
+    refs = [__.r("Book 3:4"), __.r("Book 1:2, 4"), __.r("Book 1:1")]
+    for library, book_collation in __.generate_collation(refs, "verse"):
+        assert library == LIBRARY
+        for book, chapter_collation in book_collation:
+            assert book == BOOK
+            chapters = [chapter for chapter, _ in chapter_collation]
+            assert chapters == [1, 3]
+
+
+def test_collate_verse_references():
+    refs = [__.r("Book 1:2, 4"), __.r("Book 1:1"), __.r("Book 1:2, 4")]
+    collation = __.collate_verse_references(refs)
+    [(_, [(_, [(chapter, verse_collation)])])] = collation
+    assert chapter == 1
+    assert [numbers for numbers, _ in verse_collation] == ["1:1", "1:2, 4"]
+    assert len(verse_collation[1][1]) == 2
+
+
+def test_afind_references():
+    text = "Book 1:1, Book 2:2"
+    expected = __.find_references(text)
+    assert asyncio.run(__.afind_references(text)) == expected
+    assert asyncio.run(__.afind_references(text, executor_threshold=0)) == expected
+
+
+def test_agenerate_references():
+    text = "Book 1:2, 2:1, 3:4, 1:4-5, 7, 3:6, " * 10
+
+    async def collect():
+        return [match async for match in __.agenerate_references(text, batch_size=3)]
+
+    assert asyncio.run(collect()) == __.find_references(text)
+
+
+def test_find_matches():
+    text = "See Book 1:1 (and 2:2), then (1:4-5."
+    matches = __.find_matches(text, include_nones=True)
+    assert [match_str for _, _, match_str, _ in matches] == ["Book 1:1", "2:2", "1:4-5"]
+    for start, end, match_str, _ in matches:
+        assert text[start:end] == match_str
+    assert [(m, r) for _, _, m, r in matches] == __.find_references(text, False, True)
+
+
+def test_shared_manager_in_threads():
+    texts = [
+        f"Book {c}:{v} (and vol 2:{w}); v.{v + 1}"
+        for c in [1, 2, 3]
+        for v in [1, 5, 9, 14, 20]
+        for w in [1, 4, 7]
+    ] * 5
+    expected = [__.find_references(text, True, True) for text in texts]
+    with ThreadPoolExecutor(8) as executor:
+        results = executor.map(lambda text: __.find_references(text, True, True), texts)
+        assert list(results) == expected
+        names = executor.map(lambda refs: [__.name(r) for _, r in refs if r], expected)
+        assert list(names) == [[__.name(r) for _, r in refs if r] for refs in expected]
+
+
+def test_find_paragraph_matches():
+    __ = Manager([OT, NT], ENGLISH)
+    text = "\n\n".join(["Rom 3:4 and v.5 (Gen 1:1) then 6:7."] * 50 + ["v.8"])
+    serial = __.find_paragraph_matches(text, include_nones=True, segment_size=1)
+    assert len(serial) == 50 * 4 + 1
+    assert serial[-1][3] is None  # <-- no context from the previous paragraph
+    assert serial[:200] == __.find_matches(text, include_nones=True)[:200]
+    with ThreadPoolExecutor(4) as executor:
+        parallel = __.find_paragraph_matches(
+            text, include_nones=True, executor=executor, segment_size=100
+        )
+    assert parallel == serial
+
+
+def test_returned_references_can_be_modified():
+    __ = Manager([OT, NT], ENGLISH)
+    ref = __.bcv("Rom", 3)
+    ref.ranges[0].start.verse = 10
+    assert __.name(__.bcv("Rom", 3)) == "Romans 3"
+    assert __.name(__.next_chapter(__.r("Rom 2"))) == "Romans 3"
+    ref = __.book_reference(__.r("Rom 2"))
+    ref.ranges[0].end.chapter = 2
+    assert __.name(__.bcv("Rom")) == "Romans"
+    [(_, book)] = __.find_references("See Romans.", include_books=True)
+    book.ranges[0].start.chapter = 2
+    assert __.find_references("See Romans.", include_books=True)[0][1] == __.bcv("Rom")
+    assert __.find_references("Romans 3:4")[0][1] == __.bcv("Rom", 3, 4)
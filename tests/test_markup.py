@@ -0,0 +1,54 @@
+from context import *
+
+import pytest
+
+from refspy import refspy
+from refspy.markup import generate_text_spans, markup_skip_regexp
+
+__ = refspy()
+
+
+def spans(text, markup="html", skip_code=False):
+    regexp = markup_skip_regexp(markup, skip_code)
+    return [text[s:e] for s, e in generate_text_spans(text, regexp)]
+
+
+def test_html_spans():
+    html = '<p class="a>b">One <!-- two --><b>three</b><script>x<y</script></p>'
+    assert spans(html) == ["One ", "three"]
+    assert spans("<pre>Rom 1:1</pre>") == ["Rom 1:1"]
+    assert spans("<pre>Rom 1:1</pre>", skip_code=True) == []
+    assert spans("a < b") == ["a < b"]
+
+
+def test_markdown_spans():
+    md = "[Rom 3:4](https://x/Rom_1:1) and `Gen 1:1`\n```\nJohn 3:16\n```\nEnd"
+    assert spans(md, "markdown") == [
+        "[Rom 3:4]",
+        " and `Gen 1:1`\n```\nJohn 3:16\n```\nEnd",
+    ]
+    assert spans(md, "markdown", True) == ["[Rom 3:4]", " and ", "\n", "\nEnd"]
+
+
+def test_unknown_markup():
+    with pytest.raises(ValueError):
+        markup_skip_regexp("latex")
+
+
+def test_markup_matches_in_place():
+    html = '<p title="Rom 1:1">See <a href="#">Rom 3:4</a> and <i>v.6</i>.</p>'
+    matches = __.find_markup_matches(html)
+    assert [html[s:e] for s, e, _, _ in matches] == ["Rom 3:4", "v.6"]
+    assert matches[1][3] == __.r("Rom 3:6")
+
+
+def test_markup_matches_plain_text():
+    text = "Rom 1:1 and v.2 (cf. Gen 2:3, v.4); see 3:4."
+    assert __.find_markup_matches(text) == __.find_matches(text)
+    assert __.find_markup_matches(text, "markdown", True) == __.find_matches(text)
+
+
+def test_markup_skip_code():
+    html = "<p>Rom 1:1 <code>Gen 2:3</code></p>"
+    assert len(__.find_markup_matches(html)) == 2
+    assert len(__.find_markup_matches(html, skip_code=True)) == 1
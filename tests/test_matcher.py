@@ -1,3 +1,4 @@
+import pickle
 import re
 
 import pytest
@@ -8,8 +9,10 @@ from refspy.languages.english import ENGLISH
 from refspy.languages.french import FRENCH
 from refspy.matcher import (
     Matcher,
+    book_names_regexp,
     infer_abbreviation,
-    make_chapter_range,
+    make_chapter_range_numbers,
+    match_segment,
 )
 
 from refspy.models.range import range, verse_range
@@ -31,6 +34,14 @@ matcher_fr = Matcher(books, book_aliases, FRENCH)
 matcher_fr_intl = Matcher(books, book_aliases, FRENCH, INTERNATIONAL)
 
 
+def find_quadruples(text: str) -> list[tuple[str, str, str, str]]:
+    """The book match, book, book numbers, and other numbers of each match."""
+    return [
+        tuple(match[_] or "" for _ in ["book_match", "book", "book_numbers", "numbers"])
+        for match in matcher.reference_regexp.finditer(text)
+    ]
+
+
 def test_regexp_building_blocks():
     assert re.findall(matcher.COLON, ":") == [":"]
 
@@ -77,33 +88,43 @@ def test_number_list_generated_regexp():
     assert match == ["11", "11, 12", "1", "12, 13", "14", "15"]
 
 
-def test_range_or_number_regexp():
-    match = matcher.RANGE_OR_NUMBER_COMPILED.findall("1,2-3, 4,   5-6")
-    assert match == ["1", "2-3", "4", "5-6"]
-    match = matcher.RANGE_OR_NUMBER_COMPILED.findall("11,12-13, 14,   15-16")
-    assert match == ["11", "12-13", "14", "15-16"]
+def test_number_pairs():
+    pairs = matcher.match_number_pairs("1,2-3, 4,   5-6")
+    assert pairs == [("1", ""), ("2", "3"), ("4", ""), ("5", "6")]
+    pairs = matcher.match_number_pairs("11,12-13, 14,   15-16")
+    assert pairs == [("11", ""), ("12", "13"), ("14", ""), ("15", "16")]
 
 
 def test_chapter_range_regexp():
-    match = matcher.CHAPTER_RANGE_CAPTURE.search(" 1:2-3:4")
+    match = matcher.reference_regexp.search("Big Book 1:2-3:4")
     assert match is not None
-    assert match.group(1) == "1"
-    assert match.group(2) == "2"
-    assert match.group(3) == "3"
-    assert match.group(4) == "4"
+    assert match.group("book_c1", "book_v1", "book_c2", "book_v2") == (
+        "1",
+        "2",
+        "3",
+        "4",
+    )
 
 
 def test_chapter_verses_regexp():
-    match = matcher.CHAPTER_VERSES_CAPTURE.search(" 1:2,3-4")
+    match = matcher.reference_regexp.search("Big Book 1:2,3-4")
     assert match is not None
-    assert match.group(1) == "1"
-    assert match.group(2) == "2,3-4"
+    assert match.group("book_chapter", "book_verses") == ("1", "2,3-4")
 
 
 def test_name_regexp():
-    regexp = matcher.build_reference_regexp()
-    assert re.escape("Big") + "\\s+" + re.escape("Book") in regexp
-    assert re.escape("Small") + "\\s+" + re.escape("Book") in regexp
+    regexp = re.compile(matcher.build_book_name_regexp())
+    assert regexp.fullmatch("Big  Book")
+    assert regexp.fullmatch("Small\nBook")
+
+
+def test_book_names_regexp():
+    names = ["Rom", "Romans", "Ruth", "Song of Songs", "Song"]
+    regexp = book_names_regexp(names)
+    assert regexp == "(?:R(?:om(?:ans)?|uth)|Song(?:\\s+of\\s+Songs)?)"
+    assert re.match(regexp, "Romans").group(0) == "Romans"
+    assert re.match(regexp, "Song  of Songs").group(0) == "Song  of Songs"
+    assert re.match(regexp, "Song of Solomon").group(0) == "Song"
 
 
 def test_match_brackets():
@@ -117,62 +138,48 @@ def test_match_brackets():
 
 
 def test_match_names():
-    assert matcher.reference_regexp.findall("Big Book") == [
-        ("Big Book", "Big Book", "", "")
-    ]
-    assert matcher.reference_regexp.findall("Big") == [("Big", "Big", "", "")]
-    assert matcher.reference_regexp.findall("Small Book") == [
-        ("Small Book", "Small Book", "", "")
-    ]
-    assert matcher.reference_regexp.findall("Small") == [("Small", "Small", "", "")]
+    assert find_quadruples("Big Book") == [("Big Book", "Big Book", "", "")]
+    assert find_quadruples("Big") == [("Big", "Big", "", "")]
+    assert find_quadruples("Small Book") == [("Small Book", "Small Book", "", "")]
+    assert find_quadruples("Small") == [("Small", "Small", "", "")]
 
 
 def test_does_not_match_human_first_names():
-    assert matcher.reference_regexp.findall("Big Bob") == []
-    assert matcher.reference_regexp.findall("Big B.") == []
+    assert find_quadruples("Big Bob") == []
+    assert find_quadruples("Big B.") == []
 
 
 def test_match_names_and_numbers():
-    assert matcher.reference_regexp.findall("Big Book 1") == [
-        ("Big Book 1", "Big Book", " 1", "")
-    ]
-    assert matcher.reference_regexp.findall("Big Book 1-2") == [
-        ("Big Book 1-2", "Big Book", " 1-2", "")
-    ]
-    assert matcher.reference_regexp.findall("Big Book 1-2,4,6") == [
+    assert find_quadruples("Big Book 1") == [("Big Book 1", "Big Book", " 1", "")]
+    assert find_quadruples("Big Book 1-2") == [("Big Book 1-2", "Big Book", " 1-2", "")]
+    assert find_quadruples("Big Book 1-2,4,6") == [
         ("Big Book 1-2,4,6", "Big Book", " 1-2,4,6", "")
     ]
-    assert matcher.reference_regexp.findall("Big Book 1-2,4,6") == [
+    assert find_quadruples("Big Book 1-2,4,6") == [
         ("Big Book 1-2,4,6", "Big Book", " 1-2,4,6", "")
     ]
 
 
 def test_verse_lists_with_abbreviations():
-    assert matcher.reference_regexp.findall("Big 1:1") == [
-        ("Big 1:1", "Big", " 1:1", "")
-    ]
-    assert matcher.reference_regexp.findall("Big 1:1, 2") == [
-        ("Big 1:1, 2", "Big", " 1:1, 2", "")
-    ]
-    assert matcher.reference_regexp.findall("Bg 1:1, 2") == [
-        ("Bg 1:1, 2", "Bg", " 1:1, 2", "")
-    ]
+    assert find_quadruples("Big 1:1") == [("Big 1:1", "Big", " 1:1", "")]
+    assert find_quadruples("Big 1:1, 2") == [("Big 1:1, 2", "Big", " 1:1, 2", "")]
+    assert find_quadruples("Bg 1:1, 2") == [("Bg 1:1, 2", "Bg", " 1:1, 2", "")]
 
 
 def test_malformed_refs():
-    matches = matcher.match_number_ranges("1-2,4-3")
-    assert matches[0] == "1-2"
-    assert matches[1] == "4-3"
+    pairs = matcher.match_number_pairs("1-2,4-3")
+    assert pairs == [("1", "2"), ("4", "3")]
+    assert matcher.make_number_pairs(verse_range(1, 1, 1, 1), pairs) is None
 
 
 def test_comma_separation():
-    assert matcher.reference_regexp.findall("Big Book 1:55, 66, 77") == [
+    assert find_quadruples("Big Book 1:55, 66, 77") == [
         ("Big Book 1:55, 66, 77", "Big Book", " 1:55, 66, 77", "")
     ]
 
 
 def test_negative_lookaheads():
-    matches = matcher.reference_regexp.findall("Big Book 1:1, 2, 1 Book 4")
+    matches = find_quadruples("Big Book 1:1, 2, 1 Book 4")
     #                                                    ^^^^ Negative lookaheads
     assert len(matches) == 2
     assert matches[0] == ("Big Book 1:1, 2", "Big Book", " 1:1, 2", "")
@@ -181,17 +188,17 @@ def test_negative_lookaheads():
 
 def test_match_names_in_context():
     text = "Big Book 1:2-5 and 34:6,7 are more interesting than Small Book 3-6."
-    matches = matcher.reference_regexp.findall(text)
+    matches = find_quadruples(text)
     assert len(matches) == 3
     assert matches[0] == ("Big Book 1:2-5", "Big Book", " 1:2-5", "")
     assert matches[1] == ("", "", "", "34:6,7")
     assert matches[2] == ("Small Book 3-6", "Small Book", " 3-6", "")
 
 
-def test_match_number_ranges_numeric():
+def test_number_pairs_numeric():
     last_range = verse_range(1, 1, 1, 1)
-    matches = matcher.match_number_ranges("1,4-5,7–8, 9")
-    reference = matcher.make_number_ranges(last_range, matches)
+    pairs = matcher.match_number_pairs("1,4-5,7–8, 9")
+    reference = matcher.make_number_pairs(last_range, pairs)
     assert reference is not None
     assert reference.ranges[0] == range(verse(1, 1, 1, 1), verse(1, 1, 1, 1))
     assert reference.ranges[1] == range(verse(1, 1, 1, 4), verse(1, 1, 1, 5))
@@ -199,45 +206,42 @@ def test_match_number_ranges_numeric():
     assert reference.ranges[3] == range(verse(1, 1, 1, 9), verse(1, 1, 1, 9))
 
 
-def test_match_number_ranges_prefixed_v():
+def test_number_pairs_prefixed_v():
     last_range = verse_range(1, 1, 1, 1)
-    matches = matcher.match_number_ranges("v.1,4-5")
-    assert matches is not None
-    reference = matcher.make_number_ranges(last_range, matches)
+    pairs = matcher.match_number_pairs("v.1,4-5")
+    assert pairs
+    reference = matcher.make_number_pairs(last_range, pairs)
     assert reference is not None
     assert reference.ranges[0] == range(verse(1, 1, 1, 1), verse(1, 1, 1, 1))
     assert reference.ranges[1] == range(verse(1, 1, 1, 4), verse(1, 1, 1, 5))
 
 
-def test_match_number_ranges_prefixed_vv():
+def test_number_pairs_prefixed_vv():
     last_range = verse_range(1, 1, 1, 1)
-    matches = matcher.match_number_ranges("vv.1,4-5")
-    assert matches is not None
-    reference = matcher.make_number_ranges(last_range, matches)
+    pairs = matcher.match_number_pairs("vv.1,4-5")
+    assert pairs
+    reference = matcher.make_number_pairs(last_range, pairs)
     assert reference is not None
     assert reference.ranges[0] == range(verse(1, 1, 1, 1), verse(1, 1, 1, 1))
     assert reference.ranges[1] == range(verse(1, 1, 1, 4), verse(1, 1, 1, 5))
 
 
-def test_match_chapter_range():
+def test_make_chapter_range():
     last_range = verse_range(1, 1, 1, 1)
-    matches = matcher.match_chapter_range("1:4-2:3")
-    assert matches is not None
-    reference = make_chapter_range(last_range, matches)
-    assert reference is not None
-    assert reference.ranges == [range(verse(1, 1, 1, 4), verse(1, 1, 2, 3))]
-    matches = matcher.match_chapter_range("1:4–2:3")
-    assert matches is not None
-    reference = make_chapter_range(last_range, matches)
+    for text in ["Big Book 1:4-2:3", "Big Book 1:4–2:3"]:
+        match = matcher.reference_regexp.search(text)
+        assert match is not None
+        reference = matcher.make_structured_reference(last_range, match, "book")
+        assert reference is not None
+        assert reference.ranges == [range(verse(1, 1, 1, 4), verse(1, 1, 2, 3))]
+    reference = make_chapter_range_numbers(last_range, "1", "4", "2", "3")
     assert reference is not None
     assert reference.ranges == [range(verse(1, 1, 1, 4), verse(1, 1, 2, 3))]
 
 
-def test_match_chapter_verses():
+def test_make_chapter_list():
     last_range = verse_range(1, 1, 1, 1)
-    matches = matcher.match_chapter_verses("1:4,8-9")
-    assert matches is not None
-    reference = matcher.make_chapter_verses(last_range, matches)
+    reference = matcher.make_chapter_list(last_range, "1", "4,8-9")
     assert reference is not None
     assert reference.ranges == [
         range(verse(1, 1, 1, 4), verse(1, 1, 1, 4)),
@@ -245,11 +249,11 @@ def test_match_chapter_verses():
     ]
 
 
-def test_match_number_ranges_prefixed_vv_with_space():
+def test_number_pairs_prefixed_vv_with_space():
     last_range = verse_range(1, 1, 1, 1)
-    matches = matcher.match_number_ranges("vv. 1,4-5")
-    assert matches is not None
-    reference = matcher.make_number_ranges(last_range, matches)
+    pairs = matcher.match_number_pairs("vv. 1,4-5")
+    assert pairs
+    reference = matcher.make_number_pairs(last_range, pairs)
     assert reference is not None
     assert reference.ranges[0] == range(verse(1, 1, 1, 1), verse(1, 1, 1, 1))
     assert reference.ranges[1] == range(verse(1, 1, 1, 4), verse(1, 1, 1, 5))
@@ -445,3 +449,93 @@ def test_aliases_dont_match_the_start_of_words():
     __ = matcher.generate_references(text, yield_books=True, yield_nones=True)
     with pytest.raises(StopIteration):
         text, ref = next(__)
+
+
+def test_instrumentation():
+    instrumented = Matcher(books, book_aliases, ENGLISH)
+    text = "Big Book 1:2-3:4 (cf. Small Book 3, 4-5 (and v.7)) and Big Book 2:3,5; Big Book 0:1; Big Book."
+    expected = list(instrumented.generate_matches(text, yield_books=True))
+    stats = instrumented.instrument()
+    assert instrumented.instrument() is stats
+    assert list(instrumented.generate_matches(text, yield_books=True)) == expected
+    snapshot = stats.snapshot()
+    assert snapshot["calls"] == 1
+    assert snapshot["reference_matches"] == 6
+    assert snapshot["results"] == 5
+    assert snapshot["nones"] == 1
+    assert snapshot["value_errors"] == 1
+    assert snapshot["branches"] == {
+        "chapter_range": 1,
+        "chapter_verses": 2,
+        "number_ranges": 2,
+        "book_only": 1,
+    }
+    assert snapshot["max_bracket_depth"] == 3
+    assert snapshot["seconds"]["total"] >= snapshot["seconds"]["scan"] > 0
+    stats.reset()
+    assert stats.snapshot()["calls"] == 0
+    instrumented.uninstrument()
+    assert "stats" not in vars(instrumented)
+    assert list(instrumented.generate_matches(text, yield_books=True)) == expected
+
+
+def test_instrumentation_bracket_depth():
+    instrumented = Matcher(books, book_aliases, ENGLISH)
+    stats = instrumented.instrument()
+    text = "(see (this)) Big Book 1:2 (v.3)"
+    list(instrumented.generate_matches(text))
+    assert stats.snapshot()["bracket_matches"] == 6
+    assert stats.snapshot()["max_bracket_depth"] == 2
+    context, expected_context = [], []
+    text = "Big Book 1:2 (v.3"
+    list(instrumented.generate_matches(text, context=context))
+    list(matcher.generate_matches(text, context=expected_context))
+    assert context == expected_context and len(context) == 2
+    matches = list(instrumented.generate_matches("v.4) v.5", context=context))
+    expected = list(matcher.generate_matches("v.4) v.5", context=expected_context))
+    assert matches == expected
+    assert context == expected_context and len(context) == 1
+
+
+def test_structured_reference_groups():
+    match = matcher.reference_regexp.search("Big Book 1:2-3:4")
+    assert match.group("book_c1", "book_v1", "book_c2", "book_v2") == tuple("1234")
+    match = matcher.reference_regexp.search("see 3:4,6-9")
+    assert match.group("numbers_chapter", "numbers_verses") == ("3", "4,6-9")
+    match = matcher.reference_regexp.search("see vv.3-4")
+    assert match["numbers_list"] == "3-4"
+    assert matcher.match_number_pairs("1, 3-4a") == [("1", ""), ("3", "4a")]
+
+
+def test_paragraph_matches():
+    text = (
+        "Big Book 1:2 and v.3.\n\nThen v.4 (Small Book 2) and 5:6.\n\nBig\n\nBook 7:8"
+    )
+    matches = list(matcher.generate_paragraph_matches(text, yield_nones=True))
+    assert [(text[s:e], m) for s, e, m, _ in matches] == [
+        ("Big Book 1:2", "Big Book 1:2"),
+        ("v.3", "v.3"),
+        ("v.4", "v.4"),
+        ("Small Book 2", "Small Book 2"),
+        ("5:6", "5:6"),
+        ("7:8", "7:8"),  # <-- "Big" and "Book" are in separate paragraphs
+    ]
+    refs = [ref for *_, ref in matches]
+    assert refs[1] == verse_reference(1, 2, 1, 3)
+    assert refs[2] is None  # <-- no context from the previous paragraph
+    assert refs[3] == verse_reference(1, 3, 1, 2)
+    assert refs[4:] == [None, None]
+    # Whole-text context carries Big Book into the next paragraph.
+    assert list(matcher.generate_matches(text))[2][3] is not None
+    segments = [(0, text[:23]), (23, text[23:])]
+    assert [
+        match
+        for _ in segments
+        for match in match_segment(matcher, False, True, True, _)
+    ] == matches
+
+
+def test_matcher_is_picklable():
+    restored = pickle.loads(pickle.dumps(matcher))
+    text = "Big Book 1:2 and v.3"
+    assert list(restored.generate_matches(text)) == list(matcher.generate_matches(text))
@@ -0,0 +1,79 @@
+from context import *
+
+import pytest
+
+from refspy import refspy
+from refspy.multimatcher import MultiMatcher, merge_languages
+
+en = refspy("catholic", "en_US")
+fr = refspy("catholic", "fr_FR", "intl")
+multi = MultiMatcher({"en_US": en, "fr_FR": fr})
+
+
+def test_merge_languages():
+    language = merge_languages([en.language, fr.language])
+    assert language.verse_markers == ["v.", "vv."]
+    assert "Es" not in language.ambiguous_aliases
+    assert language.number_prefixes["1"][:2] == ["First Letter to the", "First"]
+    assert "1ere" in language.number_prefixes["1"]
+
+
+def test_monolingual_matches_are_unchanged():
+    text = "Rom 1:1 and v.2 (cf. Gen 2:3, v.4); see 3:4, and 1 John 5:6-7."
+    assert list(multi.generate_matches(text)) == list(en.matcher.generate_matches(text))
+    text = "Romains 1:1 et v.2 (cf. Genèse 2:3, v.4) ; voir 3:4, et 1 Jean 5:6-7."
+    assert list(multi.generate_matches(text)) == list(fr.matcher.generate_matches(text))
+
+
+def test_locale_matches():
+    text = "See Romains 3:4, Jn 2:1 and v.5; then Revelation 3:1, Jn 4:1 (Genèse)."
+    matches = list(multi.generate_locale_matches(text))
+    assert [(_[2], _[4]) for _ in matches] == [
+        ("Romains 3:4", "fr_FR"),
+        ("Jn 2:1", "fr_FR"),
+        ("v.5", "fr_FR"),
+        ("Revelation 3:1", "en_US"),
+        ("Jn 4:1", "en_US"),
+    ]
+    assert matches[0][3] == en.r("Rom 3:4")
+    books = list(multi.generate_locale_matches(text, yield_books=True))
+    assert (books[-1][2], books[-1][4]) == ("Genèse", "fr_FR")
+
+
+def test_conflicting_aliases():
+    first = list(multi.generate_matches("Es 1:1"))[0][3]
+    assert first == en.r("Esther 1:1")
+    reverse = MultiMatcher({"fr_FR": fr, "en_US": en})
+    assert list(reverse.generate_matches("Es 1:1"))[0][3] == fr.r("Isaïe 1:1")
+
+
+def test_shared_aliases_follow_the_locale():
+    text = "Romains 3:23 ; Es 53:5"
+    matches = list(multi.generate_locale_matches(text))
+    assert [(_[3], _[4]) for _ in matches] == [
+        (fr.r("Romains 3:23"), "fr_FR"),
+        (fr.r("Isaïe 53:5"), "fr_FR"),
+    ]
+    assert [_[3] for _ in matches] == [_[1] for _ in fr.find_references(text)]
+    assert [_[:4] for _ in matches] == list(multi.generate_matches(text))
+    text = "Romans 3:23; Es 5:1"
+    matches = list(multi.generate_locale_matches(text))
+    assert [(_[3], _[4]) for _ in matches] == [
+        (en.r("Romans 3:23"), "en_US"),
+        (en.r("Esther 5:1"), "en_US"),
+    ]
+
+
+def test_from_locales():
+    matcher = MultiMatcher.from_locales("protestant", ["fr_FR", "en_US"], "intl")
+    assert matcher.locales == ["fr_FR", "en_US"]
+    assert matcher.syntax.abbrev == "intl"
+    with pytest.raises(ValueError):
+        MultiMatcher({})
+
+
+def test_locale_matches_are_the_untagged_matches():
+    text = "Romains 1:1 (Gen 2:3, v.4) ; Rom 0:1, Jn 3 and Genèse, then v.5-6."
+    for options in [(False, False), (True, False), (True, True)]:
+        tagged = list(multi.generate_locale_matches(text, *options))
+        assert [_[:4] for _ in tagged] == list(multi.generate_matches(text, *options))
@@ -1,5 +1,7 @@
 from context import *
 
+import pytest
+
 from refspy.indexers import index_book_aliases, index_books
 from refspy.libraries.en_US import NT
 from refspy.navigator import Navigator
@@ -21,3 +23,32 @@ def test_next_chapter():
     assert __.next_chapter(ch(NT.id, 6, 7)) == ch(NT.id, 6, 8)  # Rom 7 -> Rom 8
     assert __.next_chapter(ch(NT.id, 6, 16)) == ch(NT.id, 7, 1)  # Rom 16 -> 1 Cor 1
     assert __.next_chapter(ch(NT.id, 27, 22)) is None  # Rev 22 -> None
+
+
+def test_chapter_ordinals():
+    ordinals = __.tables.ordinals
+    assert len(ordinals) == 260
+    assert ordinals.ordinal(NT.id, 1, 1) == 0
+    assert ordinals.ordinal(NT.id, 2, 1) == 28
+    assert ordinals.chapter(28) == (NT.id, 2, 1)
+    for bad in [(NT.id, 28, 1), (NT.id, 1, 29)]:
+        with pytest.raises(ValueError):
+            ordinals.ordinal(*bad)
+    with pytest.raises(ValueError):
+        ordinals.chapter(260)
+
+
+def test_move_chapters():
+    assert __.move_chapters(ch(NT.id, 6, 16), 1) == ch(NT.id, 7, 1)
+    assert __.move_chapters(ch(NT.id, 6, 1), -1) == ch(NT.id, 5, 28)
+    assert __.move_chapters(ch(NT.id, 1, 1), 259) == ch(NT.id, 27, 22)
+    assert __.move_chapters(ch(NT.id, 1, 1), 260) is None
+    assert __.move_chapters(ch(NT.id, 1, 1), -1) is None
+    assert __.chapter_distance(ch(NT.id, 5, 28), ch(NT.id, 7, 1)) == 17
+    assert __.chapter_distance(ch(NT.id, 7, 1), ch(NT.id, 5, 28)) == -17
+    assert __.chapter_window(ch(NT.id, 1, 2), 2) == [
+        ch(NT.id, 1, 1),
+        ch(NT.id, 1, 2),
+        ch(NT.id, 1, 3),
+        ch(NT.id, 1, 4),
+    ]
@@ -4,7 +4,10 @@ from pydantic import ValidationError
 import pytest
 
 from refspy.models.reference import (
+    Reference,
     chapter_reference,
+    fingerprint_references,
+    join_references,
     reference,
     unique_references,
     verse_reference,
@@ -88,3 +91,65 @@ def test_unique_references():
     ch3v67 = verse_reference(1, 2, 3, 6, 7)
     ch3v67b = verse_reference(1, 2, 3, 6, 7)
     assert [ch3v45, ch3v67b] == unique_references([ch3v45, ch3v67b, ch3v67, ch3v45b])
+
+
+def test_references_share_fields_set():
+    ref_1 = verse_reference(1, 2, 3, 4)
+    ref_2 = chapter_reference(1, 2, 5)
+    assert ref_1.__pydantic_fields_set__ is ref_2.__pydantic_fields_set__
+    assert ref_1.ranges[0].start.__pydantic_fields_set__ is (
+        ref_2.ranges[0].end.__pydantic_fields_set__
+    )
+    ref_1.ranges[0].end.verse = 6
+    assert ref_1.ranges[0].end.__pydantic_fields_set__ == {
+        "library",
+        "book",
+        "chapter",
+        "verse",
+    }
+    assert ref_1.model_dump(exclude_unset=True) == ref_1.model_dump()
+    assert ref_1.model_copy(deep=True) == ref_1
+    with pytest.raises(ValidationError):
+        verse(1, 2, 3, 0)
+
+
+def test_fingerprint_references():
+    rom_3_4 = verse_reference(400, 6, 3, 4)
+    cor_2 = chapter_reference(400, 7, 2)
+    refs = [rom_3_4, cor_2]
+    # Pinned: fingerprints must not change between versions or processes.
+    assert fingerprint_references(refs) == "0034c53420f44d44383405a87e449239"
+    assert fingerprint_references(refs) != fingerprint_references(refs[::-1])
+    assert fingerprint_references(refs) != fingerprint_references(refs + [cor_2])
+    assert fingerprint_references(refs) != fingerprint_references(
+        [join_references(refs)]
+    )
+    assert fingerprint_references(refs, normalize=True) == fingerprint_references(
+        [cor_2, rom_3_4, cor_2], normalize=True
+    )
+
+
+def test_fingerprint_references_with_nones():
+    rom_3_4 = verse_reference(400, 6, 3, 4)
+    fingerprint = fingerprint_references([rom_3_4, None])
+    assert fingerprint == fingerprint_references([rom_3_4, None])
+    assert fingerprint != fingerprint_references([rom_3_4])
+    assert fingerprint != fingerprint_references([None, rom_3_4])
+    assert fingerprint_references(
+        [None, rom_3_4, None], normalize=True
+    ) == fingerprint_references([rom_3_4, None], normalize=True)
+
+
+def test_to_bytes():
+    rom_3_4 = verse_reference(400, 6, 3, 4)
+    # Pinned: the encoding must not change between versions.
+    assert rom_3_4.to_bytes() == bytes.fromhex("01f8e4b9a3a41700")
+    ref = reference(
+        range(verse(400, 6, 3, 4), verse(400, 6, 3, 9)),
+        range(verse(200, 1, 1, 1), verse(200, 1, 50, 26)),
+    )
+    for _ in [rom_3_4, chapter_reference(400, 7, 2), ref]:
+        assert Reference.from_bytes(_.to_bytes()) == _
+    for data in [b"", b"\x00", b"\x01\x05", ref.to_bytes() + b"\x00"]:
+        with pytest.raises(ValueError):
+            Reference.from_bytes(data)
@@ -0,0 +1,127 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from context import *
+
+import refspy.server
+from refspy.server import Batcher, Server, run_batch, run_job
+
+
+def test_run_job_match():
+    status, payload = run_job("match", {"text": "See Rom 3:4 (not John Smith)."})
+    assert status == 200
+    assert payload["matches"] == [
+        {
+            "start": 4,
+            "end": 11,
+            "match": "Rom 3:4",
+            "ranges": [[400006003004, 400006003004]],
+            "name": "Rom 3:4",
+        }
+    ]
+
+
+def test_run_job_format():
+    body = {"references": ["Rom 3:4", "nothing"], "pattern": "{NAME}"}
+    assert run_job("format", body) == (200, {"formatted": ["Romans 3:4", None]})
+
+
+def test_run_job_summary_and_index():
+    body = {"text": "Rom 3:4; Rom 3:5; Gen 1:1", "locale": "en_US"}
+    assert run_job("summary", body) == (200, {"summary": "Gen 1:1; Rom 3:4–5"})
+    assert run_job("index", body) == (200, {"index": "Gen 1:1; Rom 3:4, 5"})
+
+
+def test_run_job_errors():
+    assert run_job("match", {})[0] == 400
+    assert run_job("match", {"text": 3})[0] == 400
+    assert run_job("match", {"text": "", "canon": "unknown"})[0] == 400
+    assert run_job("unknown", {"text": ""})[0] == 404
+
+
+def test_run_batch():
+    jobs = [("match", {"text": "Rom 1"}), ("match", {})]
+    assert [status for status, _ in run_batch(jobs)] == [200, 400]
+
+
+def fail_on_boom(action, body):
+    if body.get("text") == "boom":
+        raise RuntimeError("boom")
+    return run_job(action, body)
+
+
+def test_run_batch_failure(monkeypatch):
+    monkeypatch.setattr(refspy.server, "run_job", fail_on_boom)
+    jobs = [("match", {"text": "Rom 1"}), ("match", {"text": "boom"})]
+    results = run_batch(jobs)
+    assert [status for status, _ in results] == [200, 500]
+    assert results[1][1] == {"error": "RuntimeError: boom"}
+
+
+async def post(port, path, payload):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode()
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n".encode()
+        + body
+    )
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(content)
+
+
+async def send(port, request):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(request)
+    response = await reader.read()
+    writer.close()
+    return int(response.split()[1])
+
+
+def test_server_round_trip():
+    async def round_trip():
+        with ThreadPoolExecutor(2) as executor:
+            batcher = Batcher(executor, max_batch=4, max_delay=0.01)
+            server = await Server(batcher).start("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            results = await asyncio.gather(
+                *[post(port, "/match", {"text": f"Rom {n}:1"}) for n in [1, 2, 3]],
+                post(port, "/nowhere", {}),
+            )
+            server.close()
+            return results
+
+    results = asyncio.run(round_trip())
+    assert [status for status, _ in results] == [200, 200, 200, 404]
+    assert results[2][1]["matches"][0]["name"] == "Rom 3:1"
+
+
+def test_server_errors(monkeypatch):
+    monkeypatch.setattr(refspy.server, "run_job", fail_on_boom)
+
+    async def round_trip():
+        with ThreadPoolExecutor(2) as executor:
+            batcher = Batcher(executor, max_batch=4, max_delay=0.05)
+            server = await Server(batcher).start("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            results = await asyncio.gather(
+                post(port, "/match", {"text": "Rom 1:1"}),
+                post(port, "/match", {"text": "boom"}),
+                post(port, "/match", {"text": "Rom 2:1"}),
+                send(port, b"POST /match HTTP/1.1\r\n\r\n"),
+                send(port, b"POST /match HTTP/1.1\r\nContent-Length: x\r\n\r\n"),
+            )
+            server.close()
+            return results
+
+    results = asyncio.run(round_trip())
+    assert [_ if isinstance(_, int) else _[0] for _ in results] == [
+        200,
+        500,
+        200,
+        400,
+        400,
+    ]
@@ -0,0 +1,25 @@
+import pytest
+from context import *
+
+from refspy.indexers import index_books
+from refspy.models.reference import book_reference
+from refspy.tables import ReferenceTables
+from data import TEST_LIBRARY
+
+tables = ReferenceTables(index_books([TEST_LIBRARY]))
+
+
+def test_book_ranges_are_shared():
+    last = tables.book_range(1, 2)
+    assert last == book_reference(1, 2).last_range()
+    assert tables.book_range(1, 2) is last
+
+
+def test_unknown_book_ranges_are_not_stored():
+    assert tables.book_range(9, 9) == book_reference(9, 9).last_range()
+    assert tables.book_range(9, 9) is not tables.book_range(9, 9)
+
+
+def test_invalid_numbers_raise_value_errors():
+    with pytest.raises(ValueError):
+        tables.book_range(1, 0)
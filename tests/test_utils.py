@@ -9,8 +9,10 @@ from refspy.utils import (
     get_unnumbered_book_aliases,
     normalize_spacing,
     parse_number,
+    segment_paragraphs,
     sequential_replace,
     sequential_replace_tuples,
+    split_paragraphs,
     strip_book_number,
     strip_space_after_book_number,
     url_param,
@@ -132,3 +134,22 @@ def test_sequential_replace():
     tags = ["XXXXXXX", "YYYYYYYYY", "ZZZZZZZZZZZ"]
     result = sequential_replace(text, strs, tags)
     assert result == "XXXXXXX; YYYYYYYYY; ZZZZZZZZZZZ"
+
+
+def test_split_paragraphs():
+    assert split_paragraphs("") == [""]
+    assert split_paragraphs("a\n\nb\n \nc") == ["a\n\n", "b\n \n", "c"]
+    assert split_paragraphs("a\nb\n\n") == ["a\nb\n\n", ""]
+
+
+def test_segment_paragraphs():
+    text = "aaa\n\nbb\n\ncccc\n\nd"
+    assert segment_paragraphs(text, 1) == [
+        (0, "aaa\n\n"),
+        (5, "bb\n\n"),
+        (9, "cccc\n\n"),
+        (15, "d"),
+    ]
+    assert segment_paragraphs(text, 8) == [(0, "aaa\n\nbb\n\n"), (9, "cccc\n\nd")]
+    assert segment_paragraphs(text, 100) == [(0, text)]
+    assert segment_paragraphs("", 100) == [(0, "")]